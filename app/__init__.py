@@ -11,8 +11,9 @@ from flask_socketio import SocketIO
 from werkzeug.middleware.proxy_fix import ProxyFix
 from sqlalchemy import event
 from sqlalchemy.engine import Engine
+from app.utils.db_routing import RoutingSession
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 socketio = SocketIO()
 
 
@@ -56,6 +57,21 @@ def create_app(config_name='development'):
     db.init_app(app)
     login_manager.init_app(app)
 
+    # Apply the SQLite performance profile (WAL, mmap, busy timeout) to every connection
+    from app.utils.sqlite_tuning import init_sqlite_tuning
+    init_sqlite_tuning(app)
+
+    # Send GET-request reads to the read engine when READ_DATABASE_URL is set
+    from app.utils.db_routing import init_read_routing
+    init_read_routing(app)
+
+    # Size the in-process leaderboard cache and connect it to the other workers
+    from app.services.leaderboard_service import leaderboard_cache
+    from app.utils.invalidation import invalidation_bus
+    leaderboard_cache.configure(app.config['LEADERBOARD_CACHE_SIZE'])
+    leaderboard_cache.clear()
+    invalidation_bus.init_app(app)
+
     # Initialize session before CSRF (CSRF needs session)
     if config_name == 'production':
         session.init_app(app)
@@ -64,14 +80,16 @@ def create_app(config_name='development'):
     migrate.init_app(app, db)
     limiter.init_app(app)
 
-    # Initialize SocketIO
+    # Initialize SocketIO (with a message queue, room emits reach clients on every worker)
+    from app.websockets.message_queue import message_queue_options
     socketio.init_app(
         app,
         cors_allowed_origins="*",  # Will be restricted by Flask's CORS policy
         async_mode='threading',
         manage_session=False,  # Use Flask-Login sessions
         logger=False,
-        engineio_logger=False
+        engineio_logger=False,
+        **message_queue_options(app)
     )
     
     login_manager.login_view = 'auth.login'
@@ -155,10 +173,12 @@ def create_app(config_name='development'):
     from app.routes.main import main_bp
     from app.routes.auth import auth_bp
     from app.routes.admin import admin_bp
+    from app.routes.api import api_bp
 
     app.register_blueprint(main_bp)
     app.register_blueprint(auth_bp, url_prefix='/auth')
     app.register_blueprint(admin_bp, url_prefix='/admin')
+    app.register_blueprint(api_bp, url_prefix='/api')
     
     with app.app_context():
         # Import all models BEFORE creating tables
@@ -168,14 +188,37 @@ def create_app(config_name='development'):
         from app.models.game import Game
         from app.models.score import Score
         from app.models.penalty import Penalty
+        from app.models.team_standing import TeamStanding
+        from app.models.change_event import ChangeEvent
+        from app.models.game_night_revision import GameNightRevision
+        from app.models.leaderboard_change import LeaderboardChange
 
         # Now create tables
         db.create_all()
+
+        # Tables created by an older version don't get new constraints from create_all()
+        from app.utils.schema_upgrade import upgrade_schema
+        upgrade_schema()
+
         initialize_admins(app)
 
+        # Standings of scores recorded before the team_standing table existed
+        from app.services.standings_service import StandingsService
+        StandingsService.backfill()
+
     # Register WebSocket event handlers
-    from app.websockets import register_handlers
+    from app.websockets import (
+        register_handlers, init_lock_manager, leaderboard_broadcaster, score_buffer, timer_aggregator
+    )
+    init_lock_manager(app)
     register_handlers(socketio)
+    leaderboard_broadcaster.init_app(app, socketio)
+    score_buffer.init_app(app, socketio)
+    timer_aggregator.init_app(app, socketio)
+
+    # Register maintenance CLI commands
+    from app.cli import register_commands
+    register_commands(app)
 
     return app
 
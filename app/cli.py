@@ -0,0 +1,16 @@
+"""Flask CLI commands for maintenance tasks."""
+import click
+
+
+def register_commands(app):
+    """Register maintenance commands on the application."""
+
+    @app.cli.command('rebuild-standings')
+    @click.option('--game-night-id', type=int, default=None,
+                  help='Only rebuild standings for this game night.')
+    def rebuild_standings(game_night_id):
+        """Recompute the team_standing table from recorded scores."""
+        from app.services.standings_service import StandingsService
+
+        count = StandingsService.rebuild(game_night_id)
+        click.echo(f'Rebuilt {count} team standing row(s).')
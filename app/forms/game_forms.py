@@ -47,6 +47,16 @@ class GameForm(FlaskForm):
         default='lower_better'
     )
     public_input = BooleanField('Allow Public Score Input', default=False)
+    timer_estimator = SelectField(
+        'Multi-Timer Consensus',
+        choices=[
+            ('trimmed_mean', 'Trimmed Mean (drop fastest/slowest)'),
+            ('median', 'Median'),
+            ('mad_mean', 'Mean without Outliers (MAD)'),
+            ('mean', 'Plain Mean')
+        ],
+        default='trimmed_mean'
+    )
     submit = SubmitField('Save Game')
 
 
@@ -4,17 +4,35 @@ from wtforms import (
     BooleanField, SubmitField, HiddenField,
     FloatField
 )
-from wtforms.validators import DataRequired, Optional
+from wtforms.validators import DataRequired, NumberRange, Optional
 
 
 class TournamentSetupForm(FlaskForm):
     game_id = HiddenField('Game ID', validators=[DataRequired()])
 
+    tournament_format = SelectField(
+        'Format',
+        choices=[
+            ('single_elimination', 'Single Elimination'),
+            ('double_elimination', 'Double Elimination'),
+            ('round_robin', 'Round Robin'),
+            ('swiss', 'Swiss')
+        ],
+        validators=[DataRequired()],
+        default='single_elimination'
+    )
+
+    round_count = IntegerField(
+        'Swiss Rounds',
+        validators=[Optional(), NumberRange(min=1)]
+    )
+
     pairing_type = SelectField(
         'Team Pairing',
         choices=[
             ('random', 'Random Pairing'),
-            ('manual', 'Manual Pairing')
+            ('manual', 'Manual Pairing'),
+            ('seeded', 'Seeded by Past Performance')
         ],
         validators=[DataRequired()],
         default='random'
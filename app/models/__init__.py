@@ -10,5 +10,10 @@ from app.models.match import Match
 from app.models.game_night import GameNight
 from app.models.active_edit import ActiveEdit
 from app.models.timer_record import TimerRecord
+from app.models.team_standing import TeamStanding
+from app.models.change_event import ChangeEvent
+from app.models.game_night_revision import GameNightRevision
+from app.models.leaderboard_change import LeaderboardChange
+from app.models.socket_message import SocketMessage
 
-__all__ = ['Admin', 'Team', 'Participant', 'Game', 'Score', 'Penalty', 'Tournament', 'Match', 'GameNight', 'ActiveEdit', 'TimerRecord']
+__all__ = ['Admin', 'Team', 'Participant', 'Game', 'Score', 'Penalty', 'Tournament', 'Match', 'GameNight', 'ActiveEdit', 'TimerRecord', 'TeamStanding', 'ChangeEvent', 'GameNightRevision', 'LeaderboardChange', 'SocketMessage']
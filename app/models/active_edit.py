@@ -14,13 +14,15 @@ class ActiveEdit(db.Model):
     user_display_name = db.Column(db.String(100), nullable=True)
     locked_at = db.Column(db.DateTime, default=datetime.utcnow)
 
-    # Relationships
-    game = db.relationship('Game', backref='active_edits')
-    team = db.relationship('Team', backref='active_edits')
+    # Relationships (locks go away with their game or team)
+    game = db.relationship('Game', backref=db.backref('active_edits', cascade='all, delete-orphan'))
+    team = db.relationship('Team', backref=db.backref('active_edits', cascade='all, delete-orphan'))
 
     # Unique constraint: one lock per field per team per game
+    # (also serves per-game lookups); user index serves release on disconnect
     __table_args__ = (
         db.UniqueConstraint('game_id', 'team_id', 'field_name', name='uq_game_team_field_lock'),
+        db.Index('ix_active_edit_user', 'user_id'),
     )
 
     def __repr__(self):
@@ -0,0 +1,16 @@
+from datetime import datetime
+from app import db
+
+
+class ChangeEvent(db.Model):
+    """Append-only change sequence used to broadcast cache invalidations between workers."""
+    __tablename__ = 'change_event'
+
+    id = db.Column(db.Integer, primary_key=True)  # Monotonic sequence number
+    origin = db.Column(db.String(64), nullable=False)  # Publishing worker, so it can skip its own events
+    topic = db.Column(db.String(50), nullable=False)
+    key = db.Column(db.String(100), nullable=True)  # JSON-encoded key
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+
+    def __repr__(self):
+        return f'<ChangeEvent {self.id} {self.topic}:{self.key}>'
@@ -16,6 +16,7 @@ class Game(db.Model):
     metric_type = db.Column(db.String(20), default='score')
     scoring_direction = db.Column(db.String(20), default='lower_better')
     public_input = db.Column(db.Boolean, default=False)
+    timer_estimator = db.Column(db.String(20), default='trimmed_mean')  # Multi-user timer consensus
     game_night_id = db.Column(db.Integer, db.ForeignKey('game_night.id'), nullable=True, index=True)
 
     scores = db.relationship('Score', back_populates='game', lazy='dynamic', cascade='all, delete-orphan')
@@ -1,5 +1,4 @@
 from datetime import datetime
-from sqlalchemy.orm import joinedload
 from app import db
 
 
@@ -33,35 +32,15 @@ class GameNight(db.Model):
         """
         Get sorted leaderboard for this game night.
 
-        Optimized to avoid N+1 queries by eager loading teams with their scores and games.
+        Points are summed with a GROUP BY in the database, so this is a single query.
         """
-        from app.models.team import Team
-        from app.models.score import Score
-
-        # Eager load teams with their scores and the games for those scores
-        # This prevents N+1 queries by loading everything in one query
-        teams = db.session.query(Team).options(
-            joinedload(Team.scores).joinedload(Score.game)
-        ).filter(Team.game_night_id == self.id).all()
-
-        # Calculate points in Python after loading all data
-        team_points = []
-        for team in teams:
-            total_points = sum(
-                score.points for score in team.scores
-                if score.game and score.game.game_night_id == self.id
-            )
-            team_points.append((team, total_points))
-
-        # Sort by points descending
-        team_points.sort(key=lambda x: x[1], reverse=True)
-
-        # Return just the teams in sorted order
-        return [team for team, points in team_points]
+        from app.services.leaderboard_service import LeaderboardService
+        return LeaderboardService.get_ranked_teams(self.id)
 
     def get_winner(self):
         """Get the winning team (team with highest points) for this game night."""
-        leaderboard = self.get_leaderboard()
+        from app.services.leaderboard_service import LeaderboardService
+        leaderboard = LeaderboardService.get_ranked_teams(self.id, limit=1)
         return leaderboard[0] if leaderboard else None
 
     def finalize(self):
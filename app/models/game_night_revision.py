@@ -0,0 +1,18 @@
+from app import db
+
+
+class GameNightRevision(db.Model):
+    """Monotonic version counter for everything displayed about a game night.
+
+    Bumped by RevisionService whenever scores, games, teams or penalties of
+    the game night are flushed; pages use it as a cheap ETag. Rows are kept
+    when a game night is deleted so revisions never go backwards, and
+    game_night_id 0 tracks changes across all game nights.
+    """
+    __tablename__ = 'game_night_revision'
+
+    game_night_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    revision = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f'<GameNightRevision game_night_id={self.game_night_id} revision={self.revision}>'
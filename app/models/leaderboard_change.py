@@ -0,0 +1,25 @@
+from app import db
+
+
+class LeaderboardChange(db.Model):
+    """Teams, games and scores changed at each game night revision.
+
+    Written by RevisionService alongside the revision bump so leaderboard
+    clients can fetch only what changed since the revision they last saw.
+    No foreign keys: entries must outlive deleted teams and games so
+    clients learn about the removal.
+    """
+    __tablename__ = 'leaderboard_change'
+    __table_args__ = (
+        db.Index('ix_leaderboard_change_revision', 'game_night_id', 'revision'),  # Range scan for ?since=
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    game_night_id = db.Column(db.Integer, nullable=False)
+    revision = db.Column(db.Integer, nullable=False)
+    team_id = db.Column(db.Integer, nullable=True)  # Set for team and score changes
+    game_id = db.Column(db.Integer, nullable=True)  # Set for game and score changes
+
+    def __repr__(self):
+        return (f'<LeaderboardChange game_night_id={self.game_night_id} revision={self.revision} '
+                f'team_id={self.team_id} game_id={self.game_id}>')
@@ -11,6 +11,7 @@ class Match(db.Model):
     tournament_id = db.Column(db.Integer, db.ForeignKey('tournament.id'), nullable=False)
 
     # Match positioning in bracket
+    bracket = db.Column(db.String(20), default='main')  # 'main', or 'losers'/'grand_final' in double elimination
     round_number = db.Column(db.Integer, nullable=False)  # 1 = first round, 2 = semi, 3 = final, etc.
     position_in_round = db.Column(db.Integer, nullable=False)  # Position within that round
 
@@ -25,12 +26,16 @@ class Match(db.Model):
 
     # Match state
     status = db.Column(db.String(20), default='pending')  # 'pending', 'in_progress', 'completed'
-    is_bye = db.Column(db.Boolean, default=False)  # True if one team advances automatically
+    is_bye = db.Column(db.Boolean, default=False)  # True if one team advances automatically (whenever it arrives)
 
     # Bracket structure - where does winner go?
     next_match_id = db.Column(db.Integer, db.ForeignKey('match.id'), nullable=True)
     next_match_position = db.Column(db.String(10), nullable=True)  # 'team1' or 'team2'
 
+    # Double elimination - where does the loser go?
+    loser_next_match_id = db.Column(db.Integer, db.ForeignKey('match.id'), nullable=True)
+    loser_next_match_position = db.Column(db.String(10), nullable=True)  # 'team1' or 'team2'
+
     # Special flags
     is_play_in = db.Column(db.Boolean, default=False)  # True if this is a play-in match for odd teams
 
@@ -41,6 +46,8 @@ class Match(db.Model):
     winner_team = db.relationship('Team', foreign_keys=[winner_team_id])
     next_match = db.relationship('Match', remote_side=[id], foreign_keys=[next_match_id],
                                 backref='previous_matches', uselist=False)
+    loser_next_match = db.relationship('Match', remote_side=[id], foreign_keys=[loser_next_match_id],
+                                      uselist=False)
 
     def __repr__(self):
         return f'<Match {self.id}: Round {self.round_number}, Pos {self.position_in_round}>'
@@ -66,7 +73,7 @@ class Match(db.Model):
         return self.team1_id is not None and self.team2_id is not None
 
     def set_winner(self, winner_team_id):
-        """Set the winner and advance them to the next match."""
+        """Set the winner and advance them (and in double elimination the loser) to the next match."""
         if winner_team_id not in [self.team1_id, self.team2_id]:
             raise ValueError("Winner must be one of the competing teams")
 
@@ -75,7 +82,23 @@ class Match(db.Model):
 
         # Advance winner to next match if exists
         if self.next_match_id and self.next_match_position:
-            if self.next_match_position == 'team1':
-                self.next_match.team1_id = winner_team_id
-            else:
-                self.next_match.team2_id = winner_team_id
+            self.next_match.receive_team(winner_team_id, self.next_match_position)
+
+        # Drop loser into the losers bracket if exists
+        loser_team_id = self.team2_id if winner_team_id == self.team1_id else self.team1_id
+        if self.loser_next_match_id and self.loser_next_match_position and loser_team_id:
+            self.loser_next_match.receive_team(loser_team_id, self.loser_next_match_position)
+
+    def receive_team(self, team_id, position):
+        """Place a team arriving from an earlier match in 'team1' or 'team2'.
+
+        A bye match fed by an earlier match (a losers bracket slot no team
+        can reach) passes the team straight on.
+        """
+        if position == 'team1':
+            self.team1_id = team_id
+        else:
+            self.team2_id = team_id
+
+        if self.is_bye:
+            self.set_winner(team_id)
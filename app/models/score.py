@@ -4,11 +4,13 @@ from app import db
 class Score(db.Model):
     __tablename__ = 'score'
     __table_args__ = (
-        db.Index('ix_score_game_team', 'game_id', 'team_id'),  # Composite index for game+team lookups
+        # One score per team per game; also the index for game+team lookups and the upsert conflict target
+        db.UniqueConstraint('game_id', 'team_id', name='uq_score_game_team'),
     )
 
     id = db.Column(db.Integer, primary_key=True)
-    points = db.Column(db.Integer, default=0)
+    # active_history keeps the previous value on assignment so standings can apply exact deltas
+    points = db.column_property(db.Column(db.Integer, default=0), active_history=True)
     score_value = db.Column(db.Float, nullable=True)
     notes = db.Column(db.Text, nullable=True)
     team_id = db.Column(db.Integer, db.ForeignKey('team.id'), nullable=False)
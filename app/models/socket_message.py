@@ -0,0 +1,15 @@
+from datetime import datetime
+from app import db
+
+
+class SocketMessage(db.Model):
+    """Socket.IO messages relayed between workers by the database message queue."""
+    __tablename__ = 'socket_message'
+
+    id = db.Column(db.Integer, primary_key=True)  # Monotonic sequence number
+    channel = db.Column(db.String(50), nullable=False)
+    payload = db.Column(db.Text, nullable=False)  # JSON-encoded pub/sub message
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+
+    def __repr__(self):
+        return f'<SocketMessage {self.id} {self.channel}>'
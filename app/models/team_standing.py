@@ -0,0 +1,21 @@
+from app import db
+
+
+class TeamStanding(db.Model):
+    """Materialized running point total for a team within a game night.
+
+    Maintained incrementally by StandingsService whenever Score rows are
+    flushed, so leaderboard reads never have to re-aggregate the score table.
+    """
+    __tablename__ = 'team_standing'
+    __table_args__ = (
+        db.Index('ix_team_standing_points', 'game_night_id', 'points'),  # Ranked range scan per game night
+    )
+
+    game_night_id = db.Column(db.Integer, db.ForeignKey('game_night.id'), primary_key=True)
+    team_id = db.Column(db.Integer, db.ForeignKey('team.id'), primary_key=True)
+    points = db.Column(db.Integer, nullable=False, default=0)
+    games_played = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f'<TeamStanding game_night_id={self.game_night_id} team_id={self.team_id} points={self.points}>'
@@ -8,6 +8,8 @@ class Tournament(db.Model):
     game_id = db.Column(db.Integer, db.ForeignKey('game.id'), nullable=False, unique=True)
 
     # Tournament settings
+    format = db.Column(db.String(20), default='single_elimination')  # 'single_elimination', 'double_elimination', 'round_robin', 'swiss'
+    round_count = db.Column(db.Integer, nullable=True)  # Rounds to play (Swiss)
     pairing_type = db.Column(db.String(20), default='random')  # 'random' or 'manual'
     public_edit = db.Column(db.Boolean, default=False)
     bracket_style = db.Column(db.String(20), default='standard')  # 'standard', 'play_in', 'auto_bye'
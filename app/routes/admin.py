@@ -188,7 +188,8 @@ def add_game():
             'point_scheme': form.point_scheme.data,
             'metric_type': form.metric_type.data,
             'scoring_direction': form.scoring_direction.data,
-            'public_input': form.public_input.data
+            'public_input': form.public_input.data,
+            'timer_estimator': form.timer_estimator.data
         }
 
         # Collect penalties from form
@@ -257,7 +258,8 @@ def edit_game(game_id):
             'point_scheme': form.point_scheme.data,
             'metric_type': form.metric_type.data,
             'scoring_direction': form.scoring_direction.data,
-            'public_input': form.public_input.data
+            'public_input': form.public_input.data,
+            'timer_estimator': form.timer_estimator.data
         }
 
         # Collect penalties from form
@@ -486,7 +488,9 @@ def create_tournament_direct():
                     pairing_type=form.pairing_type.data,
                     bracket_style=form.bracket_style.data,
                     public_edit=form.public_edit.data,
-                    included_team_ids=included_team_ids
+                    included_team_ids=included_team_ids,
+                    tournament_format=form.tournament_format.data,
+                    round_count=form.round_count.data
                 )
                 flash(f'Tournament "{game_name}" created successfully!', 'success')
                 return redirect(url_for('admin.view_tournament', game_id=game.id))
@@ -546,7 +550,9 @@ def setup_tournament(game_id):
                 bracket_style=form.bracket_style.data,
                 public_edit=form.public_edit.data,
                 manual_pairings=manual_pairings,
-                included_team_ids=included_team_ids
+                included_team_ids=included_team_ids,
+                tournament_format=form.tournament_format.data,
+                round_count=form.round_count.data
             )
             flash('Tournament bracket created successfully!', 'success')
             return redirect(url_for('admin.view_tournament', game_id=game_id))
@@ -585,7 +591,9 @@ def view_tournament(game_id):
                          game=game,
                          tournament=tournament,
                          bracket=bracket_data['bracket'],
-                         rounds=bracket_data['rounds'])
+                         rounds=bracket_data['rounds'],
+                         sections=bracket_data['sections'],
+                         standings=bracket_data['standings'])
 
 
 @admin_bp.route('/tournament/match/<int:match_id>/score', methods=['POST'])
@@ -0,0 +1,44 @@
+"""JSON API routes for scoreboard displays and other lightweight clients."""
+from flask import Blueprint, request, jsonify
+from flask_login import login_required
+
+from app import db, limiter
+from app.models import GameNight
+from app.services import LeaderboardService
+from app.exceptions import NotFoundError
+
+api_bp = Blueprint('api', __name__)
+
+
+@api_bp.route('/game-nights/<int:game_night_id>/leaderboard')
+@limiter.limit("120 per minute")  # Wall displays poll every second or two
+def game_night_leaderboard(game_night_id):
+    """
+    Leaderboard standings, games and scores for a game night.
+
+    Query parameters:
+        since: Revision the client already has. Returns only what changed
+               after it, or the full leaderboard ("full": true) if that
+               revision is too old.
+    """
+    if db.session.get(GameNight, game_night_id) is None:
+        return jsonify(NotFoundError('Game night', game_night_id).to_dict()), 404
+
+    since = request.args.get('since', type=int)
+    feed = LeaderboardService.get_feed(game_night_id, since)
+
+    response = jsonify(feed)
+    response.cache_control.no_cache = True
+    return response
+
+
+@api_bp.route('/realtime/metrics')
+@login_required
+def realtime_metrics():
+    """Depth and throughput of the realtime write queues, for monitoring."""
+    from app.websockets import timer_aggregator, score_buffer
+
+    return jsonify({
+        'timer_records': timer_aggregator.queue.metrics(),
+        'score_buffer': {'depth': len(score_buffer)}
+    })
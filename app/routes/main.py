@@ -7,11 +7,14 @@ from datetime import datetime
 from collections import defaultdict
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.services import TeamService, GameService, ScoreService, TournamentService, GameNightService
+from app.services import (
+    TeamService, GameService, ScoreService, TournamentService, GameNightService, LeaderboardService
+)
 from app.models import Score, Tournament
 from app.forms.feedback_forms import FeedbackForm
 from app.exceptions import ValidationError, DatabaseError, NotFoundError
 from app.utils.logger import get_logger
+from app.utils.route_helpers import page_etag, not_modified_response, etag_response
 
 main_bp = Blueprint('main', __name__)
 logger = get_logger(__name__)
@@ -39,8 +42,17 @@ def index():
 
     # Filter teams and games by appropriate game night
     game_night_id = display_game_night.id if display_game_night else None
-    teams = TeamService.get_all_teams(sort_by_points=True, game_night_id=game_night_id)
-    games = GameService.get_all_games(ordered=True, game_night_id=game_night_id)
+
+    # Answer unchanged-page revalidations before loading anything else
+    etag = page_etag(game_night_id, getattr(active_game_night, 'id', None),
+                     getattr(working_context, 'id', None))
+    cached = not_modified_response(etag)
+    if cached:
+        return cached
+
+    # Teams, totals and the score grid come from the cached leaderboard snapshot
+    leaderboard = LeaderboardService.get_snapshot(game_night_id)
+    games = leaderboard.games
 
     # Separate completed and upcoming games
     completed_games = [g for g in games if g.isCompleted]
@@ -62,22 +74,19 @@ def index():
         workflow_progress['games_added'] = game_count >= 1
         workflow_progress['ready_to_activate'] = team_count >= 2 and game_count >= 1
 
-    def getScore(team_id, game_id):
-        """Helper function for templates to get score."""
-        return ScoreService.get_score(team_id, game_id)
-
-    return render_template(
+    return etag_response(render_template(
         'public/index.html',
-        teams=teams,
+        teams=leaderboard.teams,
+        standings=leaderboard.standings,
         games=games,
         completed_games=completed_games,
         upcoming_games=upcoming_games,
-        getScore=getScore,
+        score_matrix=leaderboard.scores,
         active_game_night=active_game_night,
         working_context=working_context,
         display_game_night=display_game_night,
         workflow_progress=workflow_progress
-    )
+    ), etag)
 
 
 @main_bp.route('/teams')
@@ -99,9 +108,15 @@ def teams():
 
     game_night_id = display_game_night.id if display_game_night else None
 
-    teams = TeamService.get_all_teams(sort_by_points=True, game_night_id=game_night_id)
-    return render_template('public/teams.html', teams=teams, active_game_night=active_game_night,
-                         working_context=working_context, display_game_night=display_game_night)
+    etag = page_etag(game_night_id, getattr(active_game_night, 'id', None))
+    cached = not_modified_response(etag)
+    if cached:
+        return cached
+
+    teams, standings = LeaderboardService.get_ranked_teams_with_standings(game_night_id)
+    return etag_response(render_template('public/teams.html', teams=teams, standings=standings,
+                         active_game_night=active_game_night,
+                         working_context=working_context, display_game_night=display_game_night), etag)
 
 
 @main_bp.route('/games')
@@ -123,10 +138,15 @@ def games():
 
     game_night_id = display_game_night.id if display_game_night else None
 
+    etag = page_etag(game_night_id, getattr(active_game_night, 'id', None))
+    cached = not_modified_response(etag)
+    if cached:
+        return cached
+
     games = GameService.get_all_games(ordered=True, game_night_id=game_night_id)
     teams = TeamService.get_all_teams(sort_by_points=False, game_night_id=game_night_id)
 
-    return render_template(
+    return etag_response(render_template(
         'public/games.html',
         games=games,
         teams=teams,
@@ -134,7 +154,7 @@ def games():
         active_game_night=active_game_night,
         working_context=working_context,
         display_game_night=display_game_night
-    )
+    ), etag)
 
 
 @main_bp.route('/games/scores/<int:game_id>')
@@ -252,8 +272,10 @@ def playground():
 
     game_night_id = display_game_night.id if display_game_night else None
 
-    teams = TeamService.get_all_teams(sort_by_points=True, game_night_id=game_night_id)
-    games = GameService.get_all_games(ordered=True, game_night_id=game_night_id)
+    leaderboard = LeaderboardService.get_snapshot(game_night_id)
+    teams = leaderboard.teams
+    standings = leaderboard.standings
+    games = leaderboard.games
 
     # Separate completed and upcoming games
     completed_games = [g for g in games if g.isCompleted]
@@ -264,7 +286,7 @@ def playground():
         'id': team.id,
         'name': team.name,
         'color': team.color,
-        'totalPoints': team.get_points_for_game_night(game_night_id) if game_night_id else (team.totalPoints or 0)
+        'totalPoints': standings[team.id].points
     } for team in teams]
 
     upcoming_games_json = [{
@@ -275,19 +297,16 @@ def playground():
         'point_scheme': game.point_scheme
     } for game in upcoming_games]
 
-    def getScore(team_id, game_id):
-        """Helper function for templates to get score."""
-        return ScoreService.get_score(team_id, game_id)
-
     return render_template(
         'public/playground.html',
         teams=teams,
+        standings=standings,
         teams_json=teams_json,
         games=games,
         completed_games=completed_games,
         upcoming_games=upcoming_games,
         upcoming_games_json=upcoming_games_json,
-        getScore=getScore,
+        score_matrix=leaderboard.scores,
         active_game_night=active_game_night,
         working_context=working_context,
         display_game_night=display_game_night
@@ -313,6 +332,8 @@ def view_tournament_public(game_id):
                          tournament=tournament,
                          bracket=bracket_data['bracket'],
                          rounds=bracket_data['rounds'],
+                         sections=bracket_data['sections'],
+                         standings=bracket_data['standings'],
                          active_game_night=active_game_night)
 
 
@@ -353,11 +374,13 @@ def score_match_public(match_id):
 def history():
     """View all completed game night history."""
     game_nights = GameNightService.get_completed_game_nights()
+    winners = LeaderboardService.get_winners(gn.id for gn in game_nights)
     active_game_night = GameNightService.get_active_game_night()
 
     return render_template(
         'public/history.html',
         game_nights=game_nights,
+        winners=winners,
         active_game_night=active_game_night
     )
 
@@ -365,24 +388,31 @@ def history():
 @main_bp.route('/history/<int:game_night_id>')
 def history_detail(game_night_id):
     """View detailed information about a specific game night."""
-    details = GameNightService.get_game_night_details(game_night_id)
+    game_night = GameNightService.get_game_night_by_id(game_night_id)
     active_game_night = GameNightService.get_active_game_night()
 
-    def getScore(team_id, game_id):
-        """Helper function for templates to get score."""
-        return ScoreService.get_score(team_id, game_id)
+    etag = page_etag(game_night_id, getattr(active_game_night, 'id', None))
+    cached = not_modified_response(etag)
+    if cached:
+        return cached
 
-    return render_template(
+    # Archived game nights rarely change, so the cached snapshot almost always hits
+    leaderboard = LeaderboardService.get_snapshot(game_night_id)
+    games = leaderboard.games
+    teams = leaderboard.teams
+
+    return etag_response(render_template(
         'public/history_detail.html',
-        game_night=details['game_night'],
-        teams=details['teams'],
-        games=details['games'],
-        completed_games=details['completed_games'],
-        upcoming_games=details['upcoming_games'],
-        winner=details['winner'],
-        getScore=getScore,
+        game_night=game_night,
+        teams=teams,
+        standings=leaderboard.standings,
+        games=games,
+        completed_games=[g for g in games if g.isCompleted],
+        upcoming_games=[g for g in games if not g.isCompleted],
+        winner=teams[0] if teams else None,
+        score_matrix=leaderboard.scores,
         active_game_night=active_game_night
-    )
+    ), etag)
 
 
 @main_bp.route('/feedback', methods=['GET'])
@@ -5,6 +5,9 @@ from app.services.score_service import ScoreService
 from app.services.auth_service import AuthService
 from app.services.tournament_service import TournamentService
 from app.services.game_night_service import GameNightService
+from app.services.leaderboard_service import LeaderboardService
+from app.services.standings_service import StandingsService
+from app.services.revision_service import RevisionService
 
 __all__ = [
     'TeamService',
@@ -12,5 +15,8 @@ __all__ = [
     'ScoreService',
     'AuthService',
     'TournamentService',
-    'GameNightService'
+    'GameNightService',
+    'LeaderboardService',
+    'StandingsService',
+    'RevisionService'
 ]
\ No newline at end of file
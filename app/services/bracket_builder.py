@@ -0,0 +1,125 @@
+from typing import Dict
+from sqlalchemy import case, select, update
+from app import db
+from app.models import Match
+
+
+class BracketBuilder:
+    """
+    Builds a tournament's matches in memory and writes them in a constant number of statements.
+
+    While building, matches are identified by (bracket, round_number,
+    position_in_round) and winner/loser links point at those keys, so no
+    match needs an ID before the whole tree exists. write() inserts every
+    match in one bulk INSERT, reads the new IDs back with one SELECT and sets
+    all next_match_id (and loser_next_match_id) links with one UPDATE each,
+    whatever the bracket size.
+    """
+
+    def __init__(self):
+        self.matches = {}  # {(bracket, round_number, position_in_round): Match column values}
+        self.links = {}  # {key: next match key}
+        self.loser_links = {}  # {key: key of the match the loser drops to}
+
+    def add_match(self, round_number: int, position: int, bracket: str = 'main', **columns) -> dict:
+        """
+        Add a match.
+
+        Args:
+            round_number: Round within the bracket (1 = first round)
+            position: Position within the round
+            bracket: 'main', or 'losers'/'grand_final' in double elimination
+            **columns: Other Match column values (team1_id, is_play_in, ...)
+
+        Returns:
+            The match's column values (mutable until write())
+        """
+        match = {
+            'bracket': bracket,
+            'round_number': round_number,
+            'position_in_round': position,
+            'team1_id': None,
+            'team2_id': None,
+            'winner_team_id': None,
+            'status': 'pending',
+            'is_bye': False,
+            'is_play_in': False,
+            'next_match_position': None,
+            'loser_next_match_position': None
+        }
+        match.update(columns)
+        self.matches[(bracket, round_number, position)] = match
+        return match
+
+    def link(self, key, next_key, slot: str):
+        """
+        Send the winner of one match to a slot of another.
+
+        Args:
+            key: (bracket, round_number, position) of the feeding match
+            next_key: Key of the match the winner moves to
+            slot: 'team1' or 'team2'
+        """
+        self.links[key] = next_key
+        self.matches[key]['next_match_position'] = slot
+
+    def link_loser(self, key, next_key, slot: str):
+        """
+        Send the loser of one match to a slot of another (double elimination).
+
+        Args:
+            key: Key of the feeding match
+            next_key: Key of the match the loser drops to
+            slot: 'team1' or 'team2'
+        """
+        self.loser_links[key] = next_key
+        self.matches[key]['loser_next_match_position'] = slot
+
+    def advance(self, key, winner_team_id: int):
+        """Complete a match (e.g. a bye) and place its winner in the next match."""
+        match = self.matches[key]
+        match['winner_team_id'] = winner_team_id
+        match['status'] = 'completed'
+
+        next_key = self.links.get(key)
+        if next_key is not None:
+            self.matches[next_key][f"{match['next_match_position']}_id"] = winner_team_id
+
+    def write(self, tournament_id: int) -> Dict:
+        """
+        Insert all matches of a tournament that has none yet. Does not commit.
+
+        Args:
+            tournament_id: Tournament the matches belong to
+
+        Returns:
+            Dict mapping (bracket, round_number, position) to the new match ID
+        """
+        if not self.matches:
+            return {}
+
+        # Core insert: one executemany, rather than one ORM batch per distinct set of non-null columns
+        db.session.execute(Match.__table__.insert(), [
+            dict(match, tournament_id=tournament_id) for match in self.matches.values()
+        ])
+
+        ids = {
+            (bracket, round_number, position): match_id
+            for match_id, bracket, round_number, position in db.session.execute(
+                select(Match.id, Match.bracket, Match.round_number, Match.position_in_round)
+                .where(Match.tournament_id == tournament_id)
+            )
+        }
+
+        for column, links in ((Match.next_match_id, self.links),
+                              (Match.loser_next_match_id, self.loser_links)):
+            next_ids = {ids[key]: ids[next_key] for key, next_key in links.items()}
+            if next_ids:
+                db.session.execute(
+                    update(Match)
+                    .where(Match.id.in_(list(next_ids)))
+                    .values({column: case(next_ids, value=Match.id)})
+                    .execution_options(synchronize_session=False)
+                )
+
+        return ids
@@ -1,6 +1,8 @@
 from datetime import datetime, date
 from app import db
 from app.models import GameNight, Team, Game
+from app.services.leaderboard_service import LeaderboardService
+from app.utils.db_routing import reads_from_replica
 
 
 class GameNightService:
@@ -165,6 +167,7 @@ class GameNightService:
         return query.all()
 
     @staticmethod
+    @reads_from_replica
     def get_completed_game_nights():
         """
         Get all completed game nights, newest first.
@@ -203,15 +206,16 @@ class GameNightService:
         """
         game_night = GameNight.query.get_or_404(game_night_id)
 
-        teams = game_night.get_leaderboard()
+        teams, standings = LeaderboardService.get_ranked_teams_with_standings(game_night_id)
         games = game_night.games.order_by(Game.sequence_number).all()
         completed_games = [g for g in games if g.isCompleted]
         upcoming_games = [g for g in games if not g.isCompleted]
-        winner = game_night.get_winner()
+        winner = teams[0] if teams else None
 
         return {
             'game_night': game_night,
             'teams': teams,
+            'standings': standings,
             'games': games,
             'completed_games': completed_games,
             'upcoming_games': upcoming_games,
@@ -261,6 +265,7 @@ class GameNightService:
             db.session.delete(team)
 
         db.session.commit()
+        LeaderboardService.invalidate(game_night_id)
 
         return game_night
 
@@ -276,6 +281,7 @@ class GameNightService:
 
         db.session.delete(game_night)
         db.session.commit()
+        LeaderboardService.invalidate(game_night_id)
 
     @staticmethod
     def update_game_night(game_night_id, name=None, game_date=None):
@@ -1,10 +1,17 @@
 from app import db
 from app.models import Game, Score, Penalty
+from app.services.leaderboard_service import LeaderboardService
+from app.utils.db_routing import reads_from_replica
+from app.utils.invalidation import invalidation_bus
+
+# Invalidation topic for cached per-game settings (keyed by game ID)
+GAME_TOPIC = 'game'
 
 
 class GameService:
 
     @staticmethod
+    @reads_from_replica
     def get_all_games(ordered=True, game_night_id=None):
         """
         Get all games, optionally filtered by game night.
@@ -72,6 +79,7 @@ class GameService:
             metric_type=form_data['metric_type'],
             scoring_direction=form_data.get('scoring_direction', 'lower_better'),
             public_input=form_data.get('public_input', False),
+            timer_estimator=form_data.get('timer_estimator', 'trimmed_mean'),
             game_night_id=game_night_id,
             isCompleted=False
         )
@@ -90,6 +98,7 @@ class GameService:
                 db.session.add(penalty)
 
         db.session.commit()
+        LeaderboardService.invalidate(game_night_id)
         return game
 
     @staticmethod
@@ -137,6 +146,7 @@ class GameService:
         game.metric_type = form_data['metric_type']
         game.scoring_direction = form_data.get('scoring_direction', 'lower_better')
         game.public_input = form_data.get('public_input', False)
+        game.timer_estimator = form_data.get('timer_estimator', game.timer_estimator)
 
         # Delete existing penalties
         Penalty.query.filter_by(game_id=game_id).delete()
@@ -152,7 +162,10 @@ class GameService:
                 )
                 db.session.add(penalty)
 
+        game_night_id = game.game_night_id
         db.session.commit()
+        LeaderboardService.invalidate(game_night_id)
+        invalidation_bus.publish(GAME_TOPIC, game_id)
         return game
 
     @staticmethod
@@ -165,10 +178,12 @@ class GameService:
             game_id: Game ID to delete
         """
         game = Game.query.get_or_404(game_id)
+        game_night_id = game.game_night_id
 
         # Simply delete the game - cascade will handle scores, penalties, tournaments, and matches
         db.session.delete(game)
         db.session.commit()
+        LeaderboardService.invalidate(game_night_id)
 
     @staticmethod
     def get_completed_games():
@@ -0,0 +1,360 @@
+from collections import namedtuple
+from sqlalchemy import func
+from app import db
+from app.models import Team, Score, Game, TeamStanding
+from app.utils.db_routing import reads_from_primary
+from app.utils.cache import LRUCache
+from app.utils.invalidation import invalidation_bus
+
+
+LeaderboardRow = namedtuple(
+    'LeaderboardRow',
+    ['rank', 'team_id', 'name', 'color', 'points', 'games_played']
+)
+
+# Immutable, session-independent views used by cached leaderboard snapshots.
+# Attribute names mirror the models so templates can use either.
+TeamView = namedtuple('TeamView', ['id', 'name', 'color', 'abbreviation'])
+GameView = namedtuple('GameView', [
+    'id', 'name', 'type', 'sequence_number', 'point_scheme',
+    'metric_type', 'scoring_direction', 'isCompleted'
+])
+ScoreView = namedtuple('ScoreView', ['points', 'score_value', 'notes'])
+LeaderboardSnapshot = namedtuple('LeaderboardSnapshot', ['teams', 'standings', 'games', 'scores'])
+
+# Snapshots keyed by game_night_id (None = all teams/games); see LeaderboardService.invalidate
+leaderboard_cache = LRUCache(maxsize=32)
+
+# Invalidation bus topic; the key is a game night ID, or ALL_GAME_NIGHTS to drop everything
+LEADERBOARD_TOPIC = 'leaderboard'
+ALL_GAME_NIGHTS = '*'
+
+
+def _drop_cached_leaderboard(game_night_id):
+    """Bus subscriber: drop this worker's cached snapshots for a game night."""
+    if game_night_id == ALL_GAME_NIGHTS:
+        leaderboard_cache.clear()
+    else:
+        # The all-game-nights view (key None) includes every game night's data
+        leaderboard_cache.invalidate(game_night_id, None)
+
+
+invalidation_bus.subscribe(LEADERBOARD_TOPIC, _drop_cached_leaderboard)
+
+
+class LeaderboardService:
+
+    @staticmethod
+    def _totals_subquery():
+        """
+        Build per-team point totals across all game nights as a GROUP BY subquery.
+
+        Returns:
+            Subquery with team_id, points and games_played columns
+        """
+        return db.session.query(
+            Score.team_id.label('team_id'),
+            func.sum(Score.points).label('points'),
+            func.count(Score.id).label('games_played')
+        ).group_by(Score.team_id).subquery()
+
+    @staticmethod
+    def _ranked_query(columns, game_night_id=None):
+        """
+        Join teams to their totals and order them by points descending.
+
+        For a single game night the totals come from the materialized
+        team_standing table (an indexed range scan); across all game nights
+        they are aggregated from the score table.
+
+        Ties keep team creation order (lowest id first).
+
+        Args:
+            columns: Entities/columns to select ahead of points and games_played
+            game_night_id: If provided, only rank that game night's teams
+
+        Returns:
+            Query yielding (*columns, points, games_played) rows
+        """
+        if game_night_id:
+            points = func.coalesce(TeamStanding.points, 0)
+            games_played = func.coalesce(TeamStanding.games_played, 0)
+            query = db.session.query(*columns, points, games_played).outerjoin(
+                TeamStanding, db.and_(
+                    TeamStanding.team_id == Team.id,
+                    TeamStanding.game_night_id == game_night_id
+                )
+            ).filter(Team.game_night_id == game_night_id)
+            return query.order_by(points.desc(), Team.id)
+
+        totals = LeaderboardService._totals_subquery()
+        points = func.coalesce(totals.c.points, 0)
+        games_played = func.coalesce(totals.c.games_played, 0)
+
+        query = db.session.query(*columns, points, games_played).outerjoin(
+            totals, totals.c.team_id == Team.id
+        )
+        return query.order_by(points.desc(), Team.id)
+
+    @staticmethod
+    def get_standings(game_night_id=None):
+        """
+        Get ranked standings computed in the database.
+
+        Args:
+            game_night_id: If provided, only rank that game night's teams.
+                           If None, rank all teams by points across all game nights.
+
+        Returns:
+            List of LeaderboardRow tuples, first place first
+        """
+        rows = LeaderboardService._ranked_query(
+            (Team.id, Team.name, Team.color), game_night_id
+        ).all()
+
+        return [
+            LeaderboardRow(rank, team_id, name, color, int(points), int(games_played))
+            for rank, (team_id, name, color, points, games_played) in enumerate(rows, start=1)
+        ]
+
+    @staticmethod
+    def get_ranked_teams(game_night_id=None, limit=None):
+        """
+        Get Team objects ordered by points descending in a single query.
+
+        Args:
+            game_night_id: If provided, only rank that game night's teams
+            limit: Optional maximum number of teams to return
+
+        Returns:
+            List of Team objects, first place first
+        """
+        query = LeaderboardService._ranked_query((Team,), game_night_id)
+        if limit:
+            query = query.limit(limit)
+        return [row[0] for row in query.all()]
+
+    @staticmethod
+    def get_ranked_teams_with_standings(game_night_id=None):
+        """
+        Get ranked Team objects and their standings from a single query.
+
+        For pages that iterate Team objects and look up each team's totals.
+
+        Args:
+            game_night_id: If provided, only rank that game night's teams
+
+        Returns:
+            Tuple of (list of Team objects first place first,
+            dict mapping team_id to LeaderboardRow)
+        """
+        rows = LeaderboardService._ranked_query((Team,), game_night_id).all()
+
+        teams = [team for team, _, _ in rows]
+        standings = {
+            team.id: LeaderboardRow(rank, team.id, team.name, team.color, int(points), int(games_played))
+            for rank, (team, points, games_played) in enumerate(rows, start=1)
+        }
+        return teams, standings
+
+    @staticmethod
+    def get_winners(game_night_ids):
+        """
+        Get the leading team for several game nights with one query.
+
+        Args:
+            game_night_ids: Iterable of game night IDs
+
+        Returns:
+            Dict mapping game_night_id to the first-place LeaderboardRow
+        """
+        game_night_ids = list(game_night_ids)
+        if not game_night_ids:
+            return {}
+
+        points = func.coalesce(TeamStanding.points, 0)
+        games_played = func.coalesce(TeamStanding.games_played, 0)
+        rows = db.session.query(
+            Team.game_night_id, Team.id, Team.name, Team.color, points, games_played
+        ).outerjoin(
+            TeamStanding, db.and_(
+                TeamStanding.team_id == Team.id,
+                TeamStanding.game_night_id == Team.game_night_id
+            )
+        ).filter(
+            Team.game_night_id.in_(game_night_ids)
+        ).order_by(
+            Team.game_night_id, points.desc(), Team.id
+        ).all()
+
+        winners = {}
+        for game_night_id, team_id, name, color, team_points, team_games in rows:
+            if game_night_id not in winners:
+                winners[game_night_id] = LeaderboardRow(
+                    1, team_id, name, color, int(team_points), int(team_games)
+                )
+        return winners
+
+    @staticmethod
+    @reads_from_primary
+    def _build_snapshot(game_night_id=None):
+        """
+        Load everything a leaderboard page renders into immutable views.
+
+        Costs three queries: ranked teams with totals, games, and the score grid.
+        """
+        from app.services.game_service import GameService
+        from app.services.score_service import ScoreService
+
+        rows = LeaderboardService._ranked_query((Team,), game_night_id).all()
+        teams = tuple(
+            TeamView(team.id, team.name, team.color, team.abbreviation)
+            for team, _, _ in rows
+        )
+        standings = {
+            team.id: LeaderboardRow(rank, team.id, team.name, team.color, int(points), int(games_played))
+            for rank, (team, points, games_played) in enumerate(rows, start=1)
+        }
+
+        games = tuple(
+            GameView(game.id, game.name, game.type, game.sequence_number, game.point_scheme,
+                     game.metric_type, game.scoring_direction, game.isCompleted)
+            for game in GameService.get_all_games(ordered=True, game_night_id=game_night_id)
+        )
+
+        scores = {
+            key: ScoreView(score.points, score.score_value, score.notes)
+            for key, score in ScoreService.get_score_matrix(game_night_id).items()
+        }
+
+        return LeaderboardSnapshot(teams, standings, games, scores)
+
+    @staticmethod
+    def get_snapshot(game_night_id=None):
+        """
+        Get the cached leaderboard data for a game night.
+
+        Served from an in-process LRU cache; score, team and game writes call
+        invalidate() so the next read rebuilds it.
+
+        Args:
+            game_night_id: Game night ID (None = all teams and games)
+
+        Returns:
+            LeaderboardSnapshot with ranked teams, standings by team ID,
+            ordered games and the (team_id, game_id) score grid
+        """
+        return leaderboard_cache.get_or_load(
+            game_night_id,
+            lambda: LeaderboardService._build_snapshot(game_night_id)
+        )
+
+    @staticmethod
+    def invalidate(game_night_id=None):
+        """
+        Drop cached leaderboard data affected by a write, in every worker.
+
+        The all-game-nights view (key None) is always dropped as well, since
+        it includes every game night's data.
+
+        Args:
+            game_night_id: Game night whose data changed
+        """
+        invalidation_bus.publish(LEADERBOARD_TOPIC, game_night_id)
+
+    @staticmethod
+    def invalidate_for_game(game_id):
+        """
+        Drop cached leaderboard data for the game night a game belongs to.
+
+        Args:
+            game_id: ID of the game whose scores changed
+        """
+        game = db.session.get(Game, game_id) if game_id is not None else None
+        if game is None:
+            invalidation_bus.publish(LEADERBOARD_TOPIC, ALL_GAME_NIGHTS)
+        else:
+            LeaderboardService.invalidate(game.game_night_id)
+
+    @staticmethod
+    def get_feed(game_night_id, since=None):
+        """
+        Get a game night's leaderboard as compact JSON-ready data for polling clients.
+
+        Read straight from the database (not the snapshot cache) so the
+        data is never older than the revision it is labelled with.
+
+        Args:
+            game_night_id: Game night ID
+            since: Revision the client already has; if given and still in the
+                   change log, only teams, games and scores changed since
+                   then are returned
+
+        Returns:
+            Dict with revision, full flag, team order and standings/games/scores
+            (plus since and removed_* lists for deltas)
+        """
+        from app.services.revision_service import RevisionService
+        from app.services.game_service import GameService
+        from app.services.score_service import ScoreService
+
+        # Read the revision first: anything loaded afterwards is at least that new
+        revision = RevisionService.get_revision(game_night_id)
+        changes = None
+        if since is not None:
+            changes = RevisionService.get_changes(game_night_id, since, revision)
+
+        standings = LeaderboardService.get_standings(game_night_id)
+        feed = {
+            'game_night_id': game_night_id,
+            'revision': revision,
+            'full': changes is None,
+            'order': [row.team_id for row in standings]
+        }
+
+        if changes is None:
+            games = GameService.get_all_games(ordered=True, game_night_id=game_night_id)
+            scores = ScoreService.get_score_matrix(game_night_id).values()
+        else:
+            standings = [row for row in standings if row.team_id in changes.team_ids]
+            games = Game.query.filter(
+                Game.id.in_(changes.game_ids), Game.game_night_id == game_night_id
+            ).order_by(Game.sequence_number).all() if changes.game_ids else []
+
+            scores = []
+            if changes.score_keys:
+                team_ids = {team_id for team_id, _ in changes.score_keys}
+                game_ids = {game_id for _, game_id in changes.score_keys}
+                scores = [
+                    score for score in Score.query.filter(
+                        Score.team_id.in_(team_ids), Score.game_id.in_(game_ids)
+                    ).all()
+                    if (score.team_id, score.game_id) in changes.score_keys
+                ]
+
+            feed['since'] = since
+            feed['removed_teams'] = sorted(changes.team_ids - set(feed['order']))
+            feed['removed_games'] = sorted(changes.game_ids - {game.id for game in games})
+            feed['removed_scores'] = sorted(
+                [list(key) for key in changes.score_keys - {(score.team_id, score.game_id) for score in scores}]
+            )
+
+        feed['standings'] = [row._asdict() for row in standings]
+        feed['games'] = [{
+            'id': game.id,
+            'name': game.name,
+            'sequence_number': game.sequence_number,
+            'point_scheme': game.point_scheme,
+            'completed': bool(game.isCompleted)
+        } for game in games]
+        feed['scores'] = [{
+            'team_id': score.team_id,
+            'game_id': score.game_id,
+            'points': score.points
+        } for score in scores]
+        return feed
+
+    @staticmethod
+    def get_cache_stats():
+        """Get hit/miss counters for the leaderboard cache."""
+        return leaderboard_cache.stats()
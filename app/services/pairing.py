@@ -0,0 +1,167 @@
+from typing import FrozenSet, List, Optional, Sequence, Set, Tuple
+
+
+def circle_schedule(team_ids: Sequence[int]) -> List[List[Tuple[int, int]]]:
+    """
+    Schedule a round robin with the circle method.
+
+    The first team stays put while the others rotate one place per round,
+    so every pair meets exactly once in n - 1 rounds (n rounded up to even;
+    with an odd count the team drawn against the empty seat sits out).
+    Work is proportional to the number of matches produced.
+
+    Args:
+        team_ids: Teams in seating order
+
+    Returns:
+        List of rounds, each a list of (team1_id, team2_id) pairs
+    """
+    seats = list(team_ids)
+    if len(seats) % 2:
+        seats.append(None)
+    count = len(seats)
+
+    rounds = []
+    for round_index in range(count - 1):
+        pairs = []
+        for i in range(count // 2):
+            home, away = seats[i], seats[count - 1 - i]
+            if home is None or away is None:
+                continue
+            # The fixed seat would otherwise always be team1; alternate it
+            if i == 0 and round_index % 2:
+                home, away = away, home
+            pairs.append((home, away))
+        rounds.append(pairs)
+        seats = [seats[0], seats[-1]] + seats[1:-1]
+    return rounds
+
+
+def first_round_pairs(team_ids: Sequence[int], bracket_size: int) -> List[Tuple[int, Optional[int]]]:
+    """
+    Pair teams for the first round of an elimination bracket.
+
+    Match i gets the i-th and (bracket_size / 2 + i)-th teams, so every match
+    has at least one team and the bracket_size - n byes go to the last
+    matches (team2 None) instead of leaving whole matches empty.
+
+    Args:
+        team_ids: Teams in placement order (n > bracket_size / 2)
+        bracket_size: Power of two >= n
+
+    Returns:
+        List of bracket_size / 2 (team1_id, team2_id or None) pairs
+    """
+    half = bracket_size // 2
+    return [
+        (team_ids[i], team_ids[half + i] if half + i < len(team_ids) else None)
+        for i in range(half)
+    ]
+
+
+def seed_order(bracket_size: int) -> List[int]:
+    """
+    Get the seeds in first-round slot order for a standard seeded bracket.
+
+    Built by doubling: every seed s in a bracket of size k is split into s
+    and 2k + 1 - s. Seed 1 meets seed N in round 1, and seeds 1 and 2 can
+    only meet in the final (e.g. 8 -> 1, 8, 4, 5, 2, 7, 3, 6).
+
+    Args:
+        bracket_size: Power of two
+
+    Returns:
+        List of 1-based seeds, two per first-round match
+    """
+    order = [1]
+    while len(order) < bracket_size:
+        size = len(order) * 2
+        order = [seed for top in order for seed in (top, size + 1 - top)]
+    return order
+
+
+def seeded_pairs(ranked_team_ids: Sequence[int], bracket_size: int) -> List[Tuple[int, Optional[int]]]:
+    """
+    Pair teams for the first round of a seeded elimination bracket.
+
+    Seeds beyond the team count are byes, so the bracket_size - n byes go
+    to the top seeds.
+
+    Args:
+        ranked_team_ids: Teams best first (n > bracket_size / 2)
+        bracket_size: Power of two >= n
+
+    Returns:
+        List of bracket_size / 2 (team1_id, team2_id or None) pairs, in bracket order
+    """
+    count = len(ranked_team_ids)
+    order = seed_order(bracket_size)
+    return [
+        (ranked_team_ids[top - 1], ranked_team_ids[bottom - 1] if bottom <= count else None)
+        for top, bottom in zip(order[::2], order[1::2])
+    ]
+
+
+def swiss_pairings(ranked_team_ids: Sequence[int], played: Set[FrozenSet[int]],
+                   had_bye: Set[int] = frozenset(), max_steps: int = 200000
+                   ) -> Tuple[List[Tuple[int, int]], Optional[int]]:
+    """
+    Pair a Swiss round: teams with similar records, no rematches.
+
+    With an odd count the lowest-ranked team without a bye yet sits out.
+    The rest are paired by depth-first search in rank order: each
+    highest-ranked unpaired team takes the nearest-ranked opponent it has
+    not played, backtracking when the teams below can no longer be paired.
+    Nearly every round pairs without backtracking, so 200 teams take a few
+    milliseconds. If max_steps is spent (a late round of a small field with
+    no rematch-free pairing), the remaining teams are paired greedily,
+    allowing the fewest rematches the greedy order finds.
+
+    Args:
+        ranked_team_ids: Teams best first (wins, then tiebreakers)
+        played: frozenset({team_a, team_b}) for every pair that has met
+        had_bye: Teams that already sat out a round
+        max_steps: Opponents tried before falling back to greedy pairing
+
+    Returns:
+        ((team1_id, team2_id) pairs in rank order, team with the bye or None)
+    """
+    teams = list(ranked_team_ids)
+    bye = None
+    if len(teams) % 2:
+        bye = next((team for team in reversed(teams) if team not in had_bye), teams[-1])
+        teams.remove(bye)
+
+    count = len(teams)
+    partner = [None] * count
+    steps = 0
+
+    def solve(i):
+        nonlocal steps
+        while i < count and partner[i] is not None:
+            i += 1
+        if i == count:
+            return True
+        for j in range(i + 1, count):
+            if partner[j] is not None or frozenset((teams[i], teams[j])) in played:
+                continue
+            steps += 1
+            if steps > max_steps:
+                return False
+            partner[i], partner[j] = j, i
+            if solve(i + 1):
+                return True
+            partner[i] = partner[j] = None
+        return False
+
+    if not solve(0):
+        partner = [None] * count
+        for i in range(count):
+            if partner[i] is not None:
+                continue
+            free = [j for j in range(i + 1, count) if partner[j] is None]
+            j = next((j for j in free if frozenset((teams[i], teams[j])) not in played), free[0])
+            partner[i], partner[j] = j, i
+
+    pairs = [(teams[i], teams[j]) for i, j in enumerate(partner) if i < j]
+    return pairs, bye
@@ -0,0 +1,240 @@
+from collections import defaultdict, namedtuple
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session
+from app import db
+from app.models import (
+    Score, Game, GameNight, Team, Penalty, Participant, GameNightRevision, LeaderboardChange
+)
+from app.services.standings_service import _game_night_ids
+
+# session.info key holding changes captured in before_flush until after_flush bumps them
+_PENDING_KEY = 'game_night_revisions'
+
+# Revision key tracking changes to any game night (the all-game-nights views)
+ALL_GAME_NIGHTS = 0
+
+# Leaderboard change entries kept per game night, in revisions
+CHANGE_LOG_RETENTION = 500
+
+# What changed in a game night between two revisions
+LeaderboardChanges = namedtuple('LeaderboardChanges', ['team_ids', 'game_ids', 'score_keys'])
+
+
+def _team_game_night_ids(connection, team_ids):
+    """Map team IDs to their game night IDs with a single SELECT."""
+    team_ids = {team_id for team_id in team_ids if team_id is not None}
+    if not team_ids:
+        return {}
+    return dict(connection.execute(
+        select(Team.id, Team.game_night_id).where(Team.id.in_(team_ids))
+    ).all())
+
+
+def _current_changes(connection, objects):
+    """
+    Resolve (game_night_id, team_id, game_id) change keys from objects' current attributes.
+
+    Args:
+        connection: Connection bound to the current transaction
+        objects: Model instances being inserted or updated
+
+    Returns:
+        Set of change keys; team_id / game_id are None where not applicable
+    """
+    objects = list(objects)
+    game_nights = _game_night_ids(
+        connection, (obj.game_id for obj in objects if isinstance(obj, (Score, Penalty)))
+    )
+    team_game_nights = _team_game_night_ids(
+        connection, (obj.team_id for obj in objects if isinstance(obj, Participant))
+    )
+
+    changes = set()
+    for obj in objects:
+        if isinstance(obj, GameNight):
+            changes.add((obj.id, None, None))
+        elif isinstance(obj, Team):
+            changes.add((obj.game_night_id, obj.id, None))
+        elif isinstance(obj, Game):
+            changes.add((obj.game_night_id, None, obj.id))
+        elif isinstance(obj, Score):
+            changes.add((game_nights.get(obj.game_id), obj.team_id, obj.game_id))
+        elif isinstance(obj, Penalty):
+            changes.add((game_nights.get(obj.game_id), None, None))
+        elif isinstance(obj, Participant):
+            changes.add((team_game_nights.get(obj.team_id), None, None))
+
+    return {change for change in changes if change[0] is not None}
+
+
+def _stored_changes(connection, objects):
+    """
+    Resolve change keys of persistent objects from their rows as stored before this flush.
+
+    Covers updates that move a row to another game night, where the old
+    foreign key may never have been loaded into the object.
+
+    Args:
+        connection: Connection bound to the current transaction
+        objects: Persistent model instances being updated or deleted
+
+    Returns:
+        Set of (game_night_id, team_id, game_id) change keys
+    """
+    ids_by_model = defaultdict(set)
+    for obj in objects:
+        if isinstance(obj, (GameNight, Team, Game, Score, Penalty, Participant)):
+            ids_by_model[type(obj)].add(inspect(obj).identity[0])
+
+    changes = {(game_night_id, None, None) for game_night_id in ids_by_model.pop(GameNight, ())}
+    for model, ids in ids_by_model.items():
+        if model is Team:
+            query = select(Team.game_night_id, Team.id, db.null())
+        elif model is Game:
+            query = select(Game.game_night_id, db.null(), Game.id)
+        elif model is Score:
+            query = select(Game.game_night_id, Score.team_id, Score.game_id).select_from(Score).join(
+                Game, Score.game_id == Game.id
+            )
+        elif model is Participant:
+            query = select(Team.game_night_id, db.null(), db.null()).select_from(Participant).join(
+                Team, Participant.team_id == Team.id
+            )
+        else:
+            query = select(Game.game_night_id, db.null(), db.null()).select_from(Penalty).join(
+                Game, Penalty.game_id == Game.id
+            )
+        changes.update(tuple(row) for row in connection.execute(query.where(model.id.in_(ids))))
+
+    return {change for change in changes if change[0] is not None}
+
+
+@event.listens_for(Session, 'before_flush')
+def _capture_revision_changes(session, flush_context, instances):
+    """Record changes to updated and deleted rows while the rows still exist."""
+    changed = [obj for obj in session.dirty if session.is_modified(obj)]
+    changes = set()
+    if changed or session.deleted:
+        connection = session.connection()
+        changes = _stored_changes(connection, list(session.deleted) + changed)
+        changes |= _current_changes(connection, changed)
+    session.info[_PENDING_KEY] = changes
+
+
+@event.listens_for(Session, 'after_flush')
+def _bump_revisions(session, flush_context):
+    """Bump the revision of every game night this flush touched, in the same transaction."""
+    changes = session.info.pop(_PENDING_KEY, None) or set()
+    # New rows are handled here so relationship-assigned foreign keys are populated
+    if session.new:
+        changes |= _current_changes(session.connection(), session.new)
+
+    if changes:
+        RevisionService.bump(session.connection(), changes)
+
+
+class RevisionService:
+
+    @staticmethod
+    def bump(connection, changes):
+        """
+        Increment game night revisions and log what changed at each new revision.
+
+        The global (ALL_GAME_NIGHTS) revision is bumped as well.
+
+        Args:
+            connection: Connection bound to the current transaction
+            changes: Iterable of (game_night_id, team_id, game_id) change keys;
+                     team_id and game_id may be None
+
+        Returns:
+            Dict mapping game_night_id to its new revision
+        """
+        by_game_night = defaultdict(set)
+        for game_night_id, team_id, game_id in changes:
+            by_game_night[game_night_id].add((team_id, game_id))
+        by_game_night.setdefault(ALL_GAME_NIGHTS, set())
+
+        table = GameNightRevision.__table__
+        change_table = LeaderboardChange.__table__
+        revisions = {}
+        for game_night_id in sorted(by_game_night):
+            result = connection.execute(
+                table.update().where(
+                    table.c.game_night_id == game_night_id
+                ).values(revision=table.c.revision + 1)
+            )
+            if result.rowcount == 0:
+                connection.execute(table.insert().values(game_night_id=game_night_id, revision=1))
+            revision = connection.execute(
+                select(table.c.revision).where(table.c.game_night_id == game_night_id)
+            ).scalar()
+            revisions[game_night_id] = revision
+
+            entries = [
+                {'game_night_id': game_night_id, 'revision': revision, 'team_id': team_id, 'game_id': game_id}
+                for team_id, game_id in by_game_night[game_night_id]
+                if team_id is not None or game_id is not None
+            ]
+            if not entries:
+                continue
+            connection.execute(change_table.insert(), entries)
+
+            # Trim the change log now and then; older clients get a full reload
+            if revision % 50 == 0:
+                connection.execute(change_table.delete().where(
+                    change_table.c.game_night_id == game_night_id,
+                    change_table.c.revision <= revision - CHANGE_LOG_RETENTION
+                ))
+
+        return revisions
+
+    @staticmethod
+    def get_revision(game_night_id=None):
+        """
+        Get the current revision of a game night.
+
+        Args:
+            game_night_id: Game night ID (None = changes across all game nights)
+
+        Returns:
+            Revision number (0 if nothing has been written yet)
+        """
+        key = ALL_GAME_NIGHTS if game_night_id is None else game_night_id
+        revision = db.session.query(GameNightRevision.revision).filter_by(game_night_id=key).scalar()
+        return revision or 0
+
+    @staticmethod
+    def get_changes(game_night_id, since, revision):
+        """
+        Get the teams, games and scores of a game night changed after a revision.
+
+        Args:
+            game_night_id: Game night ID
+            since: Revision the client already has
+            revision: Current revision (from get_revision)
+
+        Returns:
+            LeaderboardChanges of ID sets (score_keys are (team_id, game_id)),
+            or None if since is outside the retained change log and the
+            client needs a full reload
+        """
+        if since > revision or since < revision - CHANGE_LOG_RETENTION:
+            return None
+
+        rows = db.session.query(LeaderboardChange.team_id, LeaderboardChange.game_id).filter(
+            LeaderboardChange.game_night_id == game_night_id,
+            LeaderboardChange.revision > since,
+            LeaderboardChange.revision <= revision
+        ).distinct().all()
+
+        changes = LeaderboardChanges(set(), set(), set())
+        for team_id, game_id in rows:
+            if team_id is not None and game_id is not None:
+                changes.score_keys.add((team_id, game_id))
+                changes.team_ids.add(team_id)
+            elif team_id is not None:
+                changes.team_ids.add(team_id)
+            else:
+                changes.game_ids.add(game_id)
+        return changes
@@ -1,5 +1,10 @@
+from collections import defaultdict
 from app import db
 from app.models import Score, Game, Team
+from app.services.leaderboard_service import LeaderboardService
+from app.services.revision_service import RevisionService
+from app.services.standings_service import StandingsService
+from app.utils.upsert import upsert_insert
 
 
 class ScoreService:
@@ -40,6 +45,27 @@ class ScoreService:
         scores = Score.query.filter_by(game_id=game_id).all()
         return {score.team_id: score for score in scores}
 
+    @staticmethod
+    def get_score_matrix(game_night_id):
+        """
+        Get every score for a game night in a single query.
+
+        Replaces per-cell get_score() lookups in leaderboard templates.
+
+        Args:
+            game_night_id: Game night ID (None = scores from every game)
+
+        Returns:
+            Dict mapping (team_id, game_id) to Score object
+        """
+        query = Score.query
+        if game_night_id:
+            query = query.join(Game, Score.game_id == Game.id).filter(
+                Game.game_night_id == game_night_id
+            )
+        scores = query.all()
+        return {(score.team_id, score.game_id): score for score in scores}
+
     @staticmethod
     def calculate_points_from_rank(rank, increment, total_teams):
         """
@@ -98,41 +124,102 @@ class ScoreService:
         # Update game completion status
         game.isCompleted = is_completed
 
-        # Process each team's score
+        # Convert each team's payload to the score columns it sets
+        values = {}
         for team_id_str, score_data in scores_data.items():
-            team_id = int(team_id_str)
-
-            # Verify team exists
-            team = Team.query.get(team_id)
-            if not team:
-                continue
-
-            # Find or create score
-            score = Score.query.filter_by(team_id=team_id, game_id=game_id).first()
-            if not score:
-                score = Score(team_id=team_id, game_id=game_id)
-                db.session.add(score)
-
-            # Update score data
+            row = {}
             if 'score' in score_data and score_data['score'] is not None:
                 try:
-                    score.score_value = float(score_data['score'])
+                    row['score_value'] = float(score_data['score'])
                 except (ValueError, TypeError):
-                    score.score_value = None
+                    row['score_value'] = None
 
             if 'points' in score_data:
                 try:
-                    score.points = int(score_data['points'])
+                    row['points'] = int(score_data['points'])
                 except (ValueError, TypeError):
-                    score.points = 0
+                    row['points'] = 0
 
             if 'notes' in score_data:
-                score.notes = score_data['notes']
+                row['notes'] = score_data['notes']
+
+            values[int(team_id_str)] = row
+
+        # Skip teams that don't exist (one query for all of them)
+        if values:
+            known_team_ids = {
+                team_id for (team_id,) in db.session.query(Team.id).filter(Team.id.in_(values))
+            }
+            values = {team_id: row for team_id, row in values.items() if team_id in known_team_ids}
+
+        ScoreService.upsert_scores(game, values)
 
         # Commit all changes
+        game_night_id = game.game_night_id
         db.session.commit()
+        LeaderboardService.invalidate(game_night_id)
         return game
 
+    @staticmethod
+    def upsert_scores(game, values):
+        """
+        Insert or update many scores of a game in a constant number of queries.
+
+        Uses INSERT ... ON CONFLICT (game_id, team_id) DO UPDATE on SQLite and
+        PostgreSQL. The statement bypasses the ORM flush, so materialized
+        standings and the game night revision are refreshed here as well.
+        Other databases use the ORM instead.
+        Does not commit.
+
+        Args:
+            game: Game the scores belong to
+            values: Dict mapping team_id to a dict of score columns to set
+                    (score_value, points, notes); teams must exist
+
+        Returns:
+            Number of scores written
+        """
+        if not values:
+            return 0
+
+        connection = db.session.connection()
+        insert = upsert_insert(connection)
+        if insert is None:
+            existing = {
+                score.team_id: score
+                for score in Score.query.filter(Score.game_id == game.id, Score.team_id.in_(values))
+            }
+            for team_id, row in values.items():
+                score = existing.get(team_id)
+                if not score:
+                    score = Score(team_id=team_id, game_id=game.id)
+                    db.session.add(score)
+                for column, value in row.items():
+                    setattr(score, column, value)
+            return len(values)
+
+        # A multi-row INSERT needs the same columns in every row, so group rows by the columns they set
+        groups = defaultdict(list)
+        for team_id, row in values.items():
+            groups[tuple(sorted(row))].append({'game_id': game.id, 'team_id': team_id, **row})
+
+        for columns, rows in groups.items():
+            statement = insert(Score.__table__).values(rows)
+            if columns:
+                statement = statement.on_conflict_do_update(
+                    index_elements=['game_id', 'team_id'],
+                    set_={column: statement.excluded[column] for column in columns}
+                )
+            else:
+                statement = statement.on_conflict_do_nothing(index_elements=['game_id', 'team_id'])
+            connection.execute(statement)
+
+        if game.game_night_id is not None:
+            StandingsService.refresh(connection, game.game_night_id, values)
+            RevisionService.bump(connection, {(game.game_night_id, team_id, game.id) for team_id in values})
+
+        return len(values)
+
     @staticmethod
     def auto_calculate_and_save_scores(game_id, raw_scores, is_completed=False):
         """
@@ -0,0 +1,262 @@
+from collections import defaultdict
+from sqlalchemy import event, func, inspect, select
+from sqlalchemy.orm import Session, attributes
+from app import db
+from app.models import Score, Game, GameNight, Team, TeamStanding
+from app.utils.logger import get_logger
+from app.utils.upsert import upsert_insert
+
+logger = get_logger(__name__)
+
+# session.info key holding deltas captured in before_flush until after_flush applies them
+_PENDING_KEY = 'team_standing_deltas'
+
+
+def _as_points(value):
+    """Coerce a Score.points value (may be None or a raw client value) to int."""
+    try:
+        return int(value or 0)
+    except (ValueError, TypeError):
+        return 0
+
+
+def _committed_value(obj, key):
+    """Get the value an attribute had when the object was loaded from the database."""
+    history = attributes.get_history(obj, key)
+    if history.deleted:
+        return history.deleted[0]
+    if history.unchanged:
+        return history.unchanged[0]
+    return getattr(obj, key)
+
+
+def _game_night_ids(connection, game_ids):
+    """Map game IDs to their game night IDs with a single SELECT."""
+    game_ids = {game_id for game_id in game_ids if game_id is not None}
+    if not game_ids:
+        return {}
+    return dict(connection.execute(
+        select(Game.id, Game.game_night_id).where(Game.id.in_(game_ids))
+    ).all())
+
+
+def _collapse(game_deltas, game_nights, into):
+    """Fold (game_id, team_id) deltas into (game_night_id, team_id) deltas."""
+    for (game_id, team_id), (points, games_played) in game_deltas.items():
+        game_night_id = game_nights.get(game_id)
+        if game_night_id is None or team_id is None:
+            continue
+        into[(game_night_id, team_id)][0] += points
+        into[(game_night_id, team_id)][1] += games_played
+    return into
+
+
+@event.listens_for(Session, 'before_flush')
+def _capture_score_removals(session, flush_context, instances):
+    """Record the old side of updated and deleted scores while their games still exist."""
+    game_deltas = defaultdict(lambda: [0, 0])
+
+    for obj in session.deleted:
+        if isinstance(obj, Score):
+            key = (_committed_value(obj, 'game_id'), _committed_value(obj, 'team_id'))
+            game_deltas[key][0] -= _as_points(_committed_value(obj, 'points'))
+            game_deltas[key][1] -= 1
+
+    for obj in session.dirty:
+        if not isinstance(obj, Score) or not session.is_modified(obj):
+            continue
+
+        old_key = (_committed_value(obj, 'game_id'), _committed_value(obj, 'team_id'))
+        new_key = (obj.game_id, obj.team_id)
+        old_points = _as_points(_committed_value(obj, 'points'))
+        new_points = _as_points(obj.points)
+
+        if old_key == new_key and old_points == new_points:
+            continue
+
+        game_deltas[old_key][0] -= old_points
+        game_deltas[new_key][0] += new_points
+        if old_key != new_key:
+            game_deltas[old_key][1] -= 1
+            game_deltas[new_key][1] += 1
+
+    pending = defaultdict(lambda: [0, 0])
+    if game_deltas:
+        game_nights = _game_night_ids(session.connection(), (game_id for game_id, _ in game_deltas))
+        _collapse(game_deltas, game_nights, pending)
+    session.info[_PENDING_KEY] = pending
+
+    # Standings rows must go before the team / game night rows they reference
+    deleted_team_ids = [obj.id for obj in session.deleted if isinstance(obj, Team)]
+    deleted_game_night_ids = [obj.id for obj in session.deleted if isinstance(obj, GameNight)]
+    if deleted_team_ids or deleted_game_night_ids:
+        table = TeamStanding.__table__
+        session.connection().execute(table.delete().where(db.or_(
+            table.c.team_id.in_(deleted_team_ids),
+            table.c.game_night_id.in_(deleted_game_night_ids)
+        )))
+
+
+@event.listens_for(Session, 'after_flush')
+def _apply_score_deltas(session, flush_context):
+    """Fold this flush's score changes into team_standing within the same transaction."""
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending is None:
+        pending = defaultdict(lambda: [0, 0])
+
+    # New scores are handled here so relationship-assigned foreign keys are populated
+    game_deltas = defaultdict(lambda: [0, 0])
+    for obj in session.new:
+        if isinstance(obj, Score):
+            key = (obj.game_id, obj.team_id)
+            game_deltas[key][0] += _as_points(obj.points)
+            game_deltas[key][1] += 1
+
+    connection = None
+    if game_deltas:
+        connection = session.connection()
+        game_nights = _game_night_ids(connection, (game_id for game_id, _ in game_deltas))
+        _collapse(game_deltas, game_nights, pending)
+
+    deleted_team_ids = {inspect(obj).identity[0] for obj in session.deleted if isinstance(obj, Team)}
+    deleted_game_night_ids = {inspect(obj).identity[0] for obj in session.deleted if isinstance(obj, GameNight)}
+    deltas = {
+        key: delta for key, delta in pending.items()
+        if delta != [0, 0] and key[0] not in deleted_game_night_ids and key[1] not in deleted_team_ids
+    }
+    if deltas:
+        StandingsService.apply_deltas(connection or session.connection(), deltas)
+
+
+class StandingsService:
+
+    @staticmethod
+    def apply_deltas(connection, deltas):
+        """
+        Apply point deltas to the materialized standings.
+
+        Args:
+            connection: Connection bound to the current transaction
+            deltas: Dict mapping (game_night_id, team_id) to [points_delta, games_played_delta]
+
+        Returns:
+            Number of standings rows touched
+        """
+        table = TeamStanding.__table__
+        for (game_night_id, team_id), (points, games_played) in deltas.items():
+            result = connection.execute(
+                table.update().where(
+                    table.c.game_night_id == game_night_id,
+                    table.c.team_id == team_id
+                ).values(
+                    points=table.c.points + points,
+                    games_played=table.c.games_played + games_played
+                )
+            )
+            if result.rowcount == 0:
+                # No row yet: seed it from the (already flushed) score table
+                connection.execute(table.insert().from_select(
+                    ['game_night_id', 'team_id', 'points', 'games_played'],
+                    StandingsService._aggregate_select(game_night_id, team_id)
+                ))
+
+        return len(deltas)
+
+    @staticmethod
+    def refresh(connection, game_night_id, team_ids):
+        """
+        Recompute the standings of some teams from the score table with one upsert.
+
+        Used after bulk score writes that bypass the ORM flush. Requires
+        INSERT ... ON CONFLICT support (see app.utils.upsert).
+
+        Args:
+            connection: Connection bound to the current transaction
+            game_night_id: Game night ID
+            team_ids: Iterable of team IDs whose scores changed
+        """
+        table = TeamStanding.__table__
+        insert = upsert_insert(connection)
+        select_query = StandingsService._aggregate_select(game_night_id).where(Score.team_id.in_(list(team_ids)))
+
+        statement = insert(table).from_select(
+            ['game_night_id', 'team_id', 'points', 'games_played'], select_query
+        )
+        connection.execute(statement.on_conflict_do_update(
+            index_elements=['game_night_id', 'team_id'],
+            set_={
+                'points': statement.excluded.points,
+                'games_played': statement.excluded.games_played
+            }
+        ))
+
+    @staticmethod
+    def _aggregate_select(game_night_id=None, team_id=None):
+        """Build a SELECT producing team_standing rows straight from the score table."""
+        query = select(
+            Game.game_night_id,
+            Score.team_id,
+            func.coalesce(func.sum(Score.points), 0),
+            func.count(Score.id)
+        ).join(Game, Score.game_id == Game.id).where(Game.game_night_id.isnot(None))
+
+        if game_night_id is not None:
+            query = query.where(Game.game_night_id == game_night_id)
+        if team_id is not None:
+            query = query.where(Score.team_id == team_id)
+
+        return query.group_by(Game.game_night_id, Score.team_id)
+
+    @staticmethod
+    def get_standing(game_night_id, team_id):
+        """Get the materialized standing for a team, or None if it has no scores."""
+        return db.session.get(TeamStanding, (game_night_id, team_id))
+
+    @staticmethod
+    def backfill():
+        """
+        Build the standings of a database whose scores predate the team_standing table.
+
+        create_all() adds the table empty, so without this every existing
+        game night would show 0 points until rebuild-standings was run.
+        Does nothing once any standings row exists.
+
+        Returns:
+            Number of standings rows written
+        """
+        if db.session.query(TeamStanding.team_id).first() is not None:
+            return 0
+        if db.session.query(Score.id).first() is None:
+            return 0
+        return StandingsService.rebuild()
+
+    @staticmethod
+    def rebuild(game_night_id=None):
+        """
+        Recompute materialized standings from the score table.
+
+        Args:
+            game_night_id: If provided, only rebuild that game night
+
+        Returns:
+            Number of standings rows written
+        """
+        table = TeamStanding.__table__
+        delete = table.delete()
+        if game_night_id is not None:
+            delete = delete.where(table.c.game_night_id == game_night_id)
+
+        db.session.execute(delete)
+        db.session.execute(table.insert().from_select(
+            ['game_night_id', 'team_id', 'points', 'games_played'],
+            StandingsService._aggregate_select(game_night_id)
+        ))
+        db.session.commit()
+
+        count_query = db.session.query(func.count()).select_from(TeamStanding)
+        if game_night_id is not None:
+            count_query = count_query.filter(TeamStanding.game_night_id == game_night_id)
+        count = count_query.scalar()
+
+        logger.info(f"Rebuilt {count} team standings (game_night_id={game_night_id})")
+        return count
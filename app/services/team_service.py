@@ -1,10 +1,14 @@
 from app import db
 from app.models import Team, Participant, Score
+from app.services.leaderboard_service import LeaderboardService
+from app.services.tournament_service import TournamentService
+from app.utils.db_routing import reads_from_replica
 
 
 class TeamService:
 
     @staticmethod
+    @reads_from_replica
     def get_all_teams(sort_by_points=True, game_night_id=None):
         """
         Get all teams, optionally filtered by game night.
@@ -16,20 +20,16 @@ class TeamService:
         Returns:
             List of Team objects
         """
+        if sort_by_points:
+            # Totals are aggregated in the database (game-night-specific if filtered)
+            return LeaderboardService.get_ranked_teams(game_night_id)
+
         query = Team.query
 
         if game_night_id:
             query = query.filter_by(game_night_id=game_night_id)
 
-        teams = query.all()
-        if sort_by_points:
-            if game_night_id:
-                # Sort by game-night-specific points
-                teams = sorted(teams, key=lambda t: t.get_points_for_game_night(game_night_id), reverse=True)
-            else:
-                # Sort by total points across all game nights
-                teams = sorted(teams, key=lambda t: t.totalPoints, reverse=True)
-        return teams
+        return query.all()
 
     @staticmethod
     def get_team_by_id(team_id):
@@ -70,6 +70,7 @@ class TeamService:
             db.session.add(participant)
 
         db.session.commit()
+        LeaderboardService.invalidate(game_night_id)
         return team
 
     @staticmethod
@@ -93,7 +94,11 @@ class TeamService:
                 participants[i].firstName = participant_data['firstName']
                 participants[i].lastName = participant_data['lastName']
 
+        game_night_id = team.game_night_id
         db.session.commit()
+        LeaderboardService.invalidate(game_night_id)
+        # Cached brackets show team names and colors
+        TournamentService.invalidate()
         return team
 
     @staticmethod
@@ -106,7 +111,10 @@ class TeamService:
             team_id: Team ID to delete
         """
         team = Team.query.get_or_404(team_id)
+        game_night_id = team.game_night_id
 
         # Simply delete the team - cascade will handle participants and scores
         db.session.delete(team)
-        db.session.commit()
\ No newline at end of file
+        db.session.commit()
+        LeaderboardService.invalidate(game_night_id)
+        TournamentService.invalidate()
@@ -1,8 +1,57 @@
 import math
 import random
+from collections import namedtuple
 from typing import List, Dict, Optional, Tuple
+from sqlalchemy import and_, case, func, literal, select, union_all
+from sqlalchemy.orm import aliased
 from app import db
 from app.models import Tournament, Match, Team, Game, Score
+from app.services.bracket_builder import BracketBuilder
+from app.services.pairing import circle_schedule, first_round_pairs, seeded_pairs, swiss_pairings
+from app.utils.cache import LRUCache
+from app.utils.db_routing import reads_from_primary, reads_from_replica
+from app.utils.invalidation import invalidation_bus
+
+
+# Immutable, session-independent bracket read model shared by every request.
+# Attribute names match the dicts templates used before, so they render unchanged.
+BracketTeamView = namedtuple('BracketTeamView', ['id', 'name', 'color'])
+BracketMatchView = namedtuple('BracketMatchView', [
+    'id', 'position', 'team1', 'team2', 'team1_score', 'team2_score',
+    'winner_id', 'status', 'is_bye', 'is_play_in', 'is_ready'
+])
+BracketSection = namedtuple('BracketSection', ['name', 'bracket', 'rounds'])
+BracketStandingView = namedtuple('BracketStandingView', [
+    'rank', 'team_id', 'name', 'color', 'played', 'wins', 'losses', 'buchholz', 'score_for', 'score_against'
+])
+# bracket/rounds are the main section; sections adds the losers bracket and grand final if any
+BracketView = namedtuple('BracketView', ['tournament_id', 'bracket', 'rounds', 'sections', 'standings'])
+
+# Tournament.format values
+TOURNAMENT_FORMATS = ('single_elimination', 'double_elimination', 'round_robin', 'swiss')
+# Display order of Match.bracket sections
+BRACKET_SECTIONS = ('main', 'losers', 'grand_final')
+
+# Seeding points per tournament match won, on top of a team's game points
+SEED_MATCH_WIN_POINTS = 1
+
+# Bracket views keyed by tournament ID; see TournamentService.invalidate
+bracket_cache = LRUCache(maxsize=32)
+
+# Invalidation bus topic; the key is a tournament ID, or ALL_TOURNAMENTS to drop everything
+TOURNAMENT_TOPIC = 'tournament'
+ALL_TOURNAMENTS = '*'
+
+
+def _drop_cached_bracket(tournament_id):
+    """Bus subscriber: drop this worker's cached bracket view for a tournament."""
+    if tournament_id == ALL_TOURNAMENTS:
+        bracket_cache.clear()
+    else:
+        bracket_cache.invalidate(tournament_id)
+
+
+invalidation_bus.subscribe(TOURNAMENT_TOPIC, _drop_cached_bracket)
 
 
 class TournamentService:
@@ -11,26 +60,38 @@ class TournamentService:
     def create_tournament(game_id: int, pairing_type: str = 'random',
                          bracket_style: str = 'standard', public_edit: bool = False,
                          manual_pairings: Optional[List[Tuple[int, int]]] = None,
-                         included_team_ids: Optional[List[int]] = None) -> Tournament:
+                         included_team_ids: Optional[List[int]] = None,
+                         tournament_format: str = 'single_elimination',
+                         round_count: Optional[int] = None) -> Tournament:
         """
         Create a tournament bracket for a game.
 
         Args:
             game_id: The game ID to create tournament for
-            pairing_type: 'random' or 'manual'
+            pairing_type: 'random', 'manual' or 'seeded' (by past points; see get_seeding)
             bracket_style: 'standard' (simpler, better) or 'play_in' (complex)
             public_edit: Allow public editing of match results
             manual_pairings: List of (team1_id, team2_id) tuples for manual pairing
             included_team_ids: List of team IDs to include (None = all teams)
+            tournament_format: One of TOURNAMENT_FORMATS; manual pairings
+                only apply to single elimination
+            round_count: Swiss rounds to play (default: ceil(log2(teams)),
+                enough to separate a single unbeaten team)
 
         Returns:
             Tournament object
         """
+        if tournament_format not in TOURNAMENT_FORMATS:
+            raise ValueError(f"Unknown tournament format '{tournament_format}'")
+        if round_count is not None and round_count < 1:
+            raise ValueError("A Swiss tournament needs at least 1 round")
+
         game = Game.query.get_or_404(game_id)
 
         # Create tournament
         tournament = Tournament(
             game_id=game_id,
+            format=tournament_format,
             pairing_type=pairing_type,
             bracket_style=bracket_style,
             public_edit=public_edit
@@ -48,10 +109,22 @@ class TournamentService:
         if team_count < 2:
             raise ValueError("At least 2 teams are required for a tournament")
 
-        # Generate bracket
-        TournamentService._generate_simple_bracket(tournament, teams, pairing_type, manual_pairings)
+        # Generate bracket or schedule
+        if tournament_format == 'swiss':
+            tournament.round_count = round_count or math.ceil(math.log2(team_count))
+            TournamentService._pair_swiss_round(
+                tournament, 1, TournamentService._ordered_team_ids(teams, pairing_type)
+            )
+        elif tournament_format == 'round_robin':
+            TournamentService._generate_round_robin(tournament, teams, pairing_type)
+        elif tournament_format == 'double_elimination':
+            TournamentService._generate_double_elimination(tournament, teams, pairing_type)
+        else:
+            TournamentService._generate_simple_bracket(tournament, teams, pairing_type, manual_pairings)
 
         db.session.commit()
+        # SQLite may reuse the ID of a deleted tournament
+        TournamentService.invalidate(tournament.id)
         return tournament
 
     @staticmethod
@@ -64,6 +137,9 @@ class TournamentService:
         - Teams are paired in round 1
         - If odd number of teams, one team gets a bye (automatic win to round 2)
         - Winners advance through subsequent rounds to the final
+
+        The bracket is built in memory and written with a constant number of
+        statements (see BracketBuilder), not one flush per match.
         """
         team_count = len(teams)
 
@@ -87,88 +163,278 @@ class TournamentService:
         # Total rounds = log2(bracket_size)
         total_rounds = int(math.log2(bracket_size))
 
-        # Build bracket from final backwards
-        matches_by_round = {}
-
-        # Create final match (last round)
-        final = Match(
-            tournament_id=tournament.id,
-            round_number=total_rounds,
-            position_in_round=0,
-            status='pending'
-        )
-        db.session.add(final)
-        db.session.flush()
-        matches_by_round[total_rounds] = [final]
-
-        # Create intermediate rounds working backwards
-        # Round 1 has most matches, final round has 1 match
-        for round_num in range(total_rounds - 1, 0, -1):
+        # Build the whole tree in memory, keyed by (bracket, round, position), then write it at once
+        builder = BracketBuilder()
+        for round_num in range(total_rounds, 0, -1):
             num_matches = 2 ** (total_rounds - round_num)
-            round_matches = []
-
             for pos in range(num_matches):
-                match = Match(
-                    tournament_id=tournament.id,
-                    round_number=round_num,
-                    position_in_round=pos,
-                    status='pending'
-                )
+                builder.add_match(round_num, pos)
 
                 # Link to next round
-                next_round_pos = pos // 2
-                next_match = matches_by_round[round_num + 1][next_round_pos]
-                match.next_match_id = next_match.id
-                match.next_match_position = 'team1' if pos % 2 == 0 else 'team2'
-
-                db.session.add(match)
-                db.session.flush()
-                round_matches.append(match)
-
-            matches_by_round[round_num] = round_matches
+                if round_num < total_rounds:
+                    builder.link(('main', round_num, pos), ('main', round_num + 1, pos // 2),
+                                 'team1' if pos % 2 == 0 else 'team2')
 
         # Assign teams to first round
-        first_round = matches_by_round[1]
+        first_round = [builder.matches[('main', 1, pos)] for pos in range(2 ** (total_rounds - 1))]
         team_idx = 0
 
+        # Seeded: 1 vs N, 2 vs N-1, ...; the byes go to the top seeds
+        if pairing_type == 'seeded':
+            ranked = [team_id for team_id, _ in TournamentService.get_seeding([team.id for team in teams])]
+            for pos, (team1_id, team2_id) in enumerate(seeded_pairs(ranked, bracket_size)):
+                match = first_round[pos]
+                match['team1_id'] = team1_id
+                match['team2_id'] = team2_id
+                if team2_id is None:
+                    match['is_bye'] = True
+                    builder.advance(('main', 1, pos), team1_id)
+
         # Use manual pairings if provided
-        if manual_pairings:
+        elif manual_pairings:
             for match_idx, match in enumerate(first_round):
                 if match_idx < len(manual_pairings):
                     t1_id, t2_id = manual_pairings[match_idx]
-                    match.team1_id = t1_id
-                    match.team2_id = t2_id
+                    match['team1_id'] = t1_id
+                    match['team2_id'] = t2_id
                 else:
                     # Fill remaining matches with unpaired teams
                     if team_idx < len(team_list):
-                        match.team1_id = team_list[team_idx].id
+                        match['team1_id'] = team_list[team_idx].id
                         team_idx += 1
                     if team_idx < len(team_list):
-                        match.team2_id = team_list[team_idx].id
+                        match['team2_id'] = team_list[team_idx].id
                         team_idx += 1
         else:
             # Auto-pair teams sequentially
-            for match in first_round:
+            for pos, match in enumerate(first_round):
                 if team_idx < len(team_list):
-                    match.team1_id = team_list[team_idx].id
+                    match['team1_id'] = team_list[team_idx].id
                     team_idx += 1
 
                 if team_idx < len(team_list):
-                    match.team2_id = team_list[team_idx].id
+                    match['team2_id'] = team_list[team_idx].id
                     team_idx += 1
-                elif match.team1_id:
-                    # Odd team - gets a bye
-                    match.is_bye = True
-                    match.status = 'completed'
-                    match.winner_team_id = match.team1_id
-
-                    # Advance them immediately
-                    if match.next_match_id:
-                        next_match = match.next_match
-                        if match.next_match_position == 'team1':
-                            next_match.team1_id = match.team1_id
-                        else:
-                            next_match.team2_id = match.team1_id
+                elif match['team1_id']:
+                    # Odd team - gets a bye and advances immediately
+                    match['is_bye'] = True
+                    builder.advance(('main', 1, pos), match['team1_id'])
+
+        builder.write(tournament.id)
+
+    @staticmethod
+    def _ordered_team_ids(teams: List[Team], pairing_type: str) -> List[int]:
+        """Get team IDs in placement order (best first when seeded, shuffled for random pairing)."""
+        if pairing_type == 'seeded':
+            return [team_id for team_id, _ in TournamentService.get_seeding([team.id for team in teams])]
+        team_ids = [team.id for team in teams]
+        if pairing_type == 'random':
+            random.shuffle(team_ids)
+        return team_ids
+
+    @staticmethod
+    def _generate_round_robin(tournament: Tournament, teams: List[Team], pairing_type: str):
+        """
+        Generate a round-robin schedule: every team plays every other team once.
+
+        Rounds come from the circle method (see pairing.circle_schedule), so
+        n teams play n - 1 rounds (n if odd, one team sitting out each
+        round). Matches have no next match; the tournament completes when
+        all are played and is won by the top of the standings.
+        """
+        team_ids = TournamentService._ordered_team_ids(teams, pairing_type)
+
+        builder = BracketBuilder()
+        for round_index, pairs in enumerate(circle_schedule(team_ids)):
+            for pos, (team1_id, team2_id) in enumerate(pairs):
+                builder.add_match(round_index + 1, pos, team1_id=team1_id, team2_id=team2_id)
+
+        builder.write(tournament.id)
+
+    @staticmethod
+    def _generate_double_elimination(tournament: Tournament, teams: List[Team], pairing_type: str):
+        """
+        Generate a double-elimination bracket.
+
+        For a bracket of size 2^W:
+        - Main (winners) bracket: W rounds as in single elimination, with
+          byes in the last first-round matches (see pairing.first_round_pairs),
+          or seeded 1 vs N with the byes to the top seeds
+        - Losers bracket: 2(W - 1) rounds. Round 1 pairs first-round losers;
+          each even round takes the previous round's winners against the
+          losers dropping from the next main round (in reverse order, to
+          delay rematches); each odd round halves the field
+        - Grand final: main bracket winner vs losers bracket winner, one match
+
+        Losers bracket matches that only one team can reach become byes that
+        pass the team on when it arrives (Match.receive_team); those no team
+        can reach are completed empty and feed nothing.
+        """
+        team_ids = TournamentService._ordered_team_ids(teams, pairing_type)
+
+        bracket_size = 1
+        while bracket_size < len(team_ids):
+            bracket_size *= 2
+        total_rounds = int(math.log2(bracket_size))
+
+        builder = BracketBuilder()
+        for round_num in range(1, total_rounds + 1):
+            for pos in range(bracket_size >> round_num):
+                builder.add_match(round_num, pos)
+                if round_num < total_rounds:
+                    builder.link(('main', round_num, pos), ('main', round_num + 1, pos // 2),
+                                 'team1' if pos % 2 == 0 else 'team2')
+
+        pair_first_round = seeded_pairs if pairing_type == 'seeded' else first_round_pairs
+        for pos, (team1_id, team2_id) in enumerate(pair_first_round(team_ids, bracket_size)):
+            match = builder.matches[('main', 1, pos)]
+            match['team1_id'] = team1_id
+            match['team2_id'] = team2_id
+            if team2_id is None:
+                match['is_bye'] = True
+                builder.advance(('main', 1, pos), team1_id)
+
+        grand_final = ('grand_final', 1, 0)
+        builder.add_match(1, 0, bracket='grand_final')
+        builder.link(('main', total_rounds, 0), grand_final, 'team1')
+
+        if total_rounds == 1:
+            builder.link_loser(('main', 1, 0), grand_final, 'team2')
+            builder.write(tournament.id)
+            return
+
+        # Which matches will produce a team to send on, and how many teams each losers match expects
+        live = {key: True for key in builder.matches}
+        incoming = {}
+
+        def feed(source, target, slot, loser=False):
+            if loser:
+                # First-round byes have no loser
+                if builder.matches[source]['is_bye']:
+                    return
+                builder.link_loser(source, target, slot)
+            else:
+                if not live[source]:
+                    return
+                builder.link(source, target, slot)
+            incoming[target] = incoming.get(target, 0) + 1
+
+        def add_losers_match(round_num, pos):
+            builder.add_match(round_num, pos, bracket='losers')
+            incoming[('losers', round_num, pos)] = 0
+
+        def settle(key):
+            match = builder.matches[key]
+            if incoming[key] < 2:
+                match['is_bye'] = True
+            if incoming[key] == 0:
+                match['status'] = 'completed'
+            live[key] = incoming[key] > 0
+
+        # Losers round 1: first-round losers paired up
+        for pos in range(bracket_size >> 2):
+            add_losers_match(1, pos)
+            feed(('main', 1, 2 * pos), ('losers', 1, pos), 'team1', loser=True)
+            feed(('main', 1, 2 * pos + 1), ('losers', 1, pos), 'team2', loser=True)
+            settle(('losers', 1, pos))
+
+        for main_round in range(2, total_rounds + 1):
+            # Drop-in round: survivors vs losers of this main round
+            drop_round = 2 * (main_round - 1)
+            count = bracket_size >> main_round
+            for pos in range(count):
+                add_losers_match(drop_round, pos)
+                feed(('losers', drop_round - 1, pos), ('losers', drop_round, pos), 'team1')
+                feed(('main', main_round, count - 1 - pos), ('losers', drop_round, pos), 'team2', loser=True)
+                settle(('losers', drop_round, pos))
+
+            if main_round == total_rounds:
+                break
+
+            # Consolidation round: survivors play each other
+            for pos in range(count // 2):
+                add_losers_match(drop_round + 1, pos)
+                feed(('losers', drop_round, 2 * pos), ('losers', drop_round + 1, pos), 'team1')
+                feed(('losers', drop_round, 2 * pos + 1), ('losers', drop_round + 1, pos), 'team2')
+                settle(('losers', drop_round + 1, pos))
+
+        builder.link(('losers', 2 * (total_rounds - 1), 0), grand_final, 'team2')
+        builder.write(tournament.id)
+
+    @staticmethod
+    def _pair_swiss_round(tournament: Tournament, round_number: int,
+                          ranked_team_ids: Optional[List[int]] = None):
+        """
+        Add the next Swiss round's matches.
+
+        Teams are paired in standings order (wins, then Buchholz) without
+        rematches (see pairing.swiss_pairings); with an odd count one team
+        gets a bye, recorded as a completed is_bye match it wins.
+
+        Args:
+            tournament: Swiss tournament
+            round_number: Round to create
+            ranked_team_ids: Team order for round 1 (later rounds use the standings)
+        """
+        played, had_bye = set(), set()
+        if ranked_team_ids is None:
+            ranked_team_ids = [row.team_id for row in TournamentService.get_standings(tournament.id)]
+            for team1_id, team2_id, is_bye in db.session.query(
+                Match.team1_id, Match.team2_id, Match.is_bye
+            ).filter(Match.tournament_id == tournament.id):
+                if is_bye:
+                    had_bye.add(team1_id)
+                else:
+                    played.add(frozenset((team1_id, team2_id)))
+
+        pairs, bye_team_id = swiss_pairings(ranked_team_ids, played, had_bye)
+
+        builder = BracketBuilder()
+        for pos, (team1_id, team2_id) in enumerate(pairs):
+            builder.add_match(round_number, pos, team1_id=team1_id, team2_id=team2_id)
+        if bye_team_id is not None:
+            builder.add_match(round_number, len(pairs), team1_id=bye_team_id, is_bye=True,
+                              status='completed', winner_team_id=bye_team_id)
+        builder.write(tournament.id)
+
+    @staticmethod
+    def get_seeding(team_ids: List[int]) -> List[Tuple[int, float]]:
+        """
+        Rank teams by historical performance with one aggregate query.
+
+        A team's record follows its name (case-insensitive) across game
+        nights, since each night has its own Team rows. Points are all game
+        points it has scored plus SEED_MATCH_WIN_POINTS per tournament match
+        won (byes excluded). Teams without history get 0; ties go to the
+        lower team ID.
+
+        Args:
+            team_ids: Teams to seed
+
+        Returns:
+            List of (team_id, points), best first
+        """
+        earned = union_all(
+            select(Score.team_id.label('team_id'), func.coalesce(Score.points, 0).label('points')),
+            select(Match.winner_team_id, literal(SEED_MATCH_WIN_POINTS))
+            .where(Match.status == 'completed', Match.is_bye.is_(False), Match.winner_team_id.isnot(None))
+        ).subquery('earned')
+
+        past_team = aliased(Team)
+        history = select(
+            func.lower(past_team.name).label('name_key'), func.sum(earned.c.points).label('points')
+        ).join(past_team, past_team.id == earned.c.team_id).group_by(
+            func.lower(past_team.name)
+        ).subquery('history')
+
+        points = func.coalesce(history.c.points, 0)
+        rows = db.session.execute(
+            select(Team.id, points)
+            .outerjoin(history, history.c.name_key == func.lower(Team.name))
+            .where(Team.id.in_(team_ids))
+            .order_by(points.desc(), Team.id)
+        )
+        return [(team_id, team_points) for team_id, team_points in rows]
 
     @staticmethod
     def get_tournament_by_game(game_id: int) -> Optional[Tournament]:
@@ -176,45 +442,176 @@ class TournamentService:
         return Tournament.query.filter_by(game_id=game_id).first()
 
     @staticmethod
+    @reads_from_replica
     def get_bracket_structure(tournament_id: int) -> Dict:
         """
         Get the bracket structure for display.
 
+        The bracket comes from the cached read model (see get_bracket_view),
+        so a page view costs the tournament lookup and nothing per match.
+
         Returns:
-            Dictionary with rounds and matches organized for visualization
+            Dictionary with the tournament, its main bracket matches by round
+            as BracketMatchView tuples, the sorted round numbers, every
+            bracket section (BracketSection) and the standings
         """
         tournament = Tournament.query.get_or_404(tournament_id)
-        matches = Match.query.filter_by(tournament_id=tournament_id).order_by(
-            Match.round_number, Match.position_in_round
-        ).all()
-
-        # Organize by rounds
-        bracket = {}
-        for match in matches:
-            round_num = match.round_number
-            if round_num not in bracket:
-                bracket[round_num] = []
-
-            bracket[round_num].append({
-                'id': match.id,
-                'position': match.position_in_round,
-                'team1': {'id': match.team1_id, 'name': match.team1.name, 'color': match.team1.color} if match.team1 else None,
-                'team2': {'id': match.team2_id, 'name': match.team2.name, 'color': match.team2.color} if match.team2 else None,
-                'team1_score': match.team1_score,
-                'team2_score': match.team2_score,
-                'winner_id': match.winner_team_id,
-                'status': match.status,
-                'is_bye': match.is_bye,
-                'is_play_in': match.is_play_in,
-                'is_ready': match.is_ready
-            })
+        view = TournamentService.get_bracket_view(tournament_id)
 
         return {
             'tournament': tournament,
-            'bracket': bracket,
-            'rounds': sorted(bracket.keys())
+            'bracket': view.bracket,
+            'rounds': list(view.rounds),
+            'sections': view.sections,
+            'standings': view.standings
         }
 
+    @staticmethod
+    def get_bracket_view(tournament_id: int) -> BracketView:
+        """
+        Get the cached bracket read model for a tournament.
+
+        Served from an in-process LRU cache; match results, resets and team
+        changes call invalidate() so the next read rebuilds it.
+
+        Args:
+            tournament_id: Tournament ID
+
+        Returns:
+            BracketView with matches by section and round, and the standings
+        """
+        return bracket_cache.get_or_load(
+            tournament_id,
+            lambda: TournamentService._build_bracket_view(tournament_id)
+        )
+
+    @staticmethod
+    @reads_from_primary
+    def _build_bracket_view(tournament_id: int) -> BracketView:
+        """
+        Load a tournament's matches and both teams' names and colors in one query.
+        """
+        team1 = aliased(Team)
+        team2 = aliased(Team)
+        rows = db.session.query(
+            Match.id, Match.bracket, Match.round_number, Match.position_in_round,
+            Match.team1_id, team1.name, team1.color,
+            Match.team2_id, team2.name, team2.color,
+            Match.team1_score, Match.team2_score, Match.winner_team_id,
+            Match.status, Match.is_bye, Match.is_play_in
+        ).outerjoin(team1, Match.team1_id == team1.id).outerjoin(
+            team2, Match.team2_id == team2.id
+        ).filter(Match.tournament_id == tournament_id).order_by(
+            Match.round_number, Match.position_in_round
+        ).all()
+
+        # Organize by section and round
+        sections = {}
+        for (match_id, section, round_num, position, team1_id, team1_name, team1_color,
+             team2_id, team2_name, team2_color, team1_score, team2_score,
+             winner_id, status, is_bye, is_play_in) in rows:
+            bracket = sections.setdefault(section or 'main', {})
+            bracket.setdefault(round_num, []).append(BracketMatchView(
+                id=match_id,
+                position=position,
+                team1=BracketTeamView(team1_id, team1_name, team1_color) if team1_id is not None else None,
+                team2=BracketTeamView(team2_id, team2_name, team2_color) if team2_id is not None else None,
+                team1_score=team1_score,
+                team2_score=team2_score,
+                winner_id=winner_id,
+                status=status,
+                is_bye=is_bye,
+                is_play_in=is_play_in,
+                is_ready=team1_id is not None and team2_id is not None
+            ))
+
+        sections = tuple(
+            BracketSection(
+                name=name,
+                bracket={round_num: tuple(matches) for round_num, matches in sections[name].items()},
+                rounds=tuple(sorted(sections[name]))
+            )
+            for name in BRACKET_SECTIONS if name in sections
+        )
+        main = sections[0] if sections and sections[0].name == 'main' else BracketSection('main', {}, ())
+
+        return BracketView(
+            tournament_id=tournament_id,
+            bracket=main.bracket,
+            rounds=main.rounds,
+            sections=sections,
+            standings=TournamentService.get_standings(tournament_id)
+        )
+
+    @staticmethod
+    def get_standings(tournament_id: int) -> Tuple[BracketStandingView, ...]:
+        """
+        Rank a tournament's teams with one aggregate query.
+
+        Order: wins, then Buchholz (the sum of the wins of every opponent
+        played, so a record against stronger opposition ranks higher), then
+        score difference, then team ID. A bye counts as a win but adds no
+        opponent.
+
+        Args:
+            tournament_id: Tournament ID
+
+        Returns:
+            Tuple of BracketStandingView, best first; every team with a match
+            appears, played or not
+        """
+        completed = Match.status == 'completed'
+        base = Match.tournament_id == tournament_id
+        # One row per team per match, from that team's side
+        sides = union_all(
+            select(Match.team1_id.label('team_id'), Match.team2_id.label('opponent_id'),
+                   Match.winner_team_id.label('winner_id'), Match.team1_score.label('score_for'),
+                   Match.team2_score.label('score_against'), completed.label('completed'))
+            .where(base, Match.team1_id.isnot(None)),
+            select(Match.team2_id, Match.team1_id, Match.winner_team_id, Match.team2_score,
+                   Match.team1_score, completed)
+            .where(base, Match.team2_id.isnot(None))
+        ).cte('sides')
+
+        played = and_(sides.c.completed, sides.c.opponent_id.isnot(None))
+        record = select(
+            sides.c.team_id,
+            func.sum(case((played, 1), else_=0)).label('played'),
+            func.sum(case((sides.c.winner_id == sides.c.team_id, 1), else_=0)).label('wins'),
+            func.sum(case((and_(played, sides.c.winner_id != sides.c.team_id), 1), else_=0)).label('losses'),
+            func.sum(case((played, func.coalesce(sides.c.score_for, 0)), else_=0)).label('score_for'),
+            func.sum(case((played, func.coalesce(sides.c.score_against, 0)), else_=0)).label('score_against')
+        ).group_by(sides.c.team_id).cte('record')
+
+        opponent = record.alias('opponent')
+        buchholz = select(
+            sides.c.team_id, func.sum(opponent.c.wins).label('buchholz')
+        ).join(opponent, opponent.c.team_id == sides.c.opponent_id).where(
+            sides.c.completed
+        ).group_by(sides.c.team_id).subquery('buchholz')
+
+        buchholz_score = func.coalesce(buchholz.c.buchholz, 0)
+        rows = db.session.execute(
+            select(record.c.team_id, Team.name, Team.color, record.c.played, record.c.wins,
+                   record.c.losses, buchholz_score, record.c.score_for, record.c.score_against)
+            .join(Team, Team.id == record.c.team_id)
+            .outerjoin(buchholz, buchholz.c.team_id == record.c.team_id)
+            .order_by(record.c.wins.desc(), buchholz_score.desc(),
+                      (record.c.score_for - record.c.score_against).desc(), record.c.team_id)
+        )
+        return tuple(BracketStandingView(rank, *row) for rank, row in enumerate(rows, start=1))
+
+    @staticmethod
+    def invalidate(tournament_id=ALL_TOURNAMENTS):
+        """
+        Drop a cached bracket view after a write, in every worker.
+
+        Args:
+            tournament_id: Tournament whose matches changed (default: all,
+                e.g. after a team is renamed or deleted)
+        """
+        invalidation_bus.publish(TOURNAMENT_TOPIC, tournament_id)
+
     @staticmethod
     def update_match_result(match_id: int, team1_score: Optional[float],
                            team2_score: Optional[float], winner_team_id: int):
@@ -242,34 +639,94 @@ class TournamentService:
 
         # Check if tournament is complete
         tournament = match.tournament
-        if match.next_match_id is None:  # This was the final match
+        if tournament.format == 'round_robin':
+            TournamentService._check_round_robin_complete(tournament)
+        elif tournament.format == 'swiss':
+            TournamentService._advance_swiss(tournament, match.round_number)
+        elif match.next_match_id is None:  # This was the final match
             tournament.is_completed = True
             tournament.winner_team_id = winner_team_id
 
         db.session.commit()
+        TournamentService.invalidate(tournament.id)
+
+    @staticmethod
+    def _check_round_robin_complete(tournament: Tournament):
+        """Complete a round robin once every match is played; the standings leader wins."""
+        db.session.flush()
+        pending = Match.query.filter(Match.tournament_id == tournament.id, Match.status != 'completed').count()
+
+        if not pending:
+            tournament.is_completed = True
+            tournament.winner_team_id = TournamentService.get_standings(tournament.id)[0].team_id
+
+    @staticmethod
+    def _advance_swiss(tournament: Tournament, round_number: int):
+        """
+        Pair the next Swiss round once the current one is played, or finish after the last.
+
+        Editing a result from an earlier round updates the standings but
+        does not re-pair rounds already created.
+        """
+        db.session.flush()
+        current_round = db.session.query(func.max(Match.round_number)).filter(
+            Match.tournament_id == tournament.id
+        ).scalar()
+        if round_number != current_round:
+            return
+
+        pending = Match.query.filter(
+            Match.tournament_id == tournament.id,
+            Match.round_number == current_round,
+            Match.status != 'completed'
+        ).count()
+        if pending:
+            return
+
+        if current_round < tournament.round_count:
+            TournamentService._pair_swiss_round(tournament, current_round + 1)
+        else:
+            tournament.is_completed = True
+            tournament.winner_team_id = TournamentService.get_standings(tournament.id)[0].team_id
 
     @staticmethod
     def reset_tournament(tournament_id: int):
         """Reset tournament to initial state."""
         tournament = Tournament.query.get_or_404(tournament_id)
 
+        # Later Swiss rounds were paired from results; only round 1 is kept
+        if tournament.format == 'swiss':
+            Match.query.filter(
+                Match.tournament_id == tournament_id, Match.round_number > 1
+            ).delete(synchronize_session=False)
+
         # Reset all matches
         matches = Match.query.filter_by(tournament_id=tournament_id).all()
 
+        # Slots filled by an earlier match's winner or loser; the rest were set at creation
+        fed_slots = {(m.next_match_id, m.next_match_position) for m in matches if m.next_match_id}
+        fed_slots |= {(m.loser_next_match_id, m.loser_next_match_position) for m in matches if m.loser_next_match_id}
+
         # First, clear all next round progressions
         for match in matches:
-            if not match.is_bye:
-                match.status = 'pending'
-                match.team1_score = None
-                match.team2_score = None
-                match.winner_team_id = None
-
-                # Clear next round assignments (keep only round 1 teams)
-                if match.round_number > 1:
-                    match.team1_id = None
-                    match.team2_id = None
+            fed = [slot for slot in ('team1', 'team2') if (match.id, slot) in fed_slots]
+            if match.is_bye and not fed:
+                continue  # First-round bye, or a losers bracket match no team can reach
+
+            match.status = 'pending'
+            match.team1_score = None
+            match.team2_score = None
+            match.winner_team_id = None
+            for slot in fed:
+                setattr(match, f'{slot}_id', None)
+
+        # Then advance first-round byes again
+        for match in matches:
+            if match.is_bye and match.winner_team_id and match.next_match_id:
+                match.next_match.receive_team(match.winner_team_id, match.next_match_position)
 
         tournament.is_completed = False
         tournament.winner_team_id = None
 
         db.session.commit()
+        TournamentService.invalidate(tournament_id)
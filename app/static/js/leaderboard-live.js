@@ -0,0 +1,71 @@
+/**
+ * Live Leaderboard
+ * Joins the displayed game night's leaderboard room and applies
+ * debounced standings deltas in place instead of reloading the page
+ */
+
+(function () {
+    const container = document.querySelector('[data-game-night-id]');
+    if (!container || typeof io === 'undefined') {
+        return;
+    }
+
+    const gameNightId = Number(container.dataset.gameNightId);
+    const socket = io({
+        transports: ['websocket', 'polling'],
+        reconnection: true,
+        reconnectionDelay: 1000
+    });
+
+    socket.on('connect', () => {
+        socket.emit('join_leaderboard', { game_night_id: gameNightId });
+    });
+
+    socket.on('leaderboard_delta', (delta) => {
+        if (delta.game_night_id !== gameNightId) {
+            return;
+        }
+
+        // Added or removed teams change the table layout; let the server render it
+        const hasNewTeam = delta.changes.some(
+            (change) => !container.querySelector(`[data-team-id="${change.team_id}"]`)
+        );
+        if (delta.removed.length || hasNewTeam) {
+            window.location.reload();
+            return;
+        }
+
+        delta.changes.forEach(applyChange);
+        reorderRows();
+    });
+
+    function applyChange(change) {
+        container.querySelectorAll(`[data-team-id="${change.team_id}"]`).forEach((row) => {
+            row.dataset.rank = change.rank;
+
+            const rank = row.querySelector('[data-team-rank]');
+            if (rank) {
+                rank.textContent = change.rank;
+            }
+
+            const total = row.querySelector('[data-team-total]');
+            if (total) {
+                total.textContent = `${change.points}${total.dataset.suffix || ''}`;
+            }
+        });
+    }
+
+    function reorderRows() {
+        const parents = new Set(
+            Array.from(container.querySelectorAll('[data-team-id]'), (row) => row.parentElement)
+        );
+
+        parents.forEach((parent) => {
+            const rows = Array.from(parent.children).filter((row) => row.dataset.teamId);
+            rows.sort((a, b) => Number(a.dataset.rank) - Number(b.dataset.rank));
+
+            // Rows sit after any header elements, so re-append in rank order
+            rows.forEach((row) => parent.appendChild(row));
+        });
+    }
+})();
@@ -10,6 +10,7 @@ class GameSocketClient {
         this.connected = false;
         this.activeLocks = new Map(); // teamId_field -> boolean
         this.updateDebounceTimers = new Map();
+        this.latency = 0; // one-way latency to the server in seconds (see syncClock)
         this.init();
     }
 
@@ -28,6 +29,7 @@ class GameSocketClient {
             this.connected = true;
             this.updateConnectionStatus(true);
             this.joinGame();
+            this.syncClock();
         });
 
         this.socket.on('disconnect', () => {
@@ -98,10 +100,16 @@ class GameSocketClient {
                 data.time,
                 data.average,
                 data.all_times,
-                data.timer_count
+                data.timer_count,
+                data.confidence
             );
         });
 
+        this.socket.on('clock_sync', (data) => {
+            // Half the round trip approximates the one-way delay of timer events
+            this.latency = Math.max(0, (Date.now() - data.client_time) / 2000);
+        });
+
         this.socket.on('timers_cleared', (data) => {
             console.log('[WS] Timers cleared:', data);
             this.clearTimerDisplay(data.team_id);
@@ -186,14 +194,21 @@ class GameSocketClient {
         }, 300)); // 300ms debounce
     }
 
+    syncClock() {
+        if (!this.connected) return;
+        this.socket.emit('clock_sync', { client_time: Date.now() });
+    }
+
     startTimer(teamId) {
         if (!this.connected) return;
 
         console.log('[WS] Starting timer:', teamId);
         this.socket.emit('start_timer', {
             game_id: this.gameId,
-            team_id: teamId
+            team_id: teamId,
+            latency: this.latency
         });
+        this.syncClock();
     }
 
     stopTimer(teamId, time) {
@@ -203,7 +218,8 @@ class GameSocketClient {
         this.socket.emit('stop_timer', {
             game_id: this.gameId,
             team_id: teamId,
-            time_value: time  // Changed from 'time' to 'time_value' to match server expectation
+            time_value: time,  // Changed from 'time' to 'time_value' to match server expectation
+            latency: this.latency
         });
     }
 
@@ -357,7 +373,7 @@ class GameSocketClient {
         }
     }
 
-    updateTimerDisplay(teamId, time, average, allTimes, timerCount) {
+    updateTimerDisplay(teamId, time, average, allTimes, timerCount, confidence) {
         // Only update if this is the currently selected team
         if (!window.currentTeamId || String(window.currentTeamId) !== String(teamId)) return;
 
@@ -378,6 +394,9 @@ class GameSocketClient {
 
             // Update average
             averageDisplay.textContent = `Avg: ${parseFloat(average).toFixed(3)}s`;
+            if (confidence !== undefined && confidence !== null) {
+                averageDisplay.textContent += ` (${Math.round(confidence * 100)}% confidence)`;
+            }
 
             // Update list of individual times
             if (allTimes && allTimes.length > 0) {
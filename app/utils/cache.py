@@ -0,0 +1,143 @@
+"""Bounded in-process caches."""
+from collections import OrderedDict
+from threading import Lock
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Thread-safe, size-bounded cache with least-recently-used eviction.
+
+    Intended for read-heavy data (e.g. leaderboard snapshots) that is
+    explicitly invalidated by the code paths that change it. Values should
+    be immutable, since the same object is handed to every caller.
+    """
+
+    def __init__(self, maxsize=32):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept (0 disables caching)
+        """
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._mutex = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Bumped on every invalidation so loads that raced a write are not stored
+        self._generation = 0
+
+    def get(self, key, default=None):
+        """Get a cached value, marking it as most recently used.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            The cached value, or default if not present
+        """
+        with self._mutex:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return default
+
+    def set(self, key, value, generation=None):
+        """Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            generation: If given, only store when no invalidation happened since
+        """
+        if self.maxsize <= 0:
+            return
+
+        with self._mutex:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_load(self, key, loader):
+        """Get a cached value, calling loader() and caching its result on a miss.
+
+        Args:
+            key: Cache key
+            loader: Zero-argument callable producing the value
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        with self._mutex:
+            generation = self._generation
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = loader()
+            self.set(key, value, generation)
+        return value
+
+    def invalidate(self, *keys):
+        """Drop specific entries.
+
+        Args:
+            *keys: Keys to remove (missing keys are ignored)
+
+        Returns:
+            int: Number of entries removed
+        """
+        removed = 0
+        with self._mutex:
+            self._generation += 1
+            for key in keys:
+                if self._entries.pop(key, _MISSING) is not _MISSING:
+                    removed += 1
+        return removed
+
+    def clear(self):
+        """Drop every entry (counters are kept)."""
+        with self._mutex:
+            self._generation += 1
+            self._entries.clear()
+
+    def configure(self, maxsize):
+        """Change the size bound, evicting entries that no longer fit.
+
+        Args:
+            maxsize: New maximum number of entries
+        """
+        with self._mutex:
+            self.maxsize = maxsize
+            while len(self._entries) > max(maxsize, 0):
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self):
+        """Get cache counters.
+
+        Returns:
+            dict: size, maxsize, hits, misses and evictions
+        """
+        with self._mutex:
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+    def __contains__(self, key):
+        with self._mutex:
+            return key in self._entries
+
+    def __len__(self):
+        with self._mutex:
+            return len(self._entries)
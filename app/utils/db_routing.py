@@ -0,0 +1,96 @@
+"""Read/write routing between the primary database and an optional read engine.
+
+When a ``read`` bind is configured (READ_DATABASE_URL), plain SELECTs from
+GET requests and from service methods decorated with ``@reads_from_replica``
+run on the read engine, so public page traffic does not compete with
+scoring writes for primary connections. Everything else uses the primary:
+flushes, INSERT/UPDATE/DELETE statements, raw ``session.connection()``
+calls, and any query made after the session has written, so a request
+always reads its own writes.
+
+The read engine can be a PostgreSQL streaming replica, or for SQLite in
+WAL mode the same database file opened read-only
+(``sqlite:///file:/path/to/gamenight.db?mode=ro&uri=true``).
+"""
+from functools import wraps
+from flask import request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+
+# Name of the read engine in SQLALCHEMY_BINDS
+READ_BIND_KEY = 'read'
+
+# session.info flags
+READ_ONLY_KEY = 'use_read_engine'
+WROTE_KEY = 'wrote_to_primary'
+
+SAFE_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+
+
+class RoutingSession(Session):
+    """Session that sends read-only SELECTs to the read engine when allowed."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        """Select the read engine for SELECTs in read-only mode, else the primary."""
+        if bind is None and self._use_read_engine(clause):
+            return self._db.engines[READ_BIND_KEY]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def _use_read_engine(self, clause):
+        return (
+            self.info.get(READ_ONLY_KEY, False)
+            and not self.info.get(WROTE_KEY, False)
+            and not self._flushing
+            and getattr(clause, 'is_select', False)
+            and READ_BIND_KEY in self._db.engines
+        )
+
+
+@event.listens_for(RoutingSession, 'after_flush')
+def _stick_to_primary(session, flush_context):
+    """Keep reading from the primary once the session has written."""
+    session.info[WROTE_KEY] = True
+
+
+def _route_reads(use_read_engine):
+    """Build a decorator that fixes where a function's SELECTs run."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            from app import db
+
+            info = db.session.info
+            previous = info.get(READ_ONLY_KEY, False)
+            info[READ_ONLY_KEY] = use_read_engine
+            try:
+                return func(*args, **kwargs)
+            finally:
+                info[READ_ONLY_KEY] = previous
+
+        return wrapper
+
+    return decorator
+
+
+# Run a read-only service method's queries on the read engine (no effect without a read bind)
+reads_from_replica = _route_reads(True)
+
+# Read from the primary even during a GET request, e.g. to fill a cache that
+# must not be seeded from a lagging replica
+reads_from_primary = _route_reads(False)
+
+
+def init_read_routing(app):
+    """Route queries made while handling GET, HEAD and OPTIONS requests to the read engine.
+
+    Args:
+        app: Flask application instance
+    """
+    if READ_BIND_KEY not in (app.config.get('SQLALCHEMY_BINDS') or {}):
+        return
+
+    @app.before_request
+    def use_read_engine_for_safe_methods():
+        """Mark the request's session read-only for safe HTTP methods."""
+        from app import db
+        db.session.info[READ_ONLY_KEY] = request.method in SAFE_METHODS
@@ -0,0 +1,248 @@
+"""Cross-worker cache invalidation bus.
+
+Gunicorn runs several worker processes, each with its own in-process
+caches. Code that changes shared data publishes an invalidation on a
+topic; every worker's subscribers for that topic are called so they can
+drop stale entries.
+
+Backends:
+    local     In-process only (single worker, development, tests)
+    database  Append-only ``change_event`` table in the application
+              database. Needs no extra services; workers poll it for new
+              sequence numbers at most every INVALIDATION_POLL_INTERVAL
+              seconds, re-reading a trailing window so events that
+              commit out of sequence order are not skipped.
+"""
+import json
+import os
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta
+from threading import Lock
+
+from sqlalchemy import func, select
+
+from app import db
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class LocalBackend:
+    """Backend for a single process: nothing crosses process boundaries."""
+
+    name = 'local'
+
+    def publish(self, origin, topic, key):
+        """Publishing is a no-op; local subscribers are notified directly."""
+
+    def poll(self):
+        """No remote events ever arrive.
+
+        Returns:
+            list: Always empty
+        """
+        return []
+
+
+class DatabaseBackend:
+    """Backend storing events as a monotonically increasing change sequence."""
+
+    name = 'database'
+
+    def __init__(self, retention_seconds=3600, prune_every=200, lookback=100):
+        """Initialize the backend.
+
+        Args:
+            retention_seconds: Age after which events are pruned
+            prune_every: Prune old events once every N publishes
+            lookback: Sequence numbers below the highest seen that are re-read on
+                every poll. Sequence numbers are assigned before commit, so with
+                concurrent writers (or on PostgreSQL) a lower ID can become
+                visible after a higher one has been read.
+        """
+        self.retention_seconds = retention_seconds
+        self.prune_every = prune_every
+        self.lookback = lookback
+        self.last_seen_id = None
+        self.seen_ids = set()  # IDs within the lookback window already returned
+        self._publish_count = 0
+
+    def _table(self):
+        from app.models.change_event import ChangeEvent
+        return ChangeEvent.__table__
+
+    def start(self):
+        """Skip events that predate this worker (its caches start empty)."""
+        table = self._table()
+        with db.engine.connect() as conn:
+            self.last_seen_id = conn.execute(select(func.max(table.c.id))).scalar() or 0
+            self.seen_ids = set(conn.execute(
+                select(table.c.id).where(table.c.id > self.last_seen_id - self.lookback)
+            ).scalars())
+
+    def publish(self, origin, topic, key):
+        """Append an event in its own transaction.
+
+        Args:
+            origin: ID of the publishing worker
+            topic: Event topic
+            key: JSON-serializable key
+        """
+        table = self._table()
+        with db.engine.begin() as conn:
+            conn.execute(table.insert().values(
+                origin=origin, topic=topic, key=json.dumps(key), created_at=datetime.utcnow()
+            ))
+
+            self._publish_count += 1
+            if self._publish_count % self.prune_every == 0:
+                cutoff = datetime.utcnow() - timedelta(seconds=self.retention_seconds)
+                conn.execute(table.delete().where(table.c.created_at < cutoff))
+
+    def poll(self):
+        """Fetch events committed since the last poll.
+
+        Returns:
+            list: (origin, topic, key) tuples in sequence order
+        """
+        if self.last_seen_id is None:
+            self.start()
+
+        table = self._table()
+        with db.engine.connect() as conn:
+            rows = conn.execute(
+                select(table.c.id, table.c.origin, table.c.topic, table.c.key)
+                .where(table.c.id > self.last_seen_id - self.lookback)
+                .order_by(table.c.id)
+            ).all()
+
+        rows = [row for row in rows if row[0] not in self.seen_ids]
+        if rows:
+            self.last_seen_id = max(self.last_seen_id, rows[-1][0])
+            self.seen_ids.update(row[0] for row in rows)
+            floor = self.last_seen_id - self.lookback
+            self.seen_ids = {event_id for event_id in self.seen_ids if event_id > floor}
+        return [(origin, topic, json.loads(key) if key is not None else None)
+                for _, origin, topic, key in rows]
+
+
+class InvalidationBus:
+    """Publish/subscribe hub for cache invalidations with a pluggable backend."""
+
+    backends = {
+        'local': LocalBackend,
+        'database': DatabaseBackend
+    }
+
+    def __init__(self, backend=None, poll_interval=0.0):
+        """Initialize the bus.
+
+        Args:
+            backend: Backend instance (defaults to LocalBackend)
+            poll_interval: Minimum seconds between backend polls
+        """
+        self.backend = backend or LocalBackend()
+        self.poll_interval = poll_interval
+        self.origin = f'{os.getpid()}-{uuid.uuid4().hex[:8]}'
+        self.subscribers = defaultdict(list)
+        self._last_poll = 0.0
+        self._poll_mutex = Lock()
+
+    def init_app(self, app):
+        """Configure the backend from app config and poll before each request.
+
+        Args:
+            app: Flask application instance
+        """
+        backend_name = app.config.get('INVALIDATION_BACKEND', 'local')
+        if backend_name not in self.backends:
+            from app.exceptions import ConfigurationError
+            raise ConfigurationError(
+                f"Unknown invalidation backend '{backend_name}'", config_key='INVALIDATION_BACKEND'
+            )
+
+        self.backend = self.backends[backend_name]()
+        self.poll_interval = app.config.get('INVALIDATION_POLL_INTERVAL', 0.25)
+        self._last_poll = 0.0
+
+        @app.before_request
+        def poll_invalidations():
+            """Apply invalidations published by other workers."""
+            self.poll()
+
+        logger.info(f"Invalidation bus using '{self.backend.name}' backend (origin={self.origin})")
+
+    def subscribe(self, topic, callback):
+        """Register a callback for a topic.
+
+        Args:
+            topic: Event topic
+            callback: Callable taking the event key
+        """
+        if callback not in self.subscribers[topic]:
+            self.subscribers[topic].append(callback)
+
+    def publish(self, topic, key=None, local=True):
+        """Notify local subscribers immediately and other workers via the backend.
+
+        Args:
+            topic: Event topic
+            key: JSON-serializable key (e.g. a game night ID)
+            local: Also notify this worker's subscribers; pass False when the
+                   publisher has already brought its own caches up to date
+        """
+        if local:
+            self._dispatch(topic, key)
+        try:
+            self.backend.publish(self.origin, topic, key)
+        except Exception as e:
+            # Local caches are already correct; other workers catch up on their next write
+            logger.error(f"Failed to publish invalidation {topic}:{key}: {e}", exc_info=True)
+
+    def poll(self, force=False):
+        """Apply events from other workers, at most once per poll_interval.
+
+        Args:
+            force: Poll even if the interval has not elapsed
+
+        Returns:
+            int: Number of remote events applied
+        """
+        now = time.monotonic()
+        if not force and now - self._last_poll < self.poll_interval:
+            return 0
+
+        # Only one thread per worker needs to poll at a time
+        if not self._poll_mutex.acquire(blocking=False):
+            return 0
+        try:
+            self._last_poll = now
+            try:
+                events = self.backend.poll()
+            except Exception as e:
+                logger.error(f"Failed to poll invalidations: {e}", exc_info=True)
+                return 0
+
+            applied = 0
+            for origin, topic, key in events:
+                if origin == self.origin:
+                    continue
+                self._dispatch(topic, key)
+                applied += 1
+            return applied
+        finally:
+            self._poll_mutex.release()
+
+    def _dispatch(self, topic, key):
+        """Call every local subscriber of a topic."""
+        for callback in self.subscribers.get(topic, []):
+            try:
+                callback(key)
+            except Exception as e:
+                logger.error(f"Invalidation subscriber failed for {topic}:{key}: {e}", exc_info=True)
+
+
+# Shared per-process bus, configured in create_app
+invalidation_bus = InvalidationBus()
@@ -1,6 +1,11 @@
 """Helper functions for route handlers."""
+import hashlib
+import time
+from flask import request, session, make_response, current_app
+from flask_wtf.csrf import generate_csrf
 from app.models.team import Team
 from app.services.game_night_service import GameNightService
+from app.services.revision_service import RevisionService
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -148,3 +153,76 @@ def is_ajax_request(request):
         Boolean indicating if request is AJAX
     """
     return request.headers.get('X-Requested-With') == 'XMLHttpRequest'
+
+
+def page_etag(game_night_id, *context):
+    """
+    Build an ETag for a page rendered from a game night's data.
+
+    Combines the endpoint, the game night's revision and the viewer, so it
+    changes whenever a score, game or team write would change the page.
+    Pages with forms embed the viewer's CSRF token, so the session's token
+    (and, with WTF_CSRF_TIME_LIMIT set, the half-limit window it was signed
+    in) is mixed in as well; a 304 never keeps an expired token in a form.
+
+    Args:
+        game_night_id: Game night the page displays (None = all game nights)
+        *context: Other values the page depends on (e.g. active game night ID)
+
+    Returns:
+        Opaque ETag string
+    """
+    from flask_login import current_user
+
+    viewer = current_user.get_id() if current_user.is_authenticated else ''
+    if current_user.is_authenticated:
+        # Create the session's token now so the render that follows embeds the one hashed here
+        generate_csrf()
+    csrf_token = session.get(current_app.config.get('WTF_CSRF_FIELD_NAME', 'csrf_token'), '')
+    time_limit = current_app.config.get('WTF_CSRF_TIME_LIMIT', 3600)
+    csrf_window = int(time.time() // (time_limit / 2)) if time_limit else ''
+
+    parts = (request.endpoint, game_night_id, RevisionService.get_revision(game_night_id),
+             viewer, csrf_token, csrf_window) + context
+    return hashlib.sha1(':'.join(str(part) for part in parts).encode()).hexdigest()[:20]
+
+
+def not_modified_response(etag):
+    """
+    Build a 304 response if the client already has the current page.
+
+    Call before loading or rendering anything else.
+
+    Args:
+        etag: ETag from page_etag()
+
+    Returns:
+        304 response, or None if the page must be rendered
+    """
+    # Pending flash messages are only shown by a fresh render
+    if session.get('_flashes'):
+        return None
+    if not request.if_none_match.contains_weak(etag):
+        return None
+
+    logger.debug(f"Not modified: {request.endpoint} etag={etag}")
+    return etag_response(current_app.response_class(status=304), etag)
+
+
+def etag_response(body, etag):
+    """
+    Attach an ETag to a rendered page so clients revalidate instead of re-downloading.
+
+    Args:
+        body: Rendered template or response
+        etag: ETag from page_etag()
+
+    Returns:
+        Response with ETag and Cache-Control headers
+    """
+    response = make_response(body)
+    response.set_etag(etag, weak=True)
+    # Pages differ per viewer and must be revalidated on every load
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
@@ -0,0 +1,100 @@
+"""Startup upgrades for databases created by an older version of the models.
+
+``db.create_all()`` creates missing tables but never alters existing ones,
+so columns and constraints added to a model since a database was created
+are applied here. Every step checks the live schema first and is safe to
+run on each start, from every worker.
+"""
+from sqlalchemy import inspect, literal, text
+from app import db
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Columns added to existing tables, as (table, column); type, default and
+# foreign key come from the model
+ADDED_COLUMNS = (
+    ('game', 'timer_estimator'),
+    ('tournament', 'format'),
+    ('tournament', 'round_count'),
+    ('match', 'bracket'),
+    ('match', 'loser_next_match_id'),
+    ('match', 'loser_next_match_position'),
+)
+
+
+def upgrade_schema():
+    """
+    Bring existing tables up to the current models. Commits.
+
+    Must be called within an app context, after db.create_all().
+    """
+    inspector = inspect(db.engine)
+    _add_missing_columns(inspector)
+    _add_score_unique_index(inspector)
+
+
+def _column_ddl(column, dialect):
+    """Render a model column for ALTER TABLE ... ADD COLUMN, with its scalar default as a server default."""
+    preparer = dialect.identifier_preparer
+    ddl = f"{preparer.quote(column.name)} {column.type.compile(dialect=dialect)}"
+    if column.default is not None and column.default.is_scalar:
+        default = literal(column.default.arg).compile(dialect=dialect, compile_kwargs={'literal_binds': True})
+        ddl += f" DEFAULT {default}"
+    for foreign_key in column.foreign_keys:
+        target = foreign_key.column
+        ddl += f" REFERENCES {preparer.quote(target.table.name)} ({preparer.quote(target.name)})"
+    return ddl
+
+
+def _add_missing_columns(inspector):
+    """Add ADDED_COLUMNS missing from existing tables; existing rows get the column default."""
+    dialect = db.engine.dialect
+    added = []
+    for table_name, column_name in ADDED_COLUMNS:
+        existing = {column['name'] for column in inspector.get_columns(table_name)}
+        if column_name in existing:
+            continue
+        column = db.metadata.tables[table_name].c[column_name]
+        db.session.execute(text(
+            f"ALTER TABLE {dialect.identifier_preparer.quote(table_name)} ADD COLUMN {_column_ddl(column, dialect)}"
+        ))
+        added.append(f"{table_name}.{column_name}")
+
+    if added:
+        db.session.commit()
+        inspector.clear_cache()
+        logger.info(f"Added columns: {', '.join(added)}")
+
+
+def _has_unique(inspector, table, columns):
+    """Check whether a unique constraint or unique index covers exactly these columns."""
+    columns = list(columns)
+    if any(constraint['column_names'] == columns for constraint in inspector.get_unique_constraints(table)):
+        return True
+    return any(index['unique'] and index['column_names'] == columns for index in inspector.get_indexes(table))
+
+
+def _add_score_unique_index(inspector):
+    """
+    Add the (game_id, team_id) unique index score upserts use as their conflict target.
+
+    Duplicate scores of a team in a game are removed first, keeping the most
+    recently inserted one, and the materialized standings are rebuilt from
+    what remains.
+    """
+    if _has_unique(inspector, 'score', ['game_id', 'team_id']):
+        return
+
+    removed = db.session.execute(text(
+        "DELETE FROM score WHERE id NOT IN (SELECT MAX(id) FROM score GROUP BY game_id, team_id)"
+    )).rowcount
+    db.session.execute(text(
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_score_game_team ON score (game_id, team_id)"
+    ))
+    db.session.commit()
+    logger.info(f"Added unique index uq_score_game_team (removed {removed} duplicate score(s))")
+
+    if removed:
+        from app.services.standings_service import StandingsService
+        StandingsService.rebuild()
@@ -0,0 +1,122 @@
+"""SQLite performance profile applied to every new database connection."""
+import re
+from sqlalchemy import event
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Applied in this order; busy_timeout first so switching journal mode waits for other writers
+SUPPORTED_PRAGMAS = ('busy_timeout', 'journal_mode', 'synchronous', 'mmap_size', 'cache_size', 'temp_store')
+
+# Pragma values are interpolated into SQL, so only plain words and integers are allowed
+_VALUE_PATTERN = re.compile(r'^(-?\d+|[A-Za-z_]+)$')
+
+
+def validate_pragmas(pragmas):
+    """
+    Check a SQLITE_PRAGMAS mapping before it is used.
+
+    Args:
+        pragmas: Dict mapping pragma name to value
+
+    Returns:
+        List of (name, value) pairs in application order
+
+    Raises:
+        ConfigurationError: If a pragma is unsupported or its value is malformed
+    """
+    from app.exceptions import ConfigurationError
+
+    for name, value in pragmas.items():
+        if name not in SUPPORTED_PRAGMAS:
+            raise ConfigurationError(f"Unsupported SQLite pragma '{name}'", config_key='SQLITE_PRAGMAS')
+        if not _VALUE_PATTERN.match(str(value)):
+            raise ConfigurationError(
+                f"Invalid value {value!r} for SQLite pragma '{name}'", config_key='SQLITE_PRAGMAS'
+            )
+
+    return [(name, pragmas[name]) for name in SUPPORTED_PRAGMAS if name in pragmas]
+
+
+def apply_pragmas(dbapi_conn, pragmas):
+    """
+    Run PRAGMA statements on a raw DB-API connection.
+
+    Args:
+        dbapi_conn: sqlite3 connection
+        pragmas: List of (name, value) pairs from validate_pragmas()
+    """
+    cursor = dbapi_conn.cursor()
+    try:
+        for name, value in pragmas:
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def get_effective_settings(connection):
+    """
+    Read back the pragmas in effect on a connection.
+
+    Args:
+        connection: SQLAlchemy connection
+
+    Returns:
+        Dict mapping pragma name to its current value
+    """
+    return {
+        name: connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+        for name in SUPPORTED_PRAGMAS
+    }
+
+
+def _listen(engine, pragmas):
+    """Apply pragmas to every new connection of an engine."""
+    @event.listens_for(engine, 'connect')
+    def set_performance_pragmas(dbapi_conn, connection_record):
+        """Apply the SQLite performance profile."""
+        apply_pragmas(dbapi_conn, pragmas)
+
+
+def init_sqlite_tuning(app):
+    """
+    Apply the configured SQLite profile to every connection of the app's engines and log the result.
+
+    Does nothing for other databases.
+
+    Args:
+        app: Flask application instance (db must already be initialized)
+
+    Returns:
+        Dict of effective settings read back at startup, or None if not applied
+    """
+    from app import db
+
+    pragmas = validate_pragmas(app.config.get('SQLITE_PRAGMAS') or {})
+
+    with app.app_context():
+        engine = db.engine
+        if engine.dialect.name != 'sqlite' or not pragmas:
+            return None
+
+        for key, bind_engine in db.engines.items():
+            if bind_engine.dialect.name != 'sqlite':
+                continue
+            # Only the primary may switch the journal mode; other binds (e.g. a
+            # read-only connection to the same file) inherit it from the file
+            bind_pragmas = pragmas if key is None else [
+                (name, value) for name, value in pragmas if name != 'journal_mode'
+            ]
+            _listen(bind_engine, bind_pragmas)
+
+        # Startup check: WAL can be refused (e.g. in-memory or network file systems)
+        with engine.connect() as connection:
+            settings = get_effective_settings(connection)
+
+    logger.info(f"SQLite settings: {settings}")
+    requested_mode = str(dict(pragmas).get('journal_mode', '')).lower()
+    if requested_mode and settings['journal_mode'] != requested_mode:
+        logger.warning(
+            f"SQLite journal_mode is '{settings['journal_mode']}', not the configured '{requested_mode}'"
+        )
+    return settings
@@ -0,0 +1,22 @@
+"""Dialect-aware INSERT ... ON CONFLICT support."""
+from sqlalchemy.dialects import postgresql, sqlite
+
+# Dialects with INSERT ... ON CONFLICT DO UPDATE / DO NOTHING
+_INSERTS = {
+    'sqlite': sqlite.insert,
+    'postgresql': postgresql.insert
+}
+
+
+def upsert_insert(bind):
+    """
+    Get the insert() construct supporting on_conflict_do_update for a database.
+
+    Args:
+        bind: Engine, connection or session bind
+
+    Returns:
+        Dialect-specific insert function, or None if the database has no
+        ON CONFLICT support (callers fall back to the ORM)
+    """
+    return _INSERTS.get(bind.dialect.name)
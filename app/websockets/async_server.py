@@ -0,0 +1,245 @@
+"""Asyncio Socket.IO server for large numbers of mostly idle connections.
+
+In threading mode every websocket holds a thread for its whole lifetime. Here
+connections are coroutines on one event loop, so an idle spectator costs only
+its socket buffers and session state. The event handlers in
+``app.websockets.events`` are synchronous and use the database through
+SQLAlchemy; they run in a small bounded thread pool (ASYNC_DB_WORKERS) inside
+an app context, so database work is capped at a few threads no matter how many
+clients are connected.
+
+Serve it with any ASGI server, e.g. ``uvicorn asgi:app``; see ``asgi.py``.
+"""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import socketio
+from socketio.async_pubsub_manager import AsyncPubSubManager
+from flask_login import current_user
+
+from app.websockets import events
+from app.websockets.events import JoinRoom, LeaveRoom
+from app.websockets.message_queue import DatabaseQueueManager
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncDatabaseQueueManager(AsyncPubSubManager):
+    """Asyncio variant of the ``socket_message`` table relay.
+
+    Shares the table and channel with ``DatabaseQueueManager``, so the ASGI
+    server and threaded workers can relay messages to each other.
+    """
+
+    name = 'database'
+
+    def __init__(self, app, executor=None, channel='socketio', poll_interval=0.1, write_only=False):
+        """Initialize the manager.
+
+        Args:
+            app: Flask application instance
+            executor: Executor for the blocking database calls (default: asyncio's)
+            channel: Channel name, so several apps can share one table
+            poll_interval: Seconds between polls for new messages
+            write_only: Only publish, never listen
+        """
+        super().__init__(channel=channel, write_only=write_only, logger=logger)
+        self.relay = DatabaseQueueManager(app, channel=channel, poll_interval=poll_interval,
+                                          write_only=True)
+        self.executor = executor
+        self.poll_interval = poll_interval
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, partial(func, *args))
+
+    async def _publish(self, data):
+        await self._run(self.relay._publish, data)
+
+    async def _listen(self):
+        """Yield messages published after this server started, polling forever."""
+        last_seen_id = await self._run(self.relay._latest_id)
+        while True:
+            try:
+                messages = await self._run(self.relay._fetch, last_seen_id)
+            except Exception as e:
+                logger.error(f"Failed to poll socket messages: {e}", exc_info=True)
+                messages = []
+
+            for message_id, message in messages:
+                last_seen_id = message_id
+                yield message
+
+            await asyncio.sleep(self.poll_interval)
+
+
+class ThreadBridge:
+    """Synchronous facade over the AsyncServer for thread-based components.
+
+    The leaderboard broadcaster, score write buffer and lock sweeper expect a
+    Flask-SocketIO-like object with emit(), sleep() and
+    start_background_task(). This provides those from any thread by
+    scheduling the emit on the server's event loop. Background tasks run on
+    a bounded thread pool rather than a new thread each.
+    """
+
+    def __init__(self, sio, loop, executor=None):
+        """Initialize the bridge.
+
+        Args:
+            sio: AsyncServer to emit through
+            loop: The server's event loop
+            executor: Thread pool for background tasks (default: a new 6-thread pool)
+        """
+        self.sio = sio
+        self.loop = loop
+        self.executor = executor or ThreadPoolExecutor(max_workers=6, thread_name_prefix='realtime-background')
+
+    def emit(self, event, data=None, room=None, **kwargs):
+        return asyncio.run_coroutine_threadsafe(
+            self.sio.emit(event, data, room=room, **kwargs), self.loop
+        )
+
+    def start_background_task(self, target, *args, **kwargs):
+        return self.executor.submit(target, *args, **kwargs)
+
+    @staticmethod
+    def sleep(seconds):
+        time.sleep(seconds)
+
+
+class AsyncRealtimeServer:
+    """ASGI Socket.IO server running the shared realtime event handlers."""
+
+    def __init__(self, app, db_workers=None, client_manager=None):
+        """Initialize the server and register the event handlers.
+
+        Args:
+            app: Flask application instance (create_app() must have run)
+            db_workers: Threads for handler database work (default: ASYNC_DB_WORKERS)
+            client_manager: Socket.IO client manager (default: from SOCKETIO_MESSAGE_QUEUE)
+        """
+        self.app = app
+        self.executor = ThreadPoolExecutor(
+            max_workers=db_workers or app.config.get('ASYNC_DB_WORKERS', 8),
+            thread_name_prefix='realtime-db'
+        )
+        # Debounced flushes and the sweep/poll loops of the thread-based components
+        self.background_executor = ThreadPoolExecutor(
+            max_workers=app.config.get('ASYNC_BACKGROUND_WORKERS', 6),
+            thread_name_prefix='realtime-background'
+        )
+        if client_manager is None:
+            client_manager = self._client_manager()
+        self.sio = socketio.AsyncServer(
+            async_mode='asgi',
+            cors_allowed_origins='*',
+            client_manager=client_manager,
+            logger=False,
+            engineio_logger=False
+        )
+        self.bridge = None
+        self._register()
+
+    def _client_manager(self):
+        """Build the client manager SOCKETIO_MESSAGE_QUEUE selects, or None for none."""
+        queue = self.app.config.get('SOCKETIO_MESSAGE_QUEUE') or ''
+        channel = self.app.config.get('SOCKETIO_CHANNEL', 'socketio')
+        if not queue:
+            return None
+        if queue == AsyncDatabaseQueueManager.name:
+            return AsyncDatabaseQueueManager(
+                self.app, executor=self.executor, channel=channel,
+                poll_interval=self.app.config.get('SOCKETIO_QUEUE_POLL_INTERVAL', 0.1)
+            )
+        if queue.startswith(('redis://', 'rediss://')):
+            return socketio.AsyncRedisManager(queue, channel=channel)
+        return socketio.AsyncAioPikaManager(queue, channel=channel)
+
+    def asgi_app(self, **kwargs):
+        """Get the ASGI application serving Socket.IO."""
+        return socketio.ASGIApp(self.sio, on_startup=self.startup, on_shutdown=self.shutdown, **kwargs)
+
+    async def startup(self):
+        """Route the thread-based components' emits through this server's event loop."""
+        self.bridge = ThreadBridge(self.sio, asyncio.get_running_loop(), self.background_executor)
+        events.leaderboard_broadcaster.init_app(self.app, self.bridge)
+        events.score_buffer.init_app(self.app, self.bridge)
+        events.timer_aggregator.init_app(self.app, self.bridge)
+        events.lock_sweeper.start(self.bridge)
+        logger.info("Async realtime server started")
+
+    async def shutdown(self):
+        """Commit buffered score edits, timer records and timer stats and stop the thread pools."""
+        await self.run_sync(events.score_buffer.flush)
+        await self.run_sync(events.timer_aggregator.queue.flush)
+        await self.run_sync(events.timer_aggregator.flush)
+        self.executor.shutdown(wait=False)
+        self.background_executor.shutdown(wait=False)
+
+    async def run_sync(self, func, *args):
+        """Run a blocking function in the database thread pool inside an app context."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, partial(self._in_app_context, func, *args)
+        )
+
+    def _in_app_context(self, func, *args):
+        with self.app.app_context():
+            return func(*args)
+
+    def _admin_id(self, environ):
+        """Get the logged-in admin's ID from the handshake request's session cookie."""
+        with self.app.request_context(environ):
+            return current_user.id if current_user.is_authenticated else None
+
+    async def perform(self, sid, actions):
+        """Carry out event actions for the client whose event is being handled."""
+        for action in actions:
+            if isinstance(action, JoinRoom):
+                await self.sio.enter_room(sid, action.room)
+            elif isinstance(action, LeaveRoom):
+                await self.sio.leave_room(sid, action.room)
+            elif action.room is None:
+                await self.sio.emit(action.event, action.data, to=sid)
+            elif action.skip_sender:
+                await self.sio.emit(action.event, action.data, room=action.room, skip_sid=sid)
+            else:
+                await self.sio.emit(action.event, action.data, room=action.room)
+
+    def _register(self):
+        """Register the shared event handlers with the AsyncServer."""
+
+        async def connect(sid, environ, auth=None):
+            admin_id = await self.run_sync(self._admin_id, environ)
+            await self.perform(sid, events.connect(sid, admin_id))
+
+        async def disconnect(sid):
+            await self.perform(sid, await self.run_sync(events.disconnect, sid))
+
+        self.sio.on('connect', connect)
+        self.sio.on('disconnect', disconnect)
+
+        for event_name, handler in events.HANDLERS.items():
+            self.sio.on(event_name, self._wrap(handler))
+
+    def _wrap(self, handler):
+        """Adapt a shared (sid, data) handler to an AsyncServer event handler."""
+        async def handle_event(sid, data=None):
+            await self.perform(sid, await self.run_sync(handler, sid, data or {}))
+
+        return handle_event
+
+
+def create_asgi_app(app, **kwargs):
+    """Create the ASGI application for a Flask app's realtime events.
+
+    Args:
+        app: Flask application instance from create_app()
+        **kwargs: Passed to AsyncRealtimeServer
+
+    Returns:
+        socketio.ASGIApp: Serves /socket.io/ only; HTTP stays on the WSGI app
+    """
+    return AsyncRealtimeServer(app, **kwargs).asgi_app()
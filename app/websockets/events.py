@@ -0,0 +1,383 @@
+"""Realtime scoring logic shared by the threaded and asyncio Socket.IO servers.
+
+Each handler takes the connection's session ID and the event payload and
+returns the actions the server should carry out: joining or leaving rooms
+and emitting events. The servers (Flask-SocketIO in ``app.websockets`` and
+the ASGI server in ``app.websockets.async_server``) only translate those
+actions into their own API, so the business rules live in one place.
+
+Handlers touch the database and must run inside an app context.
+"""
+import math
+import time
+from collections import namedtuple
+from app.models.score import Score
+from app.websockets.lock_manager import EditLockManager, create_lock_manager
+from app.websockets.lock_sweeper import LockSweeper
+from app.websockets.timer_aggregator import TimerAggregator
+from app.websockets.leaderboard_broadcaster import LeaderboardBroadcaster
+from app.websockets.score_buffer import ScoreWriteBuffer
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Server actions. Emit.room None means reply to the sender only.
+Emit = namedtuple('Emit', ['event', 'data', 'room', 'skip_sender'], defaults=[None, False])
+JoinRoom = namedtuple('JoinRoom', ['room'])
+LeaveRoom = namedtuple('LeaveRoom', ['room'])
+
+# Initialize managers
+lock_manager = EditLockManager()
+lock_sweeper = LockSweeper(lock_manager)
+timer_aggregator = TimerAggregator()
+leaderboard_broadcaster = LeaderboardBroadcaster()
+score_buffer = ScoreWriteBuffer()
+
+# Store per-connection user data
+_connection_data = {}
+
+
+def init_lock_manager(app):
+    """Replace the default in-memory lock manager with the one EDIT_LOCK_BACKEND selects.
+
+    Args:
+        app: Flask application instance
+    """
+    global lock_manager
+    lock_manager = create_lock_manager(app)
+    lock_sweeper.lock_manager = lock_manager
+    lock_sweeper.app = app
+    logger.info(f"Edit locks using {type(lock_manager).__name__}")
+
+
+def game_room(game_id):
+    """Get the Socket.IO room name for a game's scorers."""
+    return f"game_{game_id}"
+
+
+def serialize_scores(scores_dict):
+    """Serialize scores dictionary for transmission."""
+    result = {}
+    for team_id, score in scores_dict.items():
+        if isinstance(score, Score):
+            result[team_id] = {
+                'score_value': score.score_value,
+                'points': score.points,
+                'multi_timer_avg': score.multi_timer_avg,
+                'timer_count': score.timer_count
+            }
+        else:
+            result[team_id] = score
+    return result
+
+
+def connect(sid, admin_id=None):
+    """Handle client connection.
+
+    Args:
+        sid: Socket.IO session ID
+        admin_id: ID of the logged-in admin, or None for public users
+    """
+    # Get user identity
+    if admin_id is not None:
+        user_id = f"admin_{admin_id}"
+        display_name = "admin"  # Simplified: just "admin"
+    else:
+        user_id = f"anon_{sid}"
+        display_name = "Player"  # Simplified: just "Player"
+
+    # Store in connection data dictionary
+    _connection_data[sid] = {
+        'user_id': user_id,
+        'display_name': display_name,
+        'is_admin': admin_id is not None
+    }
+
+    return [Emit('connected', {
+        'user_id': user_id,
+        'display_name': display_name
+    })]
+
+
+def join_game(sid, data):
+    """Join a game room for real-time updates."""
+    game_id = data.get('game_id')
+    room = game_room(game_id)
+
+    # Send current state
+    scores = Score.query.filter_by(game_id=game_id).all()
+    scores_dict = serialize_scores({score.team_id: score for score in scores})
+    active_locks = lock_manager.get_game_locks(game_id)
+
+    # Edits still waiting in the write buffer are newer than the database
+    for team_id, (score_value, points) in score_buffer.get_pending(game_id).items():
+        scores_dict.setdefault(team_id, {}).update({'score_value': score_value, 'points': points})
+
+    conn_data = _connection_data.get(sid, {})
+
+    return [
+        JoinRoom(room),
+        Emit('game_state', {
+            'scores': scores_dict,
+            'locks': active_locks
+        }),
+        # Notify others
+        Emit('user_joined', {
+            'user_id': conn_data.get('user_id'),
+            'display_name': conn_data.get('display_name')
+        }, room, skip_sender=True)
+    ]
+
+
+def leave_game(sid, data):
+    """Leave a game room."""
+    room = game_room(data.get('game_id'))
+    conn_data = _connection_data.get(sid, {})
+
+    return [
+        LeaveRoom(room),
+        # Notify others
+        Emit('user_left', {
+            'user_id': conn_data.get('user_id'),
+            'display_name': conn_data.get('display_name')
+        }, room, skip_sender=True)
+    ]
+
+
+def join_leaderboard(sid, data):
+    """Join a game night's leaderboard room for live standings."""
+    game_night_id = data.get('game_night_id')
+
+    # Send current standings; later changes arrive as leaderboard_delta
+    return [
+        JoinRoom(leaderboard_broadcaster.room(game_night_id)),
+        Emit('leaderboard_state', leaderboard_broadcaster.get_state(game_night_id, sid))
+    ]
+
+
+def leave_leaderboard(sid, data):
+    """Leave a game night's leaderboard room."""
+    game_night_id = data.get('game_night_id')
+    leaderboard_broadcaster.unwatch(sid, game_night_id)
+    return [LeaveRoom(leaderboard_broadcaster.room(game_night_id))]
+
+
+def request_edit_lock(sid, data):
+    """Request exclusive lock on a score field."""
+    game_id = data.get('game_id')
+    team_id = data.get('team_id')
+    field = data.get('field')  # Client sends 'field', not 'field_name'
+
+    conn_data = _connection_data.get(sid, {})
+    user_id = conn_data.get('user_id')
+    display_name = conn_data.get('display_name')
+
+    # Try to acquire lock
+    lock_result = lock_manager.acquire_lock(
+        game_id, team_id, field, user_id, display_name
+    )
+
+    if not lock_result['success']:
+        return [Emit('lock_denied', {
+            'team_id': team_id,
+            'field': field,
+            'locked_by': lock_result['locked_by']
+        })]
+
+    return [
+        # Notify requester
+        Emit('lock_acquired', {
+            'game_id': game_id,
+            'team_id': team_id,
+            'field': field
+        }),
+        # Notify room
+        Emit('field_locked', {
+            'team_id': team_id,
+            'field': field,
+            'user_id': user_id,
+            'display_name': display_name
+        }, game_room(game_id), skip_sender=True)
+    ]
+
+
+def release_edit_lock(sid, data):
+    """Release lock on a score field and save/broadcast final score."""
+    game_id = data.get('game_id')
+    team_id = data.get('team_id')
+    field = data.get('field')
+    score = data.get('score')
+    points = data.get('points')
+
+    conn_data = _connection_data.get(sid, {})
+    user_id = conn_data.get('user_id')
+
+    # Save the final score (and any buffered edits for this field) before unlocking
+    if score is not None and points is not None:
+        score_buffer.add(game_id, team_id, score, points, sid)
+    score_buffer.flush(keys=[(game_id, team_id)])
+
+    # Release the lock
+    lock_manager.release_lock(game_id, team_id, field, user_id)
+
+    # Broadcast unlock with final score
+    return [Emit('field_unlocked', {
+        'team_id': team_id,
+        'field': field,
+        'score': score,
+        'points': points,
+        'updated_by': conn_data.get('display_name')
+    }, game_room(game_id))]
+
+
+def update_score(sid, data):
+    """Handle real-time score update."""
+    game_id = data.get('game_id')
+    team_id = data.get('team_id')
+    score = data.get('score')  # Client sends 'score', not 'score_value'
+    points = data.get('points')
+
+    conn_data = _connection_data.get(sid, {})
+
+    # Lock check is intentionally skipped so public users can update scores
+
+    # Buffer the write (coalesced per field, committed in batches) and broadcast right away
+    score_buffer.add(game_id, team_id, score, points, sid)
+
+    return [Emit('score_updated', {
+        'team_id': team_id,
+        'score': score,
+        'points': points,
+        'updated_by': conn_data.get('display_name')
+    }, game_room(game_id))]
+
+
+def start_timer(sid, data):
+    """User started their timer for a team."""
+    game_id = data.get('game_id')
+    team_id = data.get('team_id')
+
+    conn_data = _connection_data.get(sid, {})
+    user_id = conn_data.get('user_id')
+    display_name = conn_data.get('display_name')
+
+    timer_aggregator.start_timer(game_id, team_id, user_id, display_name, data.get('latency'))
+
+    # Notify room
+    return [Emit('timer_started', {
+        'team_id': team_id,
+        'user_id': user_id,
+        'display_name': display_name
+    }, game_room(game_id))]
+
+
+def stop_timer(sid, data):
+    """User stopped their timer."""
+    game_id = data.get('game_id')
+    team_id = data.get('team_id')
+    time_value = data.get('time_value')  # in seconds
+    latency = data.get('latency')  # client's one-way latency in seconds (see clock_sync)
+
+    try:
+        time_value = float(time_value)
+    except (TypeError, ValueError):
+        time_value = None
+    if time_value is None or not math.isfinite(time_value) or time_value < 0:
+        return [Emit('error', {'message': 'Invalid timer value'})]
+
+    conn_data = _connection_data.get(sid, {})
+    user_id = conn_data.get('user_id')
+    display_name = conn_data.get('display_name')
+
+    # Record timer value
+    record = timer_aggregator.record_time(
+        game_id, team_id, user_id, display_name, time_value, latency
+    )
+
+    # Running stats and consensus for this team (updated in memory, no re-query)
+    stats = timer_aggregator.get_team_stats(game_id, team_id)
+    consensus = stats['consensus'] or {}
+
+    # Broadcast timer update
+    return [Emit('timer_stopped', {
+        'team_id': team_id,
+        'user_id': user_id,
+        'display_name': display_name,
+        'time': record.time_value,
+        'average': consensus.get('value', record.time_value),
+        'estimator': consensus.get('estimator'),
+        'confidence': consensus.get('confidence'),
+        'min': stats['min'],
+        'max': stats['max'],
+        'all_times': stats['times'],
+        'timer_count': stats['count']
+    }, game_room(game_id))]
+
+
+def clock_sync(sid, data):
+    """Echo the client's timestamp so it can measure its latency to the server."""
+    return [Emit('clock_sync', {
+        'client_time': data.get('client_time'),
+        'server_time': time.time()
+    })]
+
+
+def clear_timers(sid, data):
+    """Clear all timer records for a team."""
+    game_id = data.get('game_id')
+    team_id = data.get('team_id')
+
+    # Only admin can clear timers
+    if not _connection_data.get(sid, {}).get('is_admin'):
+        return [Emit('error', {'message': 'Only admins can clear timers'})]
+
+    count = timer_aggregator.clear_team_timers(game_id, team_id)
+
+    return [Emit('timers_cleared', {
+        'team_id': team_id,
+        'count': count
+    }, game_room(game_id))]
+
+
+def disconnect(sid):
+    """Handle client disconnection - release all locks."""
+    conn_data = _connection_data.pop(sid, {})
+    user_id = conn_data.get('user_id')
+
+    # Persist buffered edits before the client's locks go away
+    score_buffer.flush()
+    leaderboard_broadcaster.unwatch(sid)
+
+    actions = []
+    if user_id:
+        # Release all locks and notify rooms
+        for lock in lock_manager.release_all_user_locks(user_id):
+            actions.append(Emit('field_unlocked', {
+                'team_id': lock['team_id'],
+                'field': lock['field_name']
+            }, game_room(lock['game_id'])))
+
+        # Stop all active timers and notify rooms
+        for timer in timer_aggregator.stop_user_timers(user_id):
+            actions.append(Emit('timer_stopped', {
+                'team_id': timer['team_id'],
+                'user_id': user_id
+            }, game_room(timer['game_id'])))
+
+    return actions
+
+
+# Client event name -> handler taking (sid, data)
+HANDLERS = {
+    'join_game': join_game,
+    'leave_game': leave_game,
+    'join_leaderboard': join_leaderboard,
+    'leave_leaderboard': leave_leaderboard,
+    'request_edit_lock': request_edit_lock,
+    'release_edit_lock': release_edit_lock,
+    'update_score': update_score,
+    'start_timer': start_timer,
+    'stop_timer': stop_timer,
+    'clock_sync': clock_sync,
+    'clear_timers': clear_timers
+}
@@ -0,0 +1,235 @@
+"""Debounced live standings for the public leaderboard."""
+from threading import Lock
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class LeaderboardBroadcaster:
+    """Coalesces leaderboard writes into one standings delta per game night room.
+
+    Listens on the invalidation bus, so every score, team or game write
+    that drops the leaderboard cache also schedules a broadcast. The first
+    write of a burst starts a timer; writes arriving before it fires are
+    folded into the same broadcast. A game night is only tracked while
+    its room has subscribers.
+    """
+
+    def __init__(self, delay=0.5):
+        """Initialize the broadcaster.
+
+        Args:
+            delay: Seconds to wait for more writes before broadcasting
+        """
+        self.delay = delay
+        self.app = None
+        self.socketio = None
+        # Standings last sent per watched game night: {game_night_id: {team_id: (rank, points)}}
+        self.baselines = {}
+        self.watchers = {}  # {game_night_id: set of subscribed session IDs}
+        self.pending = set()
+        self.mutex = Lock()
+        self.local_only = False
+        self._polling = False
+
+    def init_app(self, app, socketio):
+        """Connect the broadcaster to an app and its Socket.IO server.
+
+        Args:
+            app: Flask application instance
+            socketio: SocketIO instance used to emit broadcasts
+        """
+        from app.services.leaderboard_service import LEADERBOARD_TOPIC
+        from app.utils.invalidation import invalidation_bus
+
+        self.app = app
+        self.socketio = socketio
+        self.delay = app.config.get('LEADERBOARD_BROADCAST_DELAY', 0.5)
+        self.local_only = bool(app.config.get('SOCKETIO_MESSAGE_QUEUE'))
+        self.reset()
+        invalidation_bus.subscribe(LEADERBOARD_TOPIC, self.schedule)
+
+        # Socket.IO traffic doesn't run before_request, so poll for other workers' writes here
+        if invalidation_bus.backend.name != 'local' and not self._polling:
+            self._polling = True
+            socketio.start_background_task(self._poll_invalidations)
+
+    def _poll_invalidations(self):
+        """Background task: apply other workers' writes while rooms are watched."""
+        from app.utils.invalidation import invalidation_bus
+
+        while True:
+            self.socketio.sleep(invalidation_bus.poll_interval or 0.25)
+            if not self.baselines:
+                continue
+            try:
+                with self.app.app_context():
+                    invalidation_bus.poll()
+            except Exception as e:
+                logger.error(f"Failed to poll invalidations for leaderboard rooms: {e}", exc_info=True)
+
+    @staticmethod
+    def room(game_night_id):
+        """Get the Socket.IO room name for a game night's leaderboard."""
+        return f"leaderboard_{game_night_id}"
+
+    def get_state(self, game_night_id, sid=None):
+        """Get full standings for a client joining the room.
+
+        Also starts tracking the game night so later writes are broadcast.
+
+        Args:
+            game_night_id: ID of the game night
+            sid: Session ID of the joining client, tracked until unwatch()
+
+        Returns:
+            dict: game_night_id, revision and ranked standings
+        """
+        from app.services.leaderboard_service import LeaderboardService
+        from app.services.revision_service import RevisionService
+
+        revision = RevisionService.get_revision(game_night_id)
+        standings = LeaderboardService.get_standings(game_night_id)
+
+        with self.mutex:
+            self.baselines.setdefault(
+                game_night_id, {row.team_id: (row.rank, row.points) for row in standings}
+            )
+            if sid is not None:
+                self.watchers.setdefault(game_night_id, set()).add(sid)
+
+        return {
+            'game_night_id': game_night_id,
+            'revision': revision,
+            'standings': [row._asdict() for row in standings]
+        }
+
+    def unwatch(self, sid, game_night_id=None):
+        """Remove a client from a leaderboard room; stop tracking rooms left empty.
+
+        Args:
+            sid: Session ID of the leaving client
+            game_night_id: Room being left (None for every room, on disconnect)
+        """
+        with self.mutex:
+            if game_night_id is None:
+                game_night_ids = [gn_id for gn_id, sids in self.watchers.items() if sid in sids]
+            else:
+                game_night_ids = [game_night_id]
+
+            for gn_id in game_night_ids:
+                sids = self.watchers.get(gn_id)
+                if sids is None:
+                    continue
+                sids.discard(sid)
+                if not sids:
+                    del self.watchers[gn_id]
+                    self.baselines.pop(gn_id, None)
+                    self.pending.discard(gn_id)
+
+    def schedule(self, game_night_id):
+        """Schedule a debounced broadcast for a game night (invalidation bus subscriber).
+
+        Args:
+            game_night_id: Game night whose leaderboard changed ('*' for all)
+        """
+        from app.services.leaderboard_service import ALL_GAME_NIGHTS
+
+        if self.socketio is None or game_night_id is None:
+            return
+
+        with self.mutex:
+            if game_night_id == ALL_GAME_NIGHTS:
+                targets = set(self.baselines)
+            else:
+                targets = {game_night_id} & set(self.baselines)
+            targets -= self.pending
+            self.pending |= targets
+
+        for target in targets:
+            self.socketio.start_background_task(self._flush_later, target)
+
+    def _flush_later(self, game_night_id):
+        """Background task: wait out the debounce window, then broadcast."""
+        self.socketio.sleep(self.delay)
+        with self.app.app_context():
+            try:
+                self.flush(game_night_id)
+            except Exception as e:
+                logger.error(f"Failed to broadcast leaderboard for game_night_id={game_night_id}: {e}",
+                             exc_info=True)
+
+    def flush(self, game_night_id):
+        """Broadcast the standings delta for a game night now.
+
+        Args:
+            game_night_id: ID of the game night
+
+        Returns:
+            dict: The delta that was emitted, or None if nothing changed
+        """
+        with self.mutex:
+            # Writes from now on need a new broadcast
+            self.pending.discard(game_night_id)
+
+        delta = self.compute_delta(game_night_id)
+        if delta:
+            # Every worker computes its own deltas, so keep them off the message queue
+            options = {'ignore_queue': True} if self.local_only else {}
+            self.socketio.emit('leaderboard_delta', delta, room=self.room(game_night_id), **options)
+        return delta
+
+    def compute_delta(self, game_night_id):
+        """Compare current standings with those last sent.
+
+        Args:
+            game_night_id: ID of the game night
+
+        Returns:
+            dict: game_night_id, revision, changes (teams whose rank or points
+                  moved) and removed team IDs, or None if nothing changed
+        """
+        from app.services.leaderboard_service import LeaderboardService
+        from app.services.revision_service import RevisionService
+
+        revision = RevisionService.get_revision(game_night_id)
+        standings = LeaderboardService.get_standings(game_night_id)
+        current = {row.team_id: (row.rank, row.points) for row in standings}
+
+        with self.mutex:
+            if game_night_id not in self.baselines:
+                # Its room emptied while this broadcast was pending
+                return None
+            previous = self.baselines[game_night_id]
+            self.baselines[game_night_id] = current
+
+        changes = []
+        for team_id, (rank, points) in current.items():
+            old = previous.get(team_id)
+            if old == (rank, points):
+                continue
+            changes.append({
+                'team_id': team_id,
+                'rank': rank,
+                'points': points,
+                'rank_change': old[0] - rank if old else None,
+                'points_change': points - old[1] if old else points
+            })
+        removed = sorted(set(previous) - set(current))
+
+        if not changes and not removed:
+            return None
+
+        return {
+            'game_night_id': game_night_id,
+            'revision': revision,
+            'changes': sorted(changes, key=lambda change: change['rank']),
+            'removed': removed
+        }
+
+    def reset(self):
+        """Stop tracking all game nights."""
+        with self.mutex:
+            self.baselines.clear()
+            self.watchers.clear()
+            self.pending.clear()
@@ -1,24 +1,83 @@
 """Edit Lock Manager for real-time collaborative scoring."""
+import heapq
 from datetime import datetime, timedelta
+from itertools import count
 from threading import Lock
 from collections import defaultdict
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from app import db
+from app.models.active_edit import ActiveEdit
+from app.utils.upsert import upsert_insert
 
 
 class EditLockManager:
-    """Manages edit locks for score fields (in-memory)."""
+    """Manages edit locks for score fields (in-memory).
 
-    def __init__(self, lock_timeout_minutes=5):
+    Besides the locks themselves, a per-game and a per-user index of lock
+    keys and a min-heap of expiry deadlines are kept, so joining a game,
+    disconnecting and sweeping expired locks only touch the locks involved.
+    """
+
+    def __init__(self, lock_timeout_minutes=5, clock=datetime.utcnow):
         """Initialize the lock manager.
 
         Args:
             lock_timeout_minutes: Minutes before a lock automatically expires
+            clock: Callable returning the current (naive UTC) time
         """
         # In-memory storage (for development/single-instance)
         self.locks = {}  # {(game_id, team_id, field): {'user_id', 'display_name', 'locked_at'}}
         self.lock_mutex = Lock()
 
+        # Secondary indexes: {game_id: {key}} and {user_id: {key}}
+        self.game_index = defaultdict(set)
+        self.user_index = defaultdict(set)
+
+        # (deadline, seq, key) entries; an entry is stale once its lock is refreshed or released
+        self.expiry_heap = []
+        self._seq = count()
+
         # Lock timeout (auto-release after N minutes of inactivity)
         self.lock_timeout = timedelta(minutes=lock_timeout_minutes)
+        self.clock = clock
+
+    def _add(self, key, lock):
+        """Store a lock and index it. Caller holds lock_mutex."""
+        self.locks[key] = lock
+        self.game_index[key[0]].add(key)
+        self.user_index[lock['user_id']].add(key)
+        self._schedule(key, lock['locked_at'])
+
+    def _remove(self, key):
+        """Drop a lock and its index entries. Caller holds lock_mutex.
+
+        Returns:
+            dict: The removed lock
+        """
+        lock = self.locks.pop(key)
+        for index, index_key in ((self.game_index, key[0]), (self.user_index, lock['user_id'])):
+            keys = index.get(index_key)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del index[index_key]
+        return lock
+
+    def _schedule(self, key, locked_at):
+        """Push a lock's expiry deadline onto the heap. Caller holds lock_mutex."""
+        heapq.heappush(self.expiry_heap, (locked_at + self.lock_timeout, next(self._seq), key))
+
+        # Refreshes leave stale entries behind; rebuild once they dominate the heap
+        if len(self.expiry_heap) > 2 * len(self.locks) + 64:
+            self.expiry_heap = [
+                (lock['locked_at'] + self.lock_timeout, next(self._seq), lock_key)
+                for lock_key, lock in self.locks.items()
+            ]
+            heapq.heapify(self.expiry_heap)
+
+    def _is_expired(self, lock, now):
+        return now - lock['locked_at'] > self.lock_timeout
 
     def acquire_lock(self, game_id, team_id, field_name, user_id, display_name):
         """Attempt to acquire lock on a field.
@@ -33,6 +92,7 @@ class EditLockManager:
         Returns:
             dict: {'success': bool, 'locked_by': str (if failed)}
         """
+        now = self.clock()
         with self.lock_mutex:
             key = (game_id, team_id, field_name)
 
@@ -43,13 +103,14 @@ class EditLockManager:
                 # Check if same user
                 if existing_lock['user_id'] == user_id:
                     # Refresh lock timestamp
-                    existing_lock['locked_at'] = datetime.utcnow()
+                    existing_lock['locked_at'] = now
+                    self._schedule(key, now)
                     return {'success': True}
 
                 # Check if lock has expired
-                if datetime.utcnow() - existing_lock['locked_at'] > self.lock_timeout:
+                if self._is_expired(existing_lock, now):
                     # Lock expired, can override
-                    pass
+                    self._remove(key)
                 else:
                     return {
                         'success': False,
@@ -57,11 +118,11 @@ class EditLockManager:
                     }
 
             # Acquire lock
-            self.locks[key] = {
+            self._add(key, {
                 'user_id': user_id,
                 'display_name': display_name,
-                'locked_at': datetime.utcnow()
-            }
+                'locked_at': now
+            })
 
             return {'success': True}
 
@@ -81,7 +142,7 @@ class EditLockManager:
             key = (game_id, team_id, field_name)
 
             if key in self.locks and self.locks[key]['user_id'] == user_id:
-                del self.locks[key]
+                self._remove(key)
                 return True
             return False
 
@@ -113,13 +174,9 @@ class EditLockManager:
         """
         released = []
         with self.lock_mutex:
-            to_remove = [
-                key for key, lock in self.locks.items()
-                if lock['user_id'] == user_id
-            ]
-            for key in to_remove:
+            for key in list(self.user_index.get(user_id, ())):
                 game_id, team_id, field_name = key
-                del self.locks[key]
+                self._remove(key)
                 released.append({
                     'game_id': game_id,
                     'team_id': team_id,
@@ -138,27 +195,288 @@ class EditLockManager:
         """
         locks = []
         with self.lock_mutex:
-            for (gid, team_id, field_name), lock in self.locks.items():
-                if gid == game_id:
-                    locks.append({
-                        'team_id': team_id,
-                        'field_name': field_name,
-                        'user_id': lock['user_id'],
-                        'display_name': lock['display_name']
-                    })
+            for key in self.game_index.get(game_id, ()):
+                _, team_id, field_name = key
+                lock = self.locks[key]
+                locks.append({
+                    'team_id': team_id,
+                    'field_name': field_name,
+                    'user_id': lock['user_id'],
+                    'display_name': lock['display_name']
+                })
         return locks
 
+    def expire_locks(self):
+        """Remove expired locks, examining only heap entries whose deadline has passed.
+
+        Returns:
+            list: Expired locks with game_id, team_id and field_name
+        """
+        now = self.clock()
+        expired = []
+        with self.lock_mutex:
+            while self.expiry_heap and self.expiry_heap[0][0] < now:
+                _, _, key = heapq.heappop(self.expiry_heap)
+                lock = self.locks.get(key)
+                # Released or refreshed since this deadline was pushed
+                if lock is None or not self._is_expired(lock, now):
+                    continue
+                self._remove(key)
+                game_id, team_id, field_name = key
+                expired.append({
+                    'game_id': game_id,
+                    'team_id': team_id,
+                    'field_name': field_name
+                })
+        return expired
+
     def cleanup_expired_locks(self):
         """Remove all expired locks. Can be called periodically.
 
         Returns:
             int: Number of locks cleaned up
         """
+        return len(self.expire_locks())
+
+    def seconds_until_next_expiry(self):
+        """Get the time until the earliest lock deadline.
+
+        Returns:
+            float: Seconds (0 if already due), or None if there are no locks
+        """
         with self.lock_mutex:
-            expired_keys = [
-                key for key, lock in self.locks.items()
-                if datetime.utcnow() - lock['locked_at'] > self.lock_timeout
-            ]
-            for key in expired_keys:
-                del self.locks[key]
-            return len(expired_keys)
+            if not self.expiry_heap:
+                return None
+            deadline = self.expiry_heap[0][0]
+        return max((deadline - self.clock()).total_seconds(), 0.0)
+
+
+class DatabaseLockManager:
+    """Edit locks stored in the active_edit table, shared by every worker process.
+
+    Acquiring is decided by the database, never by a read-then-write in
+    Python: a conditional UPDATE refreshes the caller's own lock or takes
+    over an expired one, otherwise an INSERT succeeds only if the
+    uq_game_team_field_lock constraint lets it. Each call runs in its own
+    short transaction, separate from the request's session.
+    """
+
+    def __init__(self, lock_timeout_minutes=5, clock=datetime.utcnow):
+        """Initialize the lock manager.
+
+        Args:
+            lock_timeout_minutes: Minutes before a lock automatically expires
+            clock: Callable returning the current (naive UTC) time
+        """
+        self.lock_timeout = timedelta(minutes=lock_timeout_minutes)
+        self.clock = clock
+
+    @staticmethod
+    def _key_clause(table, game_id, team_id, field_name):
+        return (
+            (table.c.game_id == game_id)
+            & (table.c.team_id == team_id)
+            & (table.c.field_name == field_name)
+        )
+
+    def acquire_lock(self, game_id, team_id, field_name, user_id, display_name):
+        """Attempt to acquire lock on a field.
+
+        Args:
+            game_id: ID of the game
+            team_id: ID of the team
+            field_name: Name of the field being locked
+            user_id: ID of the user requesting lock
+            display_name: Display name of the user
+
+        Returns:
+            dict: {'success': bool, 'locked_by': str (if failed)}
+        """
+        table = ActiveEdit.__table__
+        key = self._key_clause(table, game_id, team_id, field_name)
+        now = self.clock()
+        values = {'user_id': user_id, 'user_display_name': display_name, 'locked_at': now}
+
+        with db.engine.begin() as conn:
+            # Refresh our own lock or take over an expired one
+            result = conn.execute(table.update().where(
+                key & ((table.c.user_id == user_id) | (table.c.locked_at < now - self.lock_timeout))
+            ).values(**values))
+            if result.rowcount:
+                return {'success': True}
+
+            row = {'game_id': game_id, 'team_id': team_id, 'field_name': field_name, **values}
+            insert = upsert_insert(conn)
+            try:
+                if insert is not None:
+                    inserted = conn.execute(insert(table).values(row).on_conflict_do_nothing()).rowcount
+                else:
+                    with conn.begin_nested():
+                        inserted = conn.execute(table.insert().values(row)).rowcount
+            except IntegrityError:
+                inserted = 0
+            if inserted:
+                return {'success': True}
+
+            holder = conn.execute(select(table.c.user_display_name).where(key)).scalar()
+
+        return {'success': False, 'locked_by': holder}
+
+    def release_lock(self, game_id, team_id, field_name, user_id):
+        """Release a lock if owned by user.
+
+        Args:
+            game_id: ID of the game
+            team_id: ID of the team
+            field_name: Name of the field being unlocked
+            user_id: ID of the user releasing lock
+
+        Returns:
+            bool: True if lock was released, False otherwise
+        """
+        table = ActiveEdit.__table__
+        with db.engine.begin() as conn:
+            result = conn.execute(table.delete().where(
+                self._key_clause(table, game_id, team_id, field_name) & (table.c.user_id == user_id)
+            ))
+        return result.rowcount > 0
+
+    def has_lock(self, game_id, team_id, field_name, user_id):
+        """Check if user has lock.
+
+        Args:
+            game_id: ID of the game
+            team_id: ID of the team
+            field_name: Name of the field
+            user_id: ID of the user
+
+        Returns:
+            bool: True if user has the lock
+        """
+        table = ActiveEdit.__table__
+        with db.engine.connect() as conn:
+            holder = conn.execute(select(table.c.user_id).where(
+                self._key_clause(table, game_id, team_id, field_name)
+            )).scalar()
+        return holder is not None and holder == user_id
+
+    def _delete_returning(self, conn, condition):
+        """Delete matching locks and return their (game_id, team_id, field_name) keys."""
+        table = ActiveEdit.__table__
+        columns = (table.c.game_id, table.c.team_id, table.c.field_name)
+        if conn.dialect.delete_returning:
+            return conn.execute(table.delete().where(condition).returning(*columns)).all()
+
+        ids, keys = [], []
+        for lock_id, *lock_key in conn.execute(select(table.c.id, *columns).where(condition)):
+            ids.append(lock_id)
+            keys.append(tuple(lock_key))
+        if ids:
+            conn.execute(table.delete().where(table.c.id.in_(ids)))
+        return keys
+
+    def release_all_user_locks(self, user_id):
+        """Release all locks held by a user (on disconnect).
+
+        Args:
+            user_id: ID of the user whose locks should be released
+
+        Returns:
+            list: List of released locks with game_id, team_id, field_name
+        """
+        table = ActiveEdit.__table__
+        with db.engine.begin() as conn:
+            keys = self._delete_returning(conn, table.c.user_id == user_id)
+        return [
+            {'game_id': game_id, 'team_id': team_id, 'field_name': field_name}
+            for game_id, team_id, field_name in keys
+        ]
+
+    def get_game_locks(self, game_id):
+        """Get all unexpired locks for a game.
+
+        Args:
+            game_id: ID of the game
+
+        Returns:
+            list: List of lock dictionaries with team_id, field_name, user info
+        """
+        table = ActiveEdit.__table__
+        with db.engine.connect() as conn:
+            rows = conn.execute(select(
+                table.c.team_id, table.c.field_name, table.c.user_id, table.c.user_display_name
+            ).where(
+                (table.c.game_id == game_id) & (table.c.locked_at >= self.clock() - self.lock_timeout)
+            )).all()
+        return [
+            {'team_id': team_id, 'field_name': field_name, 'user_id': user_id, 'display_name': display_name}
+            for team_id, field_name, user_id, display_name in rows
+        ]
+
+    def expire_locks(self):
+        """Remove expired locks.
+
+        When several workers sweep at once, a lock can be reported by more
+        than one of them; field_unlocked is idempotent for clients.
+
+        Returns:
+            list: Expired locks with game_id, team_id and field_name
+        """
+        table = ActiveEdit.__table__
+        with db.engine.begin() as conn:
+            keys = self._delete_returning(conn, table.c.locked_at < self.clock() - self.lock_timeout)
+        return [
+            {'game_id': game_id, 'team_id': team_id, 'field_name': field_name}
+            for game_id, team_id, field_name in keys
+        ]
+
+    def cleanup_expired_locks(self):
+        """Remove all expired locks. Can be called periodically.
+
+        Returns:
+            int: Number of locks cleaned up
+        """
+        return len(self.expire_locks())
+
+    def seconds_until_next_expiry(self):
+        """Get the time until the earliest lock deadline.
+
+        Returns:
+            float: Seconds (0 if already due), or None if there are no locks
+        """
+        table = ActiveEdit.__table__
+        with db.engine.connect() as conn:
+            oldest = conn.execute(select(func.min(table.c.locked_at))).scalar()
+        if oldest is None:
+            return None
+        return max((oldest + self.lock_timeout - self.clock()).total_seconds(), 0.0)
+
+
+# EDIT_LOCK_BACKEND values
+LOCK_MANAGERS = {
+    'memory': EditLockManager,
+    'database': DatabaseLockManager
+}
+
+
+def create_lock_manager(app):
+    """Build the lock manager selected by EDIT_LOCK_BACKEND.
+
+    Args:
+        app: Flask application instance
+
+    Returns:
+        EditLockManager or DatabaseLockManager
+
+    Raises:
+        ConfigurationError: If the backend name is unknown
+    """
+    backend_name = app.config.get('EDIT_LOCK_BACKEND', 'memory')
+    if backend_name not in LOCK_MANAGERS:
+        from app.exceptions import ConfigurationError
+        raise ConfigurationError(
+            f"Unknown edit lock backend '{backend_name}'", config_key='EDIT_LOCK_BACKEND'
+        )
+    return LOCK_MANAGERS[backend_name](
+        lock_timeout_minutes=app.config.get('EDIT_LOCK_TIMEOUT_MINUTES', 5)
+    )
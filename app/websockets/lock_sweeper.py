@@ -0,0 +1,82 @@
+"""Background expiry of abandoned edit locks."""
+from contextlib import nullcontext
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class LockSweeper:
+    """Expires edit locks at their deadlines and tells the game rooms.
+
+    Without it an abandoned lock (e.g. a tablet that went to sleep) keeps
+    the field locked on every other scorer's screen until someone happens
+    to request it. The sweeper sleeps until the earliest deadline in the
+    lock manager's expiry heap, so each wake-up only handles locks that
+    are actually due.
+    """
+
+    def __init__(self, lock_manager, min_interval=1.0):
+        """Initialize the sweeper.
+
+        Args:
+            lock_manager: EditLockManager whose locks are swept
+            min_interval: Minimum seconds between sweeps
+        """
+        self.lock_manager = lock_manager
+        self.min_interval = min_interval
+        self.app = None  # Needed by database-backed lock managers
+        self.socketio = None
+        self.task = None
+
+    def start(self, socketio):
+        """Start the sweep loop as a Socket.IO background task (once per process).
+
+        Args:
+            socketio: SocketIO instance used to sleep and emit
+        """
+        self.socketio = socketio
+        if self.task is None:
+            self.task = socketio.start_background_task(self._run)
+
+    def next_interval(self):
+        """Get how long to sleep before the next sweep.
+
+        Returns:
+            float: Seconds until the earliest lock deadline, or the lock timeout if
+                   there are no locks (new locks can't expire sooner than that)
+        """
+        wait = self.lock_manager.seconds_until_next_expiry()
+        if wait is None:
+            wait = self.lock_manager.lock_timeout.total_seconds()
+        return max(wait, self.min_interval)
+
+    def _run(self):
+        """Background task: sweep forever."""
+        interval = self.min_interval
+        while True:
+            self.socketio.sleep(interval)
+            try:
+                with self.app.app_context() if self.app is not None else nullcontext():
+                    self.sweep()
+                    interval = self.next_interval()
+            except Exception as e:
+                logger.error(f"Edit lock sweep failed: {e}", exc_info=True)
+                interval = self.lock_manager.lock_timeout.total_seconds()
+
+    def sweep(self):
+        """Expire due locks and emit field_unlocked to each affected game room.
+
+        Returns:
+            list: Expired locks with game_id, team_id and field_name
+        """
+        expired = self.lock_manager.expire_locks()
+        for lock in expired:
+            self.socketio.emit('field_unlocked', {
+                'team_id': lock['team_id'],
+                'field': lock['field_name'],
+                'expired': True
+            }, room=f"game_{lock['game_id']}")
+
+        if expired:
+            logger.info(f"Expired {len(expired)} abandoned edit locks")
+        return expired
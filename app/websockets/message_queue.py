@@ -0,0 +1,143 @@
+"""Socket.IO message queues for serving realtime rooms from several workers.
+
+Without a message queue an emit to a room only reaches clients connected to
+the emitting process. With one, every emit is also published to the queue
+and re-emitted by each other worker to its own clients, so a score entered
+on one gunicorn worker reaches scorers connected to any of them.
+
+SOCKETIO_MESSAGE_QUEUE selects the backend:
+    (empty)     Single process, no queue
+    database    Built-in relay through the ``socket_message`` table. Needs
+                no extra services; each worker polls for new messages every
+                SOCKETIO_QUEUE_POLL_INTERVAL seconds. Every emit, including
+                each score keystroke, is a write transaction, so this suits
+                small events only; not enabled by default.
+    <URL>       Any message queue Flask-SocketIO supports, e.g.
+                ``redis://host:6379/0`` or a Kombu URL (``amqp://...``);
+                the matching client package must be installed.
+"""
+import json
+import time
+from datetime import datetime, timedelta
+
+from socketio import PubSubManager
+from sqlalchemy import func, select
+
+from app import db
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class DatabaseQueueManager(PubSubManager):
+    """Socket.IO client manager that relays pub/sub messages through the database.
+
+    Messages must be JSON-serializable, which holds for every event this app
+    emits (single dict payloads).
+    """
+
+    name = 'database'
+
+    def __init__(self, app, channel='socketio', poll_interval=0.1,
+                 retention_seconds=60, prune_every=500, write_only=False):
+        """Initialize the manager.
+
+        Args:
+            app: Flask application (the listener thread needs an app context)
+            channel: Channel name, so several apps can share one table
+            poll_interval: Seconds between polls for new messages
+            retention_seconds: Age after which relayed messages are pruned
+            prune_every: Prune old messages once every N publishes
+            write_only: Only publish (e.g. from a CLI process), never listen
+        """
+        super().__init__(channel=channel, write_only=write_only, logger=logger)
+        self.app = app
+        self.poll_interval = poll_interval
+        self.retention_seconds = retention_seconds
+        self.prune_every = prune_every
+        self._publish_count = 0
+
+    @staticmethod
+    def _table():
+        from app.models.socket_message import SocketMessage
+        return SocketMessage.__table__
+
+    def _publish(self, data):
+        """Append a message in its own transaction."""
+        table = self._table()
+        with self.app.app_context(), db.engine.begin() as conn:
+            conn.execute(table.insert().values(
+                channel=self.channel, payload=json.dumps(data), created_at=datetime.utcnow()
+            ))
+
+            self._publish_count += 1
+            if self._publish_count % self.prune_every == 0:
+                cutoff = datetime.utcnow() - timedelta(seconds=self.retention_seconds)
+                conn.execute(table.delete().where(table.c.created_at < cutoff))
+
+    def _fetch(self, last_seen_id):
+        """Get messages on this channel appended after a sequence number.
+
+        Returns:
+            list: (id, message dict) pairs in sequence order
+        """
+        table = self._table()
+        with self.app.app_context(), db.engine.connect() as conn:
+            rows = conn.execute(
+                select(table.c.id, table.c.payload)
+                .where(table.c.id > last_seen_id, table.c.channel == self.channel)
+                .order_by(table.c.id)
+            ).all()
+        return [(message_id, json.loads(payload)) for message_id, payload in rows]
+
+    def _latest_id(self):
+        table = self._table()
+        with self.app.app_context(), db.engine.connect() as conn:
+            return conn.execute(select(func.max(table.c.id))).scalar() or 0
+
+    def _listen(self):
+        """Yield messages published after this worker started, polling forever."""
+        last_seen_id = self._latest_id()
+        while True:
+            try:
+                messages = self._fetch(last_seen_id)
+            except Exception as e:
+                logger.error(f"Failed to poll socket messages: {e}", exc_info=True)
+                messages = []
+
+            for message_id, message in messages:
+                last_seen_id = message_id
+                yield message
+
+            self._sleep(self.poll_interval)
+
+    def _sleep(self, seconds):
+        if self.server is not None:
+            self.server.sleep(seconds)
+        else:
+            time.sleep(seconds)
+
+
+def message_queue_options(app):
+    """Build the socketio.init_app() keyword arguments for SOCKETIO_MESSAGE_QUEUE.
+
+    Args:
+        app: Flask application instance
+
+    Returns:
+        dict: {} (no queue), {'client_manager': ...} or {'message_queue': url}
+    """
+    queue = app.config.get('SOCKETIO_MESSAGE_QUEUE') or ''
+    if not queue:
+        return {}
+
+    if queue == DatabaseQueueManager.name:
+        logger.info("Socket.IO message queue: database relay")
+        return {'client_manager': DatabaseQueueManager(
+            app,
+            channel=app.config.get('SOCKETIO_CHANNEL', 'socketio'),
+            poll_interval=app.config.get('SOCKETIO_QUEUE_POLL_INTERVAL', 0.1)
+        )}
+
+    logger.info(f"Socket.IO message queue: {queue.split('://', 1)[0]}")
+    return {'message_queue': queue, 'channel': app.config.get('SOCKETIO_CHANNEL', 'socketio')}
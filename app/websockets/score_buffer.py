@@ -0,0 +1,245 @@
+"""Write-behind buffer for live score edits."""
+import atexit
+from collections import defaultdict
+from threading import Lock
+from sqlalchemy.exc import OperationalError
+from app import db
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ScoreWriteBuffer:
+    """Coalesces live score updates per (game_id, team_id) and writes them in batches.
+
+    Scorers send an update_score event on nearly every keystroke. Instead of
+    a SELECT and COMMIT per event, the latest value per field is kept in
+    memory and all pending values are written in one transaction when the
+    window closes, a lock is released, a client disconnects, or the process
+    exits.
+
+    The write happens after the edit was broadcast, so a value that cannot
+    be saved is reported to the client that sent it with an ``error`` event.
+    """
+
+    def __init__(self, delay=0.25):
+        """Initialize the buffer.
+
+        Args:
+            delay: Seconds to collect updates before writing them
+        """
+        self.delay = delay
+        self.app = None
+        self.socketio = None
+        self.pending = {}  # {(game_id, team_id): (score_value, points)}
+        self.senders = {}  # {(game_id, team_id): sid of the client that sent the pending value}
+        self.scheduled = False
+        self.mutex = Lock()
+        # Serializes flushes so an older batch never commits after a newer one
+        self.flush_mutex = Lock()
+        self._registered_exit = False
+
+    def init_app(self, app, socketio):
+        """Connect the buffer to an app and its Socket.IO server.
+
+        Args:
+            app: Flask application instance
+            socketio: SocketIO instance used to run the delayed flush
+        """
+        self.app = app
+        self.socketio = socketio
+        self.delay = app.config.get('SCORE_WRITE_BUFFER_DELAY', 0.25)
+
+        if not self._registered_exit:
+            atexit.register(self.flush_on_exit)
+            self._registered_exit = True
+
+    def add(self, game_id, team_id, score_value, points, sid=None):
+        """Buffer the latest value of a score, replacing any pending one.
+
+        Args:
+            game_id: ID of the game
+            team_id: ID of the team
+            score_value: Raw score entered
+            points: Points awarded
+            sid: Socket.IO session to notify if the value cannot be saved
+        """
+        with self.mutex:
+            self.pending[(game_id, team_id)] = (score_value, points)
+            self.senders[(game_id, team_id)] = sid
+            start_timer = not self.scheduled and self.socketio is not None
+            self.scheduled = self.scheduled or start_timer
+
+        if start_timer:
+            self.socketio.start_background_task(self._flush_later)
+
+    def get_pending(self, game_id):
+        """Get buffered values not yet written for a game.
+
+        Args:
+            game_id: ID of the game
+
+        Returns:
+            dict: {team_id: (score_value, points)}
+        """
+        with self.mutex:
+            return {
+                team_id: value for (pending_game_id, team_id), value in self.pending.items()
+                if pending_game_id == game_id
+            }
+
+    def _flush_later(self):
+        """Background task: write everything collected during the window."""
+        self.socketio.sleep(self.delay)
+        with self.mutex:
+            self.scheduled = False
+        with self.app.app_context():
+            self.flush()
+
+    def flush(self, keys=None):
+        """Write pending scores in a single transaction.
+
+        Must be called within an app context.
+
+        Args:
+            keys: Optional iterable of (game_id, team_id) to write; all if None
+
+        Returns:
+            int: Number of scores written
+        """
+        with self.flush_mutex:
+            with self.mutex:
+                if keys is None:
+                    batch, self.pending = self.pending, {}
+                    senders, self.senders = self.senders, {}
+                else:
+                    batch = {key: self.pending.pop(key) for key in keys if key in self.pending}
+                    senders = {key: self.senders.pop(key, None) for key in batch}
+
+            if not batch:
+                return 0
+
+            try:
+                written = self._write(batch, senders)
+            except OperationalError as e:
+                # Database busy or unreachable: nothing is wrong with the rows, retry them later
+                db.session.rollback()
+                logger.error(f"Failed to write {len(batch)} buffered scores: {e}", exc_info=True)
+                self._requeue(batch, senders)
+                return 0
+            except Exception as e:
+                db.session.rollback()
+                logger.error(f"Failed to write {len(batch)} buffered scores, retrying one at a time: {e}",
+                             exc_info=True)
+                written = self._write_each(batch, senders)
+
+        logger.debug(f"Flushed {written} buffered scores")
+        return written
+
+    def _requeue(self, batch, senders):
+        """Put a batch back unless a newer value has arrived meanwhile, and make sure a delayed flush retries it."""
+        with self.mutex:
+            for key, value in batch.items():
+                if key not in self.pending:
+                    self.pending[key] = value
+                    self.senders[key] = senders.get(key)
+            start_timer = not self.scheduled and self.socketio is not None
+            self.scheduled = self.scheduled or start_timer
+
+        if start_timer:
+            self.socketio.start_background_task(self._flush_later)
+
+    def _report_dropped(self, sid, key):
+        """Tell the client that sent a score it was not saved."""
+        if sid is None or self.socketio is None:
+            return
+        game_id, team_id = key
+        try:
+            self.socketio.emit('error', {
+                'message': 'Score could not be saved',
+                'game_id': game_id,
+                'team_id': team_id
+            }, room=sid)
+        except Exception as e:
+            logger.error(f"Failed to report dropped score {key} to {sid}: {e}", exc_info=True)
+
+    def _write_each(self, batch, senders):
+        """Write a failed batch row by row so one bad row cannot block the others.
+
+        Rows that still fail are dropped and logged; rows hit by a transient
+        database error are requeued.
+
+        Returns:
+            int: Number of scores written
+        """
+        written = 0
+        for key, value in batch.items():
+            try:
+                written += self._write({key: value}, senders)
+            except OperationalError as e:
+                db.session.rollback()
+                logger.error(f"Failed to write buffered score {key}: {e}", exc_info=True)
+                self._requeue({key: value}, senders)
+            except Exception as e:
+                db.session.rollback()
+                logger.error(f"Dropping buffered score {key} = {value}: {e}", exc_info=True)
+                self._report_dropped(senders.get(key), key)
+        return written
+
+    def _write(self, batch, senders):
+        """Upsert a batch of scores and drop the affected cached leaderboards.
+
+        Scores of games or teams that no longer exist are dropped and reported
+        to their senders, since they would fail the whole upsert on a foreign key.
+
+        Returns:
+            int: Number of scores written
+        """
+        from app.models.game import Game
+        from app.models.team import Team
+        from app.services.leaderboard_service import LeaderboardService
+        from app.services.score_service import ScoreService
+
+        games = {game.id: game for game in Game.query.filter(Game.id.in_({game_id for game_id, _ in batch}))}
+        known_team_ids = {
+            team_id for (team_id,) in db.session.query(Team.id).filter(Team.id.in_({team_id for _, team_id in batch}))
+        }
+
+        values_by_game = defaultdict(dict)
+        dropped = []
+        for (game_id, team_id), (score_value, points) in batch.items():
+            if game_id not in games or team_id not in known_team_ids:
+                logger.warning(f"Dropping buffered score for missing game {game_id} or team {team_id}")
+                dropped.append((game_id, team_id))
+                continue
+            try:
+                score_value = float(score_value) if score_value is not None else None
+            except (ValueError, TypeError):
+                score_value = None
+            try:
+                points = int(points)
+            except (ValueError, TypeError):
+                points = 0
+            values_by_game[game_id][team_id] = {'score_value': score_value, 'points': points}
+
+        for game_id, values in values_by_game.items():
+            ScoreService.upsert_scores(games[game_id], values)
+
+        game_night_ids = {games[game_id].game_night_id for game_id in values_by_game}
+        db.session.commit()
+        for game_night_id in game_night_ids:
+            LeaderboardService.invalidate(game_night_id)
+        for key in dropped:
+            self._report_dropped(senders.get(key), key)
+        return sum(len(values) for values in values_by_game.values())
+
+    def flush_on_exit(self):
+        """Write anything still pending when the process shuts down."""
+        if self.app is None or not self.pending:
+            return
+        with self.app.app_context():
+            self.flush()
+
+    def __len__(self):
+        with self.mutex:
+            return len(self.pending)
@@ -1,20 +1,181 @@
 """Timer Aggregator for multi-user timing."""
-from datetime import datetime
+import atexit
+import math
+from bisect import insort
+from datetime import datetime, timedelta
 from threading import Lock
+from sqlalchemy import bindparam
 from app import db
 from app.models.timer_record import TimerRecord
 from app.models.score import Score
+from app.services.leaderboard_service import LeaderboardService
+from app.websockets import timer_consensus
+from app.websockets.timer_queue import TimerRecordQueue
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Published after a flush rewrites a game's timer stats, so other workers reload them
+TIMER_TOPIC = 'timer'
+
+# Client-reported one-way latencies are clamped to this many seconds
+MAX_LATENCY = 5.0
+
+
+def _latency_seconds(latency):
+    """Convert a client-reported latency to seconds in [0, MAX_LATENCY]; 0 if it isn't a number."""
+    try:
+        latency = float(latency or 0)
+    except (TypeError, ValueError):
+        return 0.0
+    if not math.isfinite(latency):
+        return 0.0
+    return min(max(latency, 0.0), MAX_LATENCY)
+
+
+class TimerStats:
+    """Running aggregates of a team's active timer values.
+
+    Count, sum, min and max are updated in O(1) per value. Values are also
+    kept sorted (a team has a handful of timers) so the consensus estimators
+    in ``timer_consensus`` never sort.
+    """
+
+    def __init__(self, trim_fraction=0.1):
+        """Initialize empty statistics.
+
+        Args:
+            trim_fraction: Share of values dropped at each end for the trimmed mean
+        """
+        self.trim_fraction = trim_fraction
+        self.count = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = None
+        self.times = []  # In arrival order
+        self.sorted_times = []
+
+    def add(self, time_value):
+        """Fold a timer value into the aggregates."""
+        self.count += 1
+        self.total += time_value
+        self.minimum = time_value if self.minimum is None else min(self.minimum, time_value)
+        self.maximum = time_value if self.maximum is None else max(self.maximum, time_value)
+        self.times.append(time_value)
+        insort(self.sorted_times, time_value)
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    @property
+    def trimmed_mean(self):
+        """Mean without the fastest and slowest trim_fraction of values (outlier rejection)."""
+        return timer_consensus.trimmed_mean(self.sorted_times, self.total, self.trim_fraction)
+
+    def consensus(self, estimator=timer_consensus.DEFAULT_ESTIMATOR, tolerance=0.5):
+        """Get the consensus time (see timer_consensus.estimate)."""
+        return timer_consensus.estimate(self.sorted_times, self.total, estimator, self.trim_fraction, tolerance)
+
+    def to_dict(self):
+        return {
+            'times': list(self.times),
+            'count': self.count,
+            'sum': self.total,
+            'min': self.minimum,
+            'max': self.maximum,
+            'mean': self.mean,
+            'trimmed_mean': self.trimmed_mean
+        }
 
 
 class TimerAggregator:
-    """Aggregates multiple timer values for a team."""
+    """Aggregates multiple timer values for a team.
+
+    Keeps running statistics per (game_id, team_id), seeded from the active
+    timer records on first use, so a stop updates the consensus without
+    re-reading every record. The consensus uses the game's timer_estimator.
+    Timer records go through a TimerRecordQueue and the resulting
+    Score.multi_timer_avg and timer_count are written in batches, so a stop
+    never waits for a commit.
+
+    Other workers record stops for the same teams, so the batched write
+    recomputes the stats from the timer records in the database rather than
+    from this worker's running totals, keeps them as its cached stats and
+    publishes TIMER_TOPIC so every other worker reloads its own.
+
+    With skew correction on, a reported time that disagrees by more than
+    max_skew seconds with the server's own measurement (start and stop
+    arrival, each less the client's reported one-way latency) is replaced
+    by the server's measurement. This catches stopwatches that stalled,
+    e.g. in a throttled background tab.
+    """
+
+    def __init__(self, trim_fraction=0.1, flush_delay=1.0, tolerance=0.5,
+                 skew_correction=False, max_skew=1.0):
+        """Initialize the timer aggregator.
 
-    def __init__(self):
-        """Initialize the timer aggregator."""
-        self.active_timers = {}  # {(game_id, team_id, user_id): {'start_time', 'display_name'}}
+        Args:
+            trim_fraction: Share of values dropped at each end by trimmed_mean
+            flush_delay: Seconds to collect stat changes before writing them to scores
+            tolerance: Seconds from the consensus within which a timer agrees with it
+            skew_correction: Replace reported times that disagree with the server's measurement
+            max_skew: Seconds of disagreement tolerated before correcting
+        """
+        self.active_timers = {}  # {(game_id, team_id, user_id): {'start_time', 'display_name', 'started_at'}}
         self.timer_mutex = Lock()
+        self.trim_fraction = trim_fraction
+        self.flush_delay = flush_delay
+        self.tolerance = tolerance
+        self.skew_correction = skew_correction
+        self.max_skew = max_skew
+        self.stats = {}  # {(game_id, team_id): TimerStats}
+        self.estimators = {}  # {game_id: estimator name}
+        self.dirty = set()  # (game_id, team_id) whose stats changed since the last flush
+        self.stats_mutex = Lock()
+        self.app = None
+        self.socketio = None
+        self.scheduled = False
+        self._registered_exit = False
+        self.queue = TimerRecordQueue()
+
+    def init_app(self, app, socketio):
+        """Connect the aggregator to an app and its Socket.IO server.
+
+        Args:
+            app: Flask application instance
+            socketio: SocketIO instance used to run the delayed flush
+        """
+        from app.services.game_service import GAME_TOPIC
+        from app.utils.invalidation import invalidation_bus
 
-    def start_timer(self, game_id, team_id, user_id, display_name):
+        self.app = app
+        self.socketio = socketio
+        self.trim_fraction = app.config.get('TIMER_TRIM_FRACTION', 0.1)
+        self.flush_delay = app.config.get('TIMER_STATS_FLUSH_DELAY', 1.0)
+        self.tolerance = app.config.get('TIMER_AGREEMENT_TOLERANCE', 0.5)
+        self.skew_correction = app.config.get('TIMER_SKEW_CORRECTION', False)
+        self.max_skew = app.config.get('TIMER_MAX_SKEW', 1.0)
+        invalidation_bus.subscribe(GAME_TOPIC, self._forget_estimator)
+        invalidation_bus.subscribe(TIMER_TOPIC, self._forget_stats)
+        self.queue.init_app(app, socketio)
+
+        if not self._registered_exit:
+            atexit.register(self.flush_on_exit)
+            self._registered_exit = True
+
+    def _forget_estimator(self, game_id):
+        """Invalidation subscriber: re-read a game's estimator after it is edited."""
+        with self.stats_mutex:
+            self.estimators.pop(game_id, None)
+
+    def _forget_stats(self, game_id):
+        """Invalidation subscriber: reload a game's stats after any worker wrote them."""
+        with self.stats_mutex:
+            for key in [key for key in self.stats if game_id is None or key[0] == game_id]:
+                del self.stats[key]
+
+    def start_timer(self, game_id, team_id, user_id, display_name, latency=None):
         """Record timer start.
 
         Args:
@@ -22,16 +183,33 @@ class TimerAggregator:
             team_id: ID of the team
             user_id: ID of the user starting the timer
             display_name: Display name of the user
+            latency: Client's one-way latency in seconds, if it measured one
         """
+        now = datetime.utcnow()
         with self.timer_mutex:
             key = (game_id, team_id, user_id)
             self.active_timers[key] = {
-                'start_time': datetime.utcnow(),
-                'display_name': display_name
+                'start_time': now,
+                'display_name': display_name,
+                'started_at': now - timedelta(seconds=_latency_seconds(latency))
             }
 
-    def record_time(self, game_id, team_id, user_id, display_name, time_value):
-        """Record a timer value to database.
+    def _correct_skew(self, game_id, team_id, user_id, time_value, latency):
+        """Get the time to record, replacing it with the server's measurement if they disagree."""
+        timer = self.active_timers.get((game_id, team_id, user_id))
+        if not self.skew_correction or timer is None:
+            return time_value
+
+        stopped_at = datetime.utcnow() - timedelta(seconds=_latency_seconds(latency))
+        measured = (stopped_at - timer['started_at']).total_seconds()
+        if abs(measured - time_value) <= self.max_skew:
+            return time_value
+
+        logger.info(f"Corrected skewed timer of {user_id} for team {team_id}: {time_value:.3f}s -> {measured:.3f}s")
+        return measured
+
+    def record_time(self, game_id, team_id, user_id, display_name, time_value, latency=None):
+        """Record a timer value; it is written to the database by the ingestion queue.
 
         Args:
             game_id: ID of the game
@@ -39,29 +217,207 @@ class TimerAggregator:
             user_id: ID of the user recording time
             display_name: Display name of the user
             time_value: Time value in seconds (float)
+            latency: Client's one-way latency in seconds, if it measured one
 
         Returns:
-            TimerRecord: The created timer record
+            TimerRecord: The record (transient; not yet written)
         """
-        # Save to database
-        timer_record = TimerRecord(
-            game_id=game_id,
-            team_id=team_id,
-            user_id=user_id,
-            user_display_name=display_name,
-            time_value=time_value,
-            is_active=True
-        )
-        db.session.add(timer_record)
-        db.session.commit()
-
-        # Remove from active timers
         with self.timer_mutex:
-            key = (game_id, team_id, user_id)
-            if key in self.active_timers:
-                del self.active_timers[key]
+            time_value = self._correct_skew(game_id, team_id, user_id, time_value, latency)
+
+            # Remove from active timers
+            self.active_timers.pop((game_id, team_id, user_id), None)
+
+        row = {
+            'game_id': game_id,
+            'team_id': team_id,
+            'user_id': user_id,
+            'user_display_name': display_name,
+            'time_value': time_value,
+            'recorded_at': datetime.utcnow(),
+            'is_active': True
+        }
+
+        # Queue under the stats lock so a concurrent seed counts the row exactly once
+        with self.stats_mutex:
+            stats = self.stats.get((game_id, team_id))
+            if stats is not None:
+                stats.add(time_value)
+            self.queue.put(row)
+        self._mark_dirty(game_id, team_id)
 
-        return timer_record
+        return TimerRecord(**row)
+
+    def get_team_stats(self, game_id, team_id):
+        """Get the running statistics of a team's active timers.
+
+        Loads them from the active timer records (written and queued) on first
+        use, or after a flush by any worker changed them.
+
+        Args:
+            game_id: ID of the game
+            team_id: ID of the team
+
+        Returns:
+            dict: times (arrival order), count, sum, min, max, mean, trimmed_mean
+            and consensus (see timer_consensus.estimate; None without timers)
+        """
+        from app.utils.invalidation import invalidation_bus
+
+        # Socket.IO events don't run before_request, so pick up other workers' flushes here
+        invalidation_bus.poll()
+        with self.stats_mutex:
+            stats = self._load_stats(game_id, team_id)
+            return dict(stats.to_dict(), consensus=stats.consensus(self._estimator(game_id), self.tolerance))
+
+    def _estimator(self, game_id):
+        """Get a game's consensus estimator, cached until the game is edited. Call with stats_mutex held."""
+        if game_id not in self.estimators:
+            from app.models.game import Game
+            estimator = db.session.query(Game.timer_estimator).filter_by(id=game_id).scalar()
+            self.estimators[game_id] = (
+                estimator if estimator in timer_consensus.ESTIMATORS else timer_consensus.DEFAULT_ESTIMATOR
+            )
+        return self.estimators[game_id]
+
+    def _load_stats(self, game_id, team_id):
+        """Get a team's TimerStats, seeding them from the database. Call with stats_mutex held."""
+        key = (game_id, team_id)
+        if key not in self.stats:
+            self.stats[key] = self._read_stats([key])[key]
+        return self.stats[key]
+
+    def _read_stats(self, keys):
+        """Build TimerStats from the active timer records (written and queued) of some teams, in one query.
+
+        Args:
+            keys: Iterable of (game_id, team_id)
+
+        Returns:
+            dict: {(game_id, team_id): TimerStats}
+        """
+        stats = {key: TimerStats(self.trim_fraction) for key in keys}
+        # Waiting out an in-flight batch means every row is either written or still queued
+        with self.queue.flush_mutex:
+            written = db.session.query(TimerRecord.game_id, TimerRecord.team_id, TimerRecord.time_value).filter(
+                TimerRecord.game_id.in_({game_id for game_id, _ in stats}),
+                TimerRecord.team_id.in_({team_id for _, team_id in stats}),
+                TimerRecord.is_active.is_(True)
+            ).order_by(TimerRecord.id).all()
+            queued = [
+                (row['game_id'], row['team_id'], row['time_value'])
+                for row in self.queue.pending() if row['is_active']
+            ]
+        for game_id, team_id, time_value in list(written) + queued:
+            team_stats = stats.get((game_id, team_id))
+            if team_stats is not None:
+                team_stats.add(time_value)
+        return stats
+
+    def _mark_dirty(self, game_id, team_id):
+        """Queue a team's stats for the next batched score write."""
+        with self.stats_mutex:
+            self.dirty.add((game_id, team_id))
+            start_timer = not self.scheduled and self.socketio is not None
+            self.scheduled = self.scheduled or start_timer
+
+        if start_timer:
+            self.socketio.start_background_task(self._flush_later)
+
+    def _flush_later(self):
+        """Background task: write the stats that changed during the window."""
+        self.socketio.sleep(self.flush_delay)
+        with self.stats_mutex:
+            self.scheduled = False
+        with self.app.app_context():
+            self.flush()
+
+    def flush(self):
+        """Write changed stats to Score.multi_timer_avg and timer_count in one transaction.
+
+        The stats are recomputed from the database, so stops recorded by other
+        workers are counted, and replace this worker's cached stats. Only
+        existing scores are updated; a team's timer stats are written once a
+        score has been saved for it. Must be called within an app context.
+
+        Returns:
+            int: Number of scores written
+        """
+        from app.models.game import Game
+        from app.services.revision_service import RevisionService
+        from app.utils.invalidation import invalidation_bus
+
+        with self.stats_mutex:
+            keys, self.dirty = self.dirty, set()
+        if not keys:
+            return 0
+
+        # This worker's queued records must be in the database before the totals are read
+        self.queue.flush()
+
+        try:
+            with self.stats_mutex:
+                estimators = {game_id: self._estimator(game_id) for game_id, _ in keys}
+                stats_by_key = self._read_stats(keys)
+                values = {}
+                for (game_id, team_id), stats in stats_by_key.items():
+                    consensus = stats.consensus(estimators[game_id], self.tolerance)
+                    values[(game_id, team_id)] = {
+                        'multi_timer_avg': consensus['value'] if consensus else None,
+                        'timer_count': stats.count
+                    }
+                # Later stops are added to these under the same lock, so nothing is missed
+                self.stats.update(stats_by_key)
+
+            existing = set(db.session.query(Score.game_id, Score.team_id).filter(
+                Score.game_id.in_({game_id for game_id, _ in values}),
+                Score.team_id.in_({team_id for _, team_id in values})
+            ).all())
+            rows = [
+                {'key_game_id': game_id, 'key_team_id': team_id, **row}
+                for (game_id, team_id), row in values.items() if (game_id, team_id) in existing
+            ]
+            game_night_ids = dict(db.session.query(Game.id, Game.game_night_id).filter(
+                Game.id.in_({row['key_game_id'] for row in rows})
+            ).all())
+            if rows:
+                table = Score.__table__
+                connection = db.session.connection()
+                connection.execute(
+                    table.update().where(
+                        table.c.game_id == bindparam('key_game_id'),
+                        table.c.team_id == bindparam('key_team_id')
+                    ).values(
+                        multi_timer_avg=bindparam('multi_timer_avg'),
+                        timer_count=bindparam('timer_count')
+                    ),
+                    rows
+                )
+                RevisionService.bump(connection, {
+                    (game_night_ids[row['key_game_id']], row['key_team_id'], row['key_game_id'])
+                    for row in rows if game_night_ids.get(row['key_game_id']) is not None
+                })
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Failed to write timer stats for {len(keys)} scores: {e}", exc_info=True)
+            with self.stats_mutex:
+                self.dirty.update(keys)
+            return 0
+
+        # This worker's stats are already current, so only other workers reload theirs
+        for game_id in {game_id for game_id, _ in keys}:
+            invalidation_bus.publish(TIMER_TOPIC, game_id, local=False)
+        for game_night_id in set(game_night_ids.values()) - {None}:
+            LeaderboardService.invalidate(game_night_id)
+        return len(rows)
+
+    def flush_on_exit(self):
+        """Write stats still pending when the process shuts down."""
+        if self.app is None or not self.dirty:
+            return
+        with self.app.app_context():
+            self.flush()
 
     def get_team_timers(self, game_id, team_id):
         """Get all active timer records for a team.
@@ -73,6 +429,9 @@ class TimerAggregator:
         Returns:
             dict: {'times': list of float, 'timers': list of timer info dicts}
         """
+        # Write queued records first so the query sees them
+        self.queue.flush()
+
         records = TimerRecord.query.filter_by(
             game_id=game_id,
             team_id=team_id,
@@ -99,16 +458,21 @@ class TimerAggregator:
         Returns:
             int: Number of timers cleared
         """
-        count = TimerRecord.query.filter_by(
-            game_id=game_id,
-            team_id=team_id,
-            is_active=True
-        ).update({'is_active': False})
-        db.session.commit()
+        with self.stats_mutex, self.queue.flush_mutex:
+            count = TimerRecord.query.filter_by(
+                game_id=game_id,
+                team_id=team_id,
+                is_active=True
+            ).update({'is_active': False})
+            db.session.commit()
+            count += self.queue.deactivate(game_id, team_id)
+
+            self.stats[(game_id, team_id)] = TimerStats(self.trim_fraction)
+        self._mark_dirty(game_id, team_id)
         return count
 
     def calculate_average(self, game_id, team_id):
-        """Calculate average time and update Score model.
+        """Calculate the consensus time and update Score model.
 
         Args:
             game_id: ID of the game
@@ -117,18 +481,18 @@ class TimerAggregator:
         Returns:
             float or None: Average time value, or None if no timers
         """
-        timer_data = self.get_team_timers(game_id, team_id)
+        stats = self.get_team_stats(game_id, team_id)
 
-        if not timer_data['times']:
+        if not stats['count']:
             return None
 
-        avg_time = sum(timer_data['times']) / len(timer_data['times'])
+        avg_time = stats['consensus']['value']
 
         # Update Score model
         score = Score.query.filter_by(game_id=game_id, team_id=team_id).first()
         if score:
             score.multi_timer_avg = avg_time
-            score.timer_count = len(timer_data['times'])
+            score.timer_count = stats['count']
             score.score_value = avg_time  # Use average as the official score
             db.session.commit()
         else:
@@ -138,12 +502,13 @@ class TimerAggregator:
                 team_id=team_id,
                 score_value=avg_time,
                 multi_timer_avg=avg_time,
-                timer_count=len(timer_data['times']),
+                timer_count=stats['count'],
                 points=0  # Points will be calculated later
             )
             db.session.add(score)
             db.session.commit()
 
+        LeaderboardService.invalidate_for_game(game_id)
         return avg_time
 
     def get_active_timers_for_game(self, game_id):
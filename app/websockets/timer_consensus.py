@@ -0,0 +1,131 @@
+"""Consensus estimators for several people timing the same team.
+
+Each estimator works on the team's timer values kept sorted by TimerStats,
+so reading a consensus costs O(1) (mean, median), O(k) (trimmed mean) or
+O(n) (MAD filter, via a merge of the two sides of the median) rather than a
+sort per stop.
+
+Estimators:
+    mean            Plain average
+    median          Middle value; ignores any minority of outliers
+    trimmed_mean    Average without the fastest and slowest trim_fraction
+    mad_mean        Average of the values within MAD_THRESHOLD robust standard
+                    deviations (1.4826 x median absolute deviation) of the median
+"""
+from bisect import bisect_left, bisect_right
+
+ESTIMATORS = ('mean', 'median', 'trimmed_mean', 'mad_mean')
+DEFAULT_ESTIMATOR = 'trimmed_mean'
+
+# Values further than this many robust standard deviations from the median are dropped by mad_mean
+MAD_THRESHOLD = 3.0
+# Scales the median absolute deviation to the standard deviation of normally distributed values
+MAD_SCALE = 1.4826
+
+
+def median(sorted_values):
+    """Get the median of sorted values (None if empty)."""
+    count = len(sorted_values)
+    if not count:
+        return None
+    middle = count // 2
+    if count % 2:
+        return sorted_values[middle]
+    return (sorted_values[middle - 1] + sorted_values[middle]) / 2
+
+
+def absolute_deviations(sorted_values, center):
+    """Get |value - center| for sorted values, in ascending order, in O(n).
+
+    Values below the center give decreasing deviations and values above it
+    increasing ones, so the two runs are merged instead of sorted.
+    """
+    split = bisect_left(sorted_values, center)
+    below = [center - value for value in reversed(sorted_values[:split])]
+    above = [value - center for value in sorted_values[split:]]
+
+    merged = []
+    i = j = 0
+    while i < len(below) and j < len(above):
+        if below[i] <= above[j]:
+            merged.append(below[i])
+            i += 1
+        else:
+            merged.append(above[j])
+            j += 1
+    merged.extend(below[i:])
+    merged.extend(above[j:])
+    return merged
+
+
+def trimmed_mean(sorted_values, total, trim_fraction):
+    """Get the mean without the trim_fraction smallest and largest values."""
+    count = len(sorted_values)
+    if not count:
+        return None
+    trim = int(count * trim_fraction)
+    if trim == 0:
+        return total / count
+    kept = total - sum(sorted_values[:trim]) - sum(sorted_values[-trim:])
+    return kept / (count - 2 * trim)
+
+
+def mad_filtered(sorted_values):
+    """Get the values within MAD_THRESHOLD robust standard deviations of the median.
+
+    Returns:
+        list: Contiguous slice of sorted_values (all of them if the MAD is zero)
+    """
+    center = median(sorted_values)
+    mad = median(absolute_deviations(sorted_values, center))
+    if not mad:
+        return sorted_values
+    limit = MAD_THRESHOLD * MAD_SCALE * mad
+    return sorted_values[bisect_left(sorted_values, center - limit):bisect_right(sorted_values, center + limit)]
+
+
+def estimate(sorted_values, total, estimator=DEFAULT_ESTIMATOR, trim_fraction=0.1, tolerance=0.5):
+    """Compute a consensus time and how far the timers agree with it.
+
+    Args:
+        sorted_values: Timer values in ascending order
+        total: Sum of the values
+        estimator: One of ESTIMATORS
+        trim_fraction: Share trimmed at each end by trimmed_mean
+        tolerance: Seconds from the consensus within which a timer counts as agreeing
+
+    Returns:
+        dict: estimator, value, used (timers the estimate is based on) and
+        confidence (agreeing timers / (timers + 1): the share of timers within
+        tolerance of the value, discounted for small samples), or None if
+        there are no values
+
+    Raises:
+        ValueError: If the estimator is unknown
+    """
+    count = len(sorted_values)
+    if estimator not in ESTIMATORS:
+        raise ValueError(f"Unknown timer estimator '{estimator}'")
+    if not count:
+        return None
+
+    used = count
+    if estimator == 'mean':
+        value = total / count
+    elif estimator == 'median':
+        value = median(sorted_values)
+    elif estimator == 'trimmed_mean':
+        value = trimmed_mean(sorted_values, total, trim_fraction)
+        used = count - 2 * int(count * trim_fraction)
+    else:
+        kept = mad_filtered(sorted_values)
+        value = sum(kept) / len(kept)
+        used = len(kept)
+
+    agreeing = bisect_right(sorted_values, value + tolerance) - bisect_left(sorted_values, value - tolerance)
+    return {
+        'estimator': estimator,
+        'value': value,
+        'used': used,
+        'confidence': round(agreeing / (count + 1), 3)
+    }
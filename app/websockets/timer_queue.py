@@ -0,0 +1,268 @@
+"""Bounded ingestion queue for timer records."""
+import atexit
+import signal
+import threading
+import time
+from collections import deque
+from threading import Lock
+from sqlalchemy.exc import OperationalError
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class TimerRecordQueue:
+    """Queues stopped timers and writes them as TimerRecord rows in bulk transactions.
+
+    When a room of players stops their timers in the same second, each stop
+    only appends to the queue; a background flusher inserts everything
+    queued within max_latency seconds in one transaction. The queue is
+    bounded: a stop that finds it full writes the backlog itself before
+    returning, so memory stays capped and producers slow down to the
+    database's pace. Pending rows are written on exit and on SIGTERM.
+
+    Only transient database errors keep a failed batch queued; otherwise the
+    batch is retried row by row and rows that still fail are dropped, so one
+    bad row cannot block every later write.
+    """
+
+    def __init__(self, max_size=1000, max_latency=0.25):
+        """Initialize the queue.
+
+        Args:
+            max_size: Rows held before a producer has to write the backlog itself
+            max_latency: Seconds a row may wait before the background flush writes it
+        """
+        self.max_size = max_size
+        self.max_latency = max_latency
+        self.app = None
+        self.socketio = None
+        self.rows = deque()
+        self.scheduled = False
+        self.mutex = Lock()
+        # Held while a batch is being written; readers that must see every row wait on it
+        self.flush_mutex = threading.RLock()
+        self.counters = {
+            'enqueued': 0,
+            'written': 0,
+            'batches': 0,
+            'failed_batches': 0,
+            'dropped': 0,  # Rows that could not be written on their own (e.g. an unknown team)
+            'forced_flushes': 0,  # Flushes a producer ran because the queue was full
+            'max_depth': 0
+        }
+        self.last_flush_seconds = None
+        self._registered_exit = False
+        self._previous_sigterm = None
+
+    def init_app(self, app, socketio):
+        """Connect the queue to an app and its Socket.IO server.
+
+        Args:
+            app: Flask application instance
+            socketio: SocketIO instance used to run the delayed flush
+        """
+        self.app = app
+        self.socketio = socketio
+        self.max_size = app.config.get('TIMER_QUEUE_MAX_SIZE', 1000)
+        self.max_latency = app.config.get('TIMER_QUEUE_MAX_LATENCY', 0.25)
+
+        if not self._registered_exit:
+            atexit.register(self.flush_on_exit)
+            self._install_sigterm_handler()
+            self._registered_exit = True
+
+    def _install_sigterm_handler(self):
+        """Flush on SIGTERM, then defer to the previous handler (e.g. gunicorn's)."""
+        if threading.current_thread() is not threading.main_thread():
+            return
+        try:
+            self._previous_sigterm = signal.signal(signal.SIGTERM, self._handle_sigterm)
+        except ValueError:
+            # Not allowed here (e.g. embedded interpreter); atexit still covers normal exits
+            self._previous_sigterm = None
+
+    def _handle_sigterm(self, signum, frame):
+        # Flush from a helper thread: the interrupted main thread may hold self.mutex
+        writer = threading.Thread(target=self.flush_on_exit, daemon=True)
+        writer.start()
+        writer.join(timeout=10)
+        previous = self._previous_sigterm
+        if callable(previous):
+            previous(signum, frame)
+        elif previous != signal.SIG_IGN:
+            raise SystemExit(128 + signum)
+
+    def put(self, row):
+        """Queue a timer record.
+
+        Args:
+            row: Dict of TimerRecord column values
+        """
+        with self.mutex:
+            self.rows.append(row)
+            self.counters['enqueued'] += 1
+            depth = len(self.rows)
+            self.counters['max_depth'] = max(self.counters['max_depth'], depth)
+            full = depth >= self.max_size
+            if full:
+                self.counters['forced_flushes'] += 1
+            start_timer = not full and not self.scheduled and self.socketio is not None
+            self.scheduled = self.scheduled or start_timer
+
+        if full:
+            logger.warning(f"Timer record queue full ({depth} rows); writing backlog inline")
+            self.flush()
+        elif start_timer:
+            self.socketio.start_background_task(self._flush_later)
+
+    def pending(self, game_id=None, team_id=None):
+        """Get queued rows not yet written, optionally for one team.
+
+        Returns:
+            list: Row dicts in arrival order
+        """
+        with self.mutex:
+            return [
+                row for row in self.rows
+                if (game_id is None or row['game_id'] == game_id)
+                and (team_id is None or row['team_id'] == team_id)
+            ]
+
+    def deactivate(self, game_id, team_id):
+        """Mark a team's queued rows inactive (their timers were cleared).
+
+        Call with flush_mutex held so no batch is in flight.
+
+        Returns:
+            int: Number of rows deactivated
+        """
+        count = 0
+        with self.mutex:
+            for row in self.rows:
+                if row['game_id'] == game_id and row['team_id'] == team_id and row['is_active']:
+                    row['is_active'] = False
+                    count += 1
+        return count
+
+    def _flush_later(self):
+        """Background task: write everything queued during the window."""
+        self.socketio.sleep(self.max_latency)
+        with self.mutex:
+            self.scheduled = False
+        with self.app.app_context():
+            self.flush()
+
+    def flush(self):
+        """Write all queued rows in one transaction.
+
+        Must be called within an app context.
+
+        Returns:
+            int: Number of rows written
+        """
+        from app import db
+        from app.models.timer_record import TimerRecord
+
+        with self.flush_mutex:
+            with self.mutex:
+                batch = list(self.rows)
+                self.rows.clear()
+
+            if not batch:
+                return 0
+
+            started = time.perf_counter()
+            try:
+                db.session.execute(db.insert(TimerRecord), batch)
+                db.session.commit()
+                written = len(batch)
+            except OperationalError as e:
+                # Database busy or unreachable: nothing is wrong with the rows, retry them later
+                db.session.rollback()
+                logger.error(f"Failed to write {len(batch)} timer records: {e}", exc_info=True)
+                with self.mutex:
+                    self.counters['failed_batches'] += 1
+                self._requeue(batch)
+                return 0
+            except Exception as e:
+                db.session.rollback()
+                logger.error(f"Failed to write {len(batch)} timer records, retrying one at a time: {e}",
+                             exc_info=True)
+                with self.mutex:
+                    self.counters['failed_batches'] += 1
+                written = self._write_each(batch)
+
+            with self.mutex:
+                self.counters['written'] += written
+                self.counters['batches'] += 1
+                self.last_flush_seconds = time.perf_counter() - started
+
+        logger.debug(f"Wrote {written} timer records in one batch")
+        return written
+
+    def _requeue(self, rows):
+        """Put rows back ahead of newer ones and make sure a delayed flush will retry them."""
+        with self.mutex:
+            self.rows.extendleft(reversed(rows))
+            start_timer = not self.scheduled and self.socketio is not None
+            self.scheduled = self.scheduled or start_timer
+
+        if start_timer:
+            self.socketio.start_background_task(self._flush_later)
+
+    def _write_each(self, batch):
+        """Write a failed batch row by row; drop rows that fail on their own. Call with flush_mutex held.
+
+        Returns:
+            int: Number of rows written
+        """
+        from app import db
+        from app.models.timer_record import TimerRecord
+
+        written = 0
+        retry = []
+        for row in batch:
+            try:
+                db.session.execute(db.insert(TimerRecord), [row])
+                db.session.commit()
+                written += 1
+            except OperationalError as e:
+                db.session.rollback()
+                logger.error(f"Failed to write timer record: {e}", exc_info=True)
+                retry.append(row)
+            except Exception as e:
+                db.session.rollback()
+                logger.error(f"Dropping timer record {row}: {e}", exc_info=True)
+                with self.mutex:
+                    self.counters['dropped'] += 1
+
+        if retry:
+            self._requeue(retry)
+        return written
+
+    def flush_on_exit(self):
+        """Write anything still queued when the process shuts down."""
+        if self.app is None or not self.rows:
+            return
+        with self.app.app_context():
+            self.flush()
+
+    def metrics(self):
+        """Get queue depth and throughput counters.
+
+        Returns:
+            dict: depth, max_size, max_latency, last_flush_seconds and the counters
+        """
+        with self.mutex:
+            return dict(
+                self.counters,
+                depth=len(self.rows),
+                max_size=self.max_size,
+                max_latency=self.max_latency,
+                last_flush_seconds=self.last_flush_seconds
+            )
+
+    def __len__(self):
+        with self.mutex:
+            return len(self.rows)
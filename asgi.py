@@ -0,0 +1,14 @@
+"""ASGI Entry Point for the asyncio realtime server.
+
+Serves Socket.IO only; pages and the API stay on the WSGI app (wsgi.py).
+Run it next to gunicorn and route /socket.io/ to it at the reverse proxy:
+
+    uvicorn asgi:app --host 0.0.0.0 --port 8001
+"""
+import os
+from app import create_app
+from app.websockets.async_server import create_asgi_app
+
+config_name = os.getenv('FLASK_ENV', 'production')
+flask_app = create_app(config_name)
+app = create_asgi_app(flask_app)
@@ -39,6 +39,66 @@ class Config:
     FEEDBACK_DIR = FEEDBACK_DIR
     FEEDBACK_RATE_LIMIT = '5 per hour'  # Max 5 feedback submissions per hour per IP
 
+    # Leaderboard snapshot cache (number of game nights kept in memory, 0 disables)
+    LEADERBOARD_CACHE_SIZE = int(os.environ.get('LEADERBOARD_CACHE_SIZE', 32))
+
+    # Cross-worker cache invalidation ('local' = single process, 'database' = change_event table)
+    INVALIDATION_BACKEND = os.environ.get('INVALIDATION_BACKEND', 'local')
+    INVALIDATION_POLL_INTERVAL = float(os.environ.get('INVALIDATION_POLL_INTERVAL', 0.25))  # seconds
+
+    # Live leaderboard: wait this long after a write so a burst of edits is sent as one delta
+    LEADERBOARD_BROADCAST_DELAY = float(os.environ.get('LEADERBOARD_BROADCAST_DELAY', 0.5))  # seconds
+
+    # Live scoring: collect update_score edits this long before committing them together
+    SCORE_WRITE_BUFFER_DELAY = float(os.environ.get('SCORE_WRITE_BUFFER_DELAY', 0.25))  # seconds
+
+    # Multi-user timers: average drops this share of the fastest and slowest times (outliers);
+    # timer averages and counts are written to scores in batches this often
+    TIMER_TRIM_FRACTION = float(os.environ.get('TIMER_TRIM_FRACTION', 0.1))
+    TIMER_STATS_FLUSH_DELAY = float(os.environ.get('TIMER_STATS_FLUSH_DELAY', 1.0))  # seconds
+    # A timer within this many seconds of the consensus counts as agreeing (reported confidence)
+    TIMER_AGREEMENT_TOLERANCE = float(os.environ.get('TIMER_AGREEMENT_TOLERANCE', 0.5))
+    # Replace reported times that differ from the server's latency-corrected measurement
+    # by more than TIMER_MAX_SKEW seconds (e.g. a stopwatch stalled in a background tab)
+    TIMER_SKEW_CORRECTION = os.environ.get('TIMER_SKEW_CORRECTION', 'false').lower() == 'true'
+    TIMER_MAX_SKEW = float(os.environ.get('TIMER_MAX_SKEW', 1.0))  # seconds
+    # Timer records are queued and inserted in bulk at most this long after a stop;
+    # a stop that finds TIMER_QUEUE_MAX_SIZE rows queued writes the backlog itself
+    TIMER_QUEUE_MAX_LATENCY = float(os.environ.get('TIMER_QUEUE_MAX_LATENCY', 0.25))  # seconds
+    TIMER_QUEUE_MAX_SIZE = int(os.environ.get('TIMER_QUEUE_MAX_SIZE', 1000))
+
+    # Socket.IO message queue for multiple workers ('' = single process, 'database' = socket_message
+    # table relay, or a Flask-SocketIO queue URL such as redis://localhost:6379/0)
+    SOCKETIO_MESSAGE_QUEUE = os.environ.get('SOCKETIO_MESSAGE_QUEUE', '')
+    SOCKETIO_QUEUE_POLL_INTERVAL = float(os.environ.get('SOCKETIO_QUEUE_POLL_INTERVAL', 0.1))  # seconds
+
+    # Asyncio realtime server (asgi.py): threads running event handlers' database work
+    ASYNC_DB_WORKERS = int(os.environ.get('ASYNC_DB_WORKERS', 8))
+    # Threads for debounced flushes and the lock sweeper / invalidation poll loops
+    ASYNC_BACKGROUND_WORKERS = int(os.environ.get('ASYNC_BACKGROUND_WORKERS', 6))
+
+    # Score field edit locks ('memory' = this process only, 'database' = active_edit table)
+    EDIT_LOCK_BACKEND = os.environ.get('EDIT_LOCK_BACKEND', 'memory')
+    EDIT_LOCK_TIMEOUT_MINUTES = int(os.environ.get('EDIT_LOCK_TIMEOUT_MINUTES', 5))
+
+    # SQLite tuning applied to every new connection (see app/utils/sqlite_tuning.py).
+    # WAL lets readers run alongside the single writer; NORMAL sync is durable in WAL mode
+    # except for the last commits before a power loss.
+    SQLITE_PRAGMAS = {
+        'busy_timeout': int(os.environ.get('SQLITE_BUSY_TIMEOUT', 5000)),  # ms to wait for a lock
+        'journal_mode': os.environ.get('SQLITE_JOURNAL_MODE', 'WAL'),
+        'synchronous': os.environ.get('SQLITE_SYNCHRONOUS', 'NORMAL'),
+        'mmap_size': int(os.environ.get('SQLITE_MMAP_SIZE', 256 * 1024 * 1024)),  # bytes
+        'cache_size': int(os.environ.get('SQLITE_CACHE_SIZE', -64000)),  # negative = KiB
+        'temp_store': os.environ.get('SQLITE_TEMP_STORE', 'MEMORY'),
+    }
+
+    # Optional read engine for GET requests and read-only service methods (see app/utils/db_routing.py):
+    # a PostgreSQL replica, or the SQLite file opened read-only in WAL mode
+    # (sqlite:///file:/path/to/gamenight.db?mode=ro&uri=true)
+    READ_DATABASE_URL = os.environ.get('READ_DATABASE_URL')
+    SQLALCHEMY_BINDS = {'read': READ_DATABASE_URL} if READ_DATABASE_URL else {}
+
 
 class DevelopmentConfig(Config):
     """Development configuration."""
@@ -60,6 +120,7 @@ class TestingConfig(Config):
     SQLALCHEMY_ECHO = False
     WTF_CSRF_ENABLED = False
     RATELIMIT_ENABLED = False  # Disable rate limiting in tests
+    SQLITE_PRAGMAS = {}  # In-memory database has no journal or file to tune
 
 
 class ProductionConfig(Config):
@@ -69,6 +130,18 @@ class ProductionConfig(Config):
     SQLALCHEMY_DATABASE_URI = f'sqlite:///{INSTANCE_DIR}/gamenight.db'
     SQLALCHEMY_ECHO = False
 
+    # Keep connections open so each worker thread reuses its page cache and mmap;
+    # sqlite3's timeout backs up busy_timeout while a connection is being opened
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': int(os.environ.get('SQLITE_POOL_SIZE', 10)),
+        'max_overflow': int(os.environ.get('SQLITE_POOL_MAX_OVERFLOW', 10)),
+        'pool_timeout': 30,
+        'connect_args': {
+            'timeout': int(os.environ.get('SQLITE_BUSY_TIMEOUT', 5000)) / 1000,
+            'check_same_thread': False,
+        },
+    }
+
     # Server-side session storage
     SESSION_TYPE = 'filesystem'
     SESSION_FILE_DIR = INSTANCE_DIR / 'flask_session'
@@ -89,6 +162,12 @@ class ProductionConfig(Config):
     PREFERRED_URL_SCHEME = 'https'
     APPLICATION_ROOT = '/'
 
+    # gunicorn runs multiple workers, so caches and edit locks must be shared across processes.
+    # Room emits are not relayed by default: the database relay writes a row per emit (including
+    # every score keystroke), so set SOCKETIO_MESSAGE_QUEUE to a Redis/AMQP URL for multi-worker rooms.
+    INVALIDATION_BACKEND = os.environ.get('INVALIDATION_BACKEND', 'database')
+    EDIT_LOCK_BACKEND = os.environ.get('EDIT_LOCK_BACKEND', 'database')
+
 
 config_by_name = {
     'development': DevelopmentConfig,
@@ -26,6 +26,14 @@ def db_session(app):
         # Create all tables
         db.create_all()
 
+        # Cached leaderboards and brackets would outlive the in-memory database between tests
+        from app.services.leaderboard_service import leaderboard_cache
+        from app.services.tournament_service import bracket_cache
+        from app.websockets import leaderboard_broadcaster
+        leaderboard_cache.clear()
+        bracket_cache.clear()
+        leaderboard_broadcaster.reset()
+
         yield db.session
 
         # Rollback any changes and remove session
@@ -0,0 +1,88 @@
+"""Integration tests for JSON API routes."""
+import pytest
+from app.services.score_service import ScoreService
+from app.services.team_service import TeamService
+
+
+class TestLeaderboardApi:
+    """Test the polling leaderboard endpoint."""
+
+    def test_full_leaderboard(self, client, db_session, game_night, teams, game, completed_game):
+        """Test the full response contains standings, games and scores."""
+        response = client.get(f'/api/game-nights/{game_night.id}/leaderboard')
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['full'] is True
+        assert data['revision'] > 0
+        assert data['order'] == [t.id for t in teams]
+        assert data['standings'][0] == {
+            'rank': 1, 'team_id': teams[0].id, 'name': teams[0].name,
+            'color': teams[0].color, 'points': 3, 'games_played': 1
+        }
+        assert {g['id'] for g in data['games']} == {game.id, completed_game.id}
+        assert len(data['scores']) == 3
+
+    def test_since_current_revision_is_empty(self, client, db_session, game_night, teams, completed_game):
+        """Test polling with the current revision returns no changes."""
+        revision = client.get(f'/api/game-nights/{game_night.id}/leaderboard').get_json()['revision']
+
+        data = client.get(f'/api/game-nights/{game_night.id}/leaderboard?since={revision}').get_json()
+
+        assert data['full'] is False
+        assert data['revision'] == revision
+        assert data['standings'] == [] and data['games'] == [] and data['scores'] == []
+
+    def test_since_returns_changed_scores_only(self, client, db_session, game_night, teams, game, completed_game):
+        """Test a delta contains only the teams and scores written since."""
+        revision = client.get(f'/api/game-nights/{game_night.id}/leaderboard').get_json()['revision']
+        ScoreService.save_scores(game.id, {teams[2].id: {'points': 10}}, is_completed=False)
+
+        data = client.get(f'/api/game-nights/{game_night.id}/leaderboard?since={revision}').get_json()
+
+        assert data['full'] is False
+        assert data['revision'] > revision
+        assert data['order'][0] == teams[2].id
+        assert [row['team_id'] for row in data['standings']] == [teams[2].id]
+        assert data['standings'][0]['points'] == 11
+        assert data['scores'] == [{'team_id': teams[2].id, 'game_id': game.id, 'points': 10}]
+
+    def test_since_reports_removed_team(self, client, db_session, game_night, teams):
+        """Test deleted teams are listed so clients can drop them."""
+        revision = client.get(f'/api/game-nights/{game_night.id}/leaderboard').get_json()['revision']
+        TeamService.delete_team(teams[0].id)
+
+        data = client.get(f'/api/game-nights/{game_night.id}/leaderboard?since={revision}').get_json()
+
+        assert data['removed_teams'] == [teams[0].id]
+        assert teams[0].id not in data['order']
+
+    def test_future_revision_returns_full(self, client, db_session, game_night, teams):
+        """Test an unknown revision falls back to a full reload."""
+        data = client.get(f'/api/game-nights/{game_night.id}/leaderboard?since=99999').get_json()
+
+        assert data['full'] is True
+        assert len(data['standings']) == 3
+
+    def test_unknown_game_night(self, client, db_session):
+        """Test a missing game night returns a JSON 404."""
+        response = client.get('/api/game-nights/99999/leaderboard')
+
+        assert response.status_code == 404
+        assert 'not found' in response.get_json()['error']
+
+
+class TestRealtimeMetricsApi:
+    """Test the realtime queue metrics endpoint."""
+
+    def test_requires_login(self, client):
+        """Test anonymous users are sent to the login page."""
+        assert client.get('/api/realtime/metrics').status_code == 302
+
+    def test_reports_timer_queue_depth(self, authenticated_client):
+        """Test the timer record queue depth and counters are reported."""
+        data = authenticated_client.get('/api/realtime/metrics').get_json()
+
+        assert data['timer_records']['depth'] == 0
+        assert {'enqueued', 'written', 'batches', 'max_depth', 'max_latency'} <= set(data['timer_records'])
+        assert data['score_buffer'] == {'depth': 0}
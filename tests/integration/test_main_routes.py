@@ -157,6 +157,81 @@ class TestGameNightDetailsRoute:
         assert game.name.encode() in response.data
 
 
+class TestConditionalRequests:
+    """Test ETag revalidation of leaderboard, teams, games and history pages."""
+
+    @pytest.mark.parametrize('path', ['/', '/teams', '/games'])
+    def test_unchanged_page_returns_304(self, client, db_session, game_night, teams, game, path):
+        """Test a matching If-None-Match skips rendering."""
+        response = client.get(path)
+        assert response.status_code == 200
+        etag = response.headers['ETag']
+        assert 'no-cache' in response.headers['Cache-Control']
+
+        revalidated = client.get(path, headers={'If-None-Match': etag})
+
+        assert revalidated.status_code == 304
+        assert revalidated.data == b''
+        assert revalidated.headers['ETag'] == etag
+
+    def test_history_detail_returns_304(self, client, db_session, game_night, teams):
+        """Test game night detail pages are revalidated too."""
+        etag = client.get(f'/history/{game_night.id}').headers['ETag']
+
+        response = client.get(f'/history/{game_night.id}', headers={'If-None-Match': etag})
+
+        assert response.status_code == 304
+
+    def test_score_write_changes_etag(self, client, db_session, game_night, teams, game):
+        """Test a score write makes the cached page stale."""
+        from app.services.score_service import ScoreService
+
+        etag = client.get('/').headers['ETag']
+        ScoreService.save_scores(game.id, {teams[0].id: {'points': 3}}, is_completed=True)
+
+        response = client.get('/', headers={'If-None-Match': etag})
+
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+
+    def test_etag_differs_per_viewer(self, client, admin_user, db_session, game_night, teams):
+        """Test admins and public viewers do not share cached pages."""
+        public_etag = client.get('/').headers['ETag']
+        client.post('/auth/login', data={
+            'username': admin_user.username,
+            'password': 'testpassword123'
+        })
+
+        response = client.get('/', headers={'If-None-Match': public_etag})
+
+        assert response.status_code == 200
+        assert response.headers['ETag'] != public_etag
+
+    def test_new_csrf_token_changes_etag(self, authenticated_client, db_session, game_night, teams, game):
+        """Test a page embedding a form is re-rendered once the session's CSRF token changes."""
+        etag = authenticated_client.get('/games').headers['ETag']
+        with authenticated_client.session_transaction() as sess:
+            sess.pop('csrf_token', None)
+
+        response = authenticated_client.get('/games', headers={'If-None-Match': etag})
+
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+
+    def test_etag_expires_with_csrf_time_limit(self, app, authenticated_client, db_session, game_night,
+                                               monkeypatch):
+        """Test a 304 is only answered within half of a CSRF token's lifetime."""
+        app.config['WTF_CSRF_TIME_LIMIT'] = 3600
+        monkeypatch.setattr('app.utils.route_helpers.time.time', lambda: 1000.0)
+        etag = authenticated_client.get('/games').headers['ETag']
+        assert authenticated_client.get('/games', headers={'If-None-Match': etag}).status_code == 304
+
+        monkeypatch.setattr('app.utils.route_helpers.time.time', lambda: 1000.0 + 1800)
+        response = authenticated_client.get('/games', headers={'If-None-Match': etag})
+
+        assert response.status_code == 200
+
+
 class TestPublicRoutes:
     """Test that certain routes are public."""
 
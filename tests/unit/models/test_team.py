@@ -38,14 +38,19 @@ class TestTeamModel:
         team = teams[0]
         assert team.totalPoints == 0
 
-    def test_total_points_with_scores(self, db_session, teams, game):
+    def test_total_points_with_scores(self, db_session, game_night, teams, game):
         """Test totalPoints calculation with multiple scores."""
+        from tests.factories import GameFactory
+
         team = teams[0]
+        # A team has at most one score per game
+        game2 = GameFactory.create(db_session, name='Game 2', game_night_id=game_night.id, sequence_number=2)
+        game3 = GameFactory.create(db_session, name='Game 3', game_night_id=game_night.id, sequence_number=3)
 
         # Add multiple scores
         score1 = Score(game_id=game.id, team_id=team.id, score_value=100, points=10)
-        score2 = Score(game_id=game.id, team_id=team.id, score_value=90, points=8)
-        score3 = Score(game_id=game.id, team_id=team.id, score_value=80, points=6)
+        score2 = Score(game_id=game2.id, team_id=team.id, score_value=90, points=8)
+        score3 = Score(game_id=game3.id, team_id=team.id, score_value=80, points=6)
 
         db_session.add_all([score1, score2, score3])
         db_session.commit()
@@ -55,16 +60,22 @@ class TestTeamModel:
 
         assert team.totalPoints == 24  # 10 + 8 + 6
 
-    def test_games_played(self, db_session, teams, game):
+    def test_games_played(self, db_session, game_night, teams, game):
         """Test games_played property."""
+        from tests.factories import GameFactory
+
         team = teams[0]
 
         # Initially no games played
         assert team.games_played == 0
 
         # Add scores for 3 games
-        for i in range(3):
-            score = Score(game_id=game.id, team_id=team.id, score_value=100, points=10)
+        games = [game] + [
+            GameFactory.create(db_session, name=f'Game {i}', game_night_id=game_night.id, sequence_number=i)
+            for i in (2, 3)
+        ]
+        for each_game in games:
+            score = Score(game_id=each_game.id, team_id=team.id, score_value=100, points=10)
             db_session.add(score)
 
         db_session.commit()
@@ -0,0 +1,89 @@
+"""Unit tests for BracketBuilder."""
+import pytest
+from sqlalchemy import event
+from app import db
+from app.models import Match, Tournament
+from app.services.bracket_builder import BracketBuilder
+from app.services.tournament_service import TournamentService
+from tests.factories import GameFactory, GameNightFactory, TeamFactory
+
+
+@pytest.fixture
+def tournament(db_session):
+    game_night = GameNightFactory.create(db_session)
+    game = GameFactory.create(db_session, game_night_id=game_night.id)
+    tournament = Tournament(game_id=game.id)
+    db_session.add(tournament)
+    db_session.flush()
+    return tournament
+
+
+def count_match_statements(func):
+    """Run func and count the SQL statements it sends to the match table."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if '"match"' in statement:
+            statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', record)
+    try:
+        func()
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', record)
+    return len(statements)
+
+
+@pytest.mark.unit
+@pytest.mark.services
+class TestBracketBuilder:
+    """Test in-memory bracket construction and bulk writes."""
+
+    def test_write_links_matches_by_position(self, db_session, tournament):
+        """Test next_match_id is resolved from bracket positions."""
+        builder = BracketBuilder()
+        builder.add_match(2, 0)
+        builder.add_match(1, 0)
+        builder.add_match(1, 1)
+        builder.link(('main', 1, 0), ('main', 2, 0), 'team1')
+        builder.link(('main', 1, 1), ('main', 2, 0), 'team2')
+
+        ids = builder.write(tournament.id)
+
+        final = db_session.get(Match, ids[('main', 2, 0)])
+        assert final.next_match_id is None
+        assert {(m.id, m.next_match_position) for m in final.previous_matches} == {
+            (ids[('main', 1, 0)], 'team1'), (ids[('main', 1, 1)], 'team2')
+        }
+
+    def test_advance_fills_next_slot(self, db_session, tournament):
+        """Test a bye winner is placed before anything is written."""
+        builder = BracketBuilder()
+        builder.add_match(2, 0)
+        builder.add_match(1, 1, team1_id=7, is_bye=True)
+        builder.link(('main', 1, 1), ('main', 2, 0), 'team2')
+
+        builder.advance(('main', 1, 1), 7)
+
+        assert builder.matches[('main', 1, 1)]['status'] == 'completed'
+        assert builder.matches[('main', 2, 0)]['team2_id'] == 7
+
+    def test_statement_count_independent_of_bracket_size(self, db_session):
+        """Test a 32-team bracket takes as many match statements as a 4-team one."""
+        game_night = GameNightFactory.create(db_session)
+        small_teams = TeamFactory.create_batch(db_session, count=4, game_night_id=game_night.id)
+        large_teams = TeamFactory.create_batch(db_session, count=32, game_night_id=game_night.id)
+        small_game = GameFactory.create(db_session, game_night_id=game_night.id)
+        large_game = GameFactory.create(db_session, game_night_id=game_night.id)
+        small_ids = [t.id for t in small_teams]
+        large_ids = [t.id for t in large_teams]
+        small_game_id, large_game_id = small_game.id, large_game.id
+
+        small = count_match_statements(lambda: TournamentService.create_tournament(
+            small_game_id, included_team_ids=small_ids))
+        large = count_match_statements(lambda: TournamentService.create_tournament(
+            large_game_id, included_team_ids=large_ids))
+
+        assert large == small == 3
+        assert Match.query.filter_by(tournament_id=Tournament.query.filter_by(
+            game_id=large_game_id).one().id).count() == 31
@@ -0,0 +1,180 @@
+"""Unit tests for LeaderboardService."""
+import pytest
+from app.services.leaderboard_service import LeaderboardService, LeaderboardRow
+from app.models import Team, Score
+from tests.factories import GameNightFactory, TeamFactory, GameFactory, ScoreFactory
+
+
+class TestLeaderboardService:
+    """Test SQL-aggregated standings."""
+
+    def test_get_standings_ranks_by_points(self, db_session, game_night, teams, game, completed_game):
+        """Test standings are ordered by total points with games played."""
+        ScoreFactory.create(db_session, game.id, teams[2].id, points=10)
+
+        standings = LeaderboardService.get_standings(game_night.id)
+
+        assert [row.team_id for row in standings] == [teams[2].id, teams[0].id, teams[1].id]
+        assert [row.rank for row in standings] == [1, 2, 3]
+        assert standings[0] == LeaderboardRow(1, teams[2].id, 'Team Gamma', '#0000FF', 11, 2)
+        assert standings[1].points == 3
+        assert standings[1].games_played == 1
+
+    def test_get_standings_includes_teams_without_scores(self, db_session, game_night, teams):
+        """Test teams with no scores appear with zero points."""
+        standings = LeaderboardService.get_standings(game_night.id)
+
+        assert len(standings) == 3
+        assert all(row.points == 0 and row.games_played == 0 for row in standings)
+        # Ties keep creation order
+        assert [row.team_id for row in standings] == [t.id for t in teams]
+
+    def test_get_standings_scoped_to_game_night(self, db_session, game_night, teams, completed_game):
+        """Test scores from other game nights are not counted."""
+        other_night = GameNightFactory.create(db_session, name='Other', is_active=False,
+                                              is_working_context=False)
+        other_game = GameFactory.create(db_session, game_night_id=other_night.id)
+        ScoreFactory.create(db_session, other_game.id, teams[2].id, points=100)
+
+        standings = LeaderboardService.get_standings(game_night.id)
+
+        assert standings[0].team_id == teams[0].id
+        assert {row.team_id: row.points for row in standings}[teams[2].id] == 1
+
+    def test_get_standings_all_game_nights(self, db_session, game_night, teams, completed_game):
+        """Test standings without a game night cover every team and score."""
+        other_night = GameNightFactory.create(db_session, name='Other', is_active=False,
+                                              is_working_context=False)
+        other_team = TeamFactory.create(db_session, name='Outsider', game_night_id=other_night.id)
+
+        standings = LeaderboardService.get_standings()
+
+        assert len(standings) == 4
+        assert standings[-1].team_id == other_team.id
+
+    def test_get_ranked_teams_returns_team_objects(self, db_session, game_night, teams, completed_game):
+        """Test ranked teams are Team instances in standings order."""
+        ranked = LeaderboardService.get_ranked_teams(game_night.id)
+
+        assert all(isinstance(team, Team) for team in ranked)
+        assert [t.id for t in ranked] == [teams[0].id, teams[1].id, teams[2].id]
+        assert LeaderboardService.get_ranked_teams(game_night.id, limit=1) == [teams[0]]
+
+    def test_ranked_teams_with_standings_in_one_query(self, db_session, game_night, teams, completed_game):
+        """Test pages get Team objects and their standings from a single statement."""
+        game_night_id = game_night.id
+        result = []
+        count = TestLeaderboardSnapshotCache._count_queries(
+            lambda: result.append(LeaderboardService.get_ranked_teams_with_standings(game_night_id))
+        )
+        ranked, standings = result[0]
+
+        assert count == 1
+        assert ranked == LeaderboardService.get_ranked_teams(game_night.id)
+        assert {team_id: (row.rank, row.points) for team_id, row in standings.items()} == {
+            row.team_id: (row.rank, row.points) for row in LeaderboardService.get_standings(game_night.id)
+        }
+
+    def test_get_winners_for_multiple_game_nights(self, db_session, game_night, teams, completed_game):
+        """Test winners are resolved for several game nights at once."""
+        other_night = GameNightFactory.create(db_session, name='Other', is_active=False,
+                                              is_working_context=False)
+        other_teams = TeamFactory.create_batch(db_session, count=2, game_night_id=other_night.id)
+        other_game = GameFactory.create(db_session, game_night_id=other_night.id)
+        ScoreFactory.create(db_session, other_game.id, other_teams[1].id, points=7)
+        empty_night = GameNightFactory.create(db_session, name='Empty', is_active=False,
+                                              is_working_context=False)
+
+        winners = LeaderboardService.get_winners([game_night.id, other_night.id, empty_night.id])
+
+        assert winners[game_night.id].team_id == teams[0].id
+        assert winners[game_night.id].points == 3
+        assert winners[other_night.id].team_id == other_teams[1].id
+        assert winners[other_night.id].points == 7
+        assert empty_night.id not in winners
+
+    def test_get_winners_empty(self, db_session):
+        """Test no game nights yields no winners."""
+        assert LeaderboardService.get_winners([]) == {}
+
+
+class TestLeaderboardSnapshotCache:
+    """Test the cached leaderboard snapshot and its invalidation."""
+
+    @staticmethod
+    def _count_queries(func):
+        """Run func and return how many SQL statements it executed."""
+        from sqlalchemy import event
+        from app import db
+
+        statements = []
+
+        def record(*args):
+            statements.append(args[2])
+
+        engine = db.engine
+        event.listen(engine, 'before_cursor_execute', record)
+        try:
+            func()
+        finally:
+            event.remove(engine, 'before_cursor_execute', record)
+        return len(statements)
+
+    def test_snapshot_contents(self, db_session, game_night, teams, game, completed_game):
+        """Test snapshot holds ranked teams, standings, games and scores."""
+        snapshot = LeaderboardService.get_snapshot(game_night.id)
+
+        assert [t.id for t in snapshot.teams] == [t.id for t in teams]
+        assert snapshot.teams[0].abbreviation == teams[0].abbreviation
+        assert snapshot.standings[teams[0].id].points == 3
+        assert {g.id for g in snapshot.games} == {game.id, completed_game.id}
+        assert snapshot.scores[(teams[1].id, completed_game.id)].points == 2
+
+    def test_cache_hit_costs_no_queries(self, app, db_session, game_night, teams, completed_game):
+        """Test repeated reads are served from memory."""
+        LeaderboardService.get_snapshot(game_night.id)
+        hits_before = LeaderboardService.get_cache_stats()['hits']
+
+        count = self._count_queries(lambda: LeaderboardService.get_snapshot(game_night.id))
+
+        assert count == 0
+        assert LeaderboardService.get_cache_stats()['hits'] == hits_before + 1
+
+    def test_score_write_invalidates(self, db_session, game_night, teams, completed_game):
+        """Test ScoreService writes drop the cached snapshot."""
+        from app.services.score_service import ScoreService
+
+        LeaderboardService.get_snapshot(game_night.id)
+        ScoreService.save_scores(completed_game.id, {teams[2].id: {'points': 10}}, is_completed=True)
+
+        snapshot = LeaderboardService.get_snapshot(game_night.id)
+        assert snapshot.teams[0].id == teams[2].id
+        assert snapshot.scores[(teams[2].id, completed_game.id)].points == 10
+
+    def test_team_and_game_writes_invalidate(self, db_session, game_night, teams):
+        """Test TeamService and GameService mutations drop the cached snapshot."""
+        from app.services.team_service import TeamService
+        from app.services.game_service import GameService
+
+        assert len(LeaderboardService.get_snapshot(game_night.id).teams) == 3
+        TeamService.delete_team(teams[0].id)
+        assert len(LeaderboardService.get_snapshot(game_night.id).teams) == 2
+
+        assert LeaderboardService.get_snapshot(game_night.id).games == ()
+        GameService.create_game({
+            'name': 'New Game', 'type': 'trivia', 'sequence_number': 1,
+            'point_scheme': 1, 'metric_type': 'score'
+        }, game_night_id=game_night.id)
+        assert len(LeaderboardService.get_snapshot(game_night.id).games) == 1
+
+    def test_invalidate_also_drops_all_game_nights_view(self, db_session, game_night, teams):
+        """Test the all-game-nights snapshot is dropped with any game night."""
+        from app.services.leaderboard_service import leaderboard_cache
+
+        LeaderboardService.get_snapshot(None)
+        LeaderboardService.get_snapshot(game_night.id)
+
+        LeaderboardService.invalidate(game_night.id)
+
+        assert None not in leaderboard_cache
+        assert game_night.id not in leaderboard_cache
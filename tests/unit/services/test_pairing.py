@@ -0,0 +1,124 @@
+"""Unit tests for the tournament pairing engines."""
+import random
+import time
+from itertools import combinations
+import pytest
+from app.services.pairing import circle_schedule, first_round_pairs, seed_order, seeded_pairs, swiss_pairings
+
+
+@pytest.mark.unit
+@pytest.mark.services
+class TestCircleSchedule:
+    """Test round-robin scheduling with the circle method."""
+
+    @pytest.mark.parametrize('count', [2, 5, 6, 9, 100])
+    def test_every_pair_meets_exactly_once(self, count):
+        """Test n teams get n(n - 1)/2 distinct pairings in n - 1 (or n) rounds."""
+        rounds = circle_schedule(list(range(1, count + 1)))
+
+        pairs = [frozenset(pair) for pairs in rounds for pair in pairs]
+        assert len(rounds) == (count if count % 2 else count - 1)
+        assert len(pairs) == len(set(pairs)) == count * (count - 1) // 2
+        assert set(pairs) == {frozenset(pair) for pair in combinations(range(1, count + 1), 2)}
+
+    def test_teams_play_at_most_once_per_round(self):
+        """Test each round is a matching; with an odd count one team sits out."""
+        for pairs in circle_schedule([1, 2, 3, 4, 5, 6, 7]):
+            teams = [team for pair in pairs for team in pair]
+            assert len(teams) == len(set(teams)) == 6
+
+    def test_fixed_seat_alternates_sides(self):
+        """Test the first team is not team1 in every round."""
+        sides = [pairs[0].index(1) for pairs in circle_schedule([1, 2, 3, 4])]
+        assert sides == [0, 1, 0]
+
+
+@pytest.mark.unit
+@pytest.mark.services
+class TestFirstRoundPairs:
+    """Test elimination first-round placement."""
+
+    def test_byes_fill_last_matches(self):
+        """Test every match gets a team and byes go to the end."""
+        assert first_round_pairs([1, 2, 3, 4, 5], 8) == [(1, 5), (2, None), (3, None), (4, None)]
+
+    def test_full_bracket_has_no_byes(self):
+        """Test a power-of-two field pairs top half against bottom half."""
+        assert first_round_pairs([1, 2, 3, 4], 4) == [(1, 3), (2, 4)]
+
+
+@pytest.mark.unit
+@pytest.mark.services
+class TestSeeding:
+    """Test standard seeded placement."""
+
+    def test_seed_order(self):
+        """Test 1 meets N first and the top two seeds can only meet in the final."""
+        assert seed_order(8) == [1, 8, 4, 5, 2, 7, 3, 6]
+        assert seed_order(2) == [1, 2]
+
+    def test_every_round_pairs_best_with_worst(self):
+        """Test each first-round pair of seeds sums to N + 1, top seed first."""
+        order = seed_order(64)
+        pairs = list(zip(order[::2], order[1::2]))
+
+        assert sorted(order) == list(range(1, 65))
+        assert all(top + bottom == 65 and top < bottom for top, bottom in pairs)
+        # Seeds 1 and 2 are in different halves
+        assert order.index(1) < 32 <= order.index(2)
+
+    def test_byes_go_to_top_seeds(self):
+        """Test missing seeds become byes for the best teams."""
+        assert seeded_pairs([11, 12, 13, 14, 15], 8) == [(11, None), (14, 15), (12, None), (13, None)]
+
+
+@pytest.mark.unit
+@pytest.mark.services
+class TestSwissPairings:
+    """Test Swiss round pairing."""
+
+    def test_pairs_neighbours_in_rank_order(self):
+        """Test the first round pairs adjacent teams."""
+        assert swiss_pairings([1, 2, 3, 4], set()) == ([(1, 2), (3, 4)], None)
+
+    def test_avoids_rematches_by_backtracking(self):
+        """Test a rematch-free pairing is found even when greedy order would fail."""
+        played = {frozenset((1, 2)), frozenset((3, 4)), frozenset((1, 3))}
+
+        pairs, _ = swiss_pairings([1, 2, 3, 4], played)
+
+        assert pairs == [(1, 4), (2, 3)]
+
+    def test_bye_goes_to_lowest_team_without_one(self):
+        """Test the bye skips teams that already had one."""
+        pairs, bye = swiss_pairings([1, 2, 3, 4, 5], set(), had_bye={5})
+
+        assert bye == 4
+        assert pairs == [(1, 2), (3, 5)]
+
+    def test_falls_back_to_fewest_rematches(self):
+        """Test an impossible rematch-free round still pairs everyone."""
+        played = {frozenset(pair) for pair in [(1, 2), (1, 3), (1, 4)]}
+
+        pairs, _ = swiss_pairings([1, 2, 3, 4], played)
+
+        assert sorted(team for pair in pairs for team in pair) == [1, 2, 3, 4]
+
+    def test_two_hundred_teams_under_a_second(self):
+        """Test eight rounds for 200 teams pair quickly and never repeat a pairing."""
+        rng = random.Random(7)
+        teams = list(range(1, 201))
+        wins = dict.fromkeys(teams, 0)
+        played = set()
+        started = time.perf_counter()
+
+        for _ in range(8):
+            ranked = sorted(teams, key=lambda team: (-wins[team], team))
+            pairs, bye = swiss_pairings(ranked, played)
+            assert bye is None and len(pairs) == 100
+            for pair in pairs:
+                assert frozenset(pair) not in played
+                played.add(frozenset(pair))
+                wins[rng.choice(pair)] += 1
+
+        assert time.perf_counter() - started < 1.0
@@ -0,0 +1,123 @@
+"""Unit tests for RevisionService."""
+import pytest
+from app.services.revision_service import RevisionService
+from app.services.score_service import ScoreService
+from app.models import Participant, Penalty
+from tests.factories import GameNightFactory, TeamFactory, GameFactory, ScoreFactory
+
+
+class TestRevisionService:
+    """Test game night revisions are bumped by writes."""
+
+    def test_fixtures_bump_revision(self, db_session, game_night, teams, game):
+        """Test creating teams and games bumps the game night revision."""
+        assert RevisionService.get_revision(game_night.id) > 0
+        assert RevisionService.get_revision() > 0
+
+    def test_unknown_game_night_is_zero(self, db_session):
+        """Test game nights without writes start at revision zero."""
+        assert RevisionService.get_revision(12345) == 0
+
+    def test_score_write_bumps_revision(self, db_session, game_night, teams, game):
+        """Test saving scores bumps the game night and global revisions."""
+        before = RevisionService.get_revision(game_night.id)
+        global_before = RevisionService.get_revision()
+
+        ScoreService.save_scores(game.id, {teams[0].id: {'points': 3}}, is_completed=False)
+
+        assert RevisionService.get_revision(game_night.id) > before
+        assert RevisionService.get_revision() > global_before
+
+    def test_score_update_and_delete_bump_revision(self, db_session, game_night, teams, game):
+        """Test updating and deleting a score bump the revision."""
+        score = ScoreFactory.create(db_session, game.id, teams[0].id, points=1)
+
+        before = RevisionService.get_revision(game_night.id)
+        score.points = 5
+        db_session.commit()
+        updated = RevisionService.get_revision(game_night.id)
+        assert updated > before
+
+        db_session.delete(score)
+        db_session.commit()
+        assert RevisionService.get_revision(game_night.id) > updated
+
+    def test_penalty_and_participant_writes_bump_revision(self, db_session, game_night, teams, game):
+        """Test rows displayed on team and game pages bump their game night."""
+        before = RevisionService.get_revision(game_night.id)
+        db_session.add(Penalty(game_id=game.id, name='Late', value=1))
+        db_session.commit()
+        after_penalty = RevisionService.get_revision(game_night.id)
+        assert after_penalty > before
+
+        db_session.add(Participant(firstName='Ada', lastName='L', team_id=teams[0].id))
+        db_session.commit()
+        assert RevisionService.get_revision(game_night.id) > after_penalty
+
+    def test_writes_do_not_bump_other_game_nights(self, db_session, game_night, teams, game):
+        """Test revisions are scoped to the written game night."""
+        other_night = GameNightFactory.create(db_session, name='Other', is_active=False,
+                                              is_working_context=False)
+        other_revision = RevisionService.get_revision(other_night.id)
+
+        ScoreFactory.create(db_session, game.id, teams[0].id, points=1)
+
+        assert RevisionService.get_revision(other_night.id) == other_revision
+
+    def test_moving_team_bumps_both_game_nights(self, db_session, game_night, teams):
+        """Test a team moved between game nights bumps the old and new one."""
+        other_night = GameNightFactory.create(db_session, name='Other', is_active=False,
+                                              is_working_context=False)
+        before = RevisionService.get_revision(game_night.id)
+        other_before = RevisionService.get_revision(other_night.id)
+
+        teams[0].game_night_id = other_night.id
+        db_session.commit()
+
+        assert RevisionService.get_revision(game_night.id) > before
+        assert RevisionService.get_revision(other_night.id) > other_before
+
+    def test_deleting_game_night_keeps_revision(self, db_session, game_night, teams):
+        """Test revisions never go backwards when a game night is deleted."""
+        game_night_id = game_night.id
+        before = RevisionService.get_revision(game_night_id)
+
+        db_session.delete(game_night)
+        db_session.commit()
+
+        assert RevisionService.get_revision(game_night_id) > before
+
+
+class TestLeaderboardChanges:
+    """Test the change log behind delta polling."""
+
+    def test_changes_since_revision(self, db_session, game_night, teams, game):
+        """Test score writes are logged against the new revision."""
+        since = RevisionService.get_revision(game_night.id)
+        ScoreFactory.create(db_session, game.id, teams[1].id, points=4)
+
+        revision = RevisionService.get_revision(game_night.id)
+        changes = RevisionService.get_changes(game_night.id, since, revision)
+
+        assert changes.score_keys == {(teams[1].id, game.id)}
+        assert changes.team_ids == {teams[1].id}
+        assert changes.game_ids == set()
+
+    def test_game_changes_are_logged(self, db_session, game_night, teams, game):
+        """Test game writes are logged as game changes."""
+        since = RevisionService.get_revision(game_night.id)
+        game.name = 'Renamed'
+        db_session.commit()
+
+        changes = RevisionService.get_changes(
+            game_night.id, since, RevisionService.get_revision(game_night.id)
+        )
+
+        assert changes.game_ids == {game.id}
+
+    def test_out_of_range_since_needs_full_reload(self, db_session, game_night, teams):
+        """Test revisions outside the change log return None."""
+        revision = RevisionService.get_revision(game_night.id)
+
+        assert RevisionService.get_changes(game_night.id, revision + 1, revision) is None
+        assert RevisionService.get_changes(game_night.id, -1000, revision) is None
@@ -23,6 +23,29 @@ class TestScoreService:
         assert scores_dict[teams[0].id].score_value == 100
         assert scores_dict[teams[1].id].score_value == 90
 
+    def test_get_score_matrix(self, db_session, game_night, game, completed_game, teams):
+        """Test loading every score for a game night keyed by (team_id, game_id)."""
+        db_session.add(Score(game_id=game.id, team_id=teams[0].id, score_value=42, points=1))
+        db_session.commit()
+
+        matrix = ScoreService.get_score_matrix(game_night.id)
+
+        assert len(matrix) == 4
+        assert matrix[(teams[0].id, game.id)].score_value == 42
+        assert matrix[(teams[1].id, completed_game.id)].points == 2
+        assert (teams[1].id, game.id) not in matrix
+
+    def test_get_score_matrix_excludes_other_game_nights(self, db_session, game_night, completed_game):
+        """Test that the score matrix only covers the requested game night (None = all)."""
+        from datetime import date
+        from app.models import GameNight
+        other = GameNight(name='Other Night', date=date.today())
+        db_session.add(other)
+        db_session.commit()
+
+        assert ScoreService.get_score_matrix(other.id) == {}
+        assert len(ScoreService.get_score_matrix(None)) == 3
+
     def test_save_scores_create_new(self, db_session, game, teams):
         """Test saving new scores."""
         scores_data = {
@@ -353,3 +376,92 @@ class TestScoreService:
         # Assert - Score saved successfully
         score = Score.query.filter_by(game_id=game.id, team_id=teams[0].id).first()
         assert score is not None
+
+
+class TestBulkSaveScores:
+    """Test the INSERT ... ON CONFLICT path of save_scores."""
+
+    @staticmethod
+    def _count_queries(func):
+        """Run func and return how many SQL statements it executed."""
+        from sqlalchemy import event
+        from app import db
+
+        statements = []
+
+        def record(*args):
+            statements.append(args[2])
+
+        event.listen(db.engine, 'before_cursor_execute', record)
+        try:
+            func()
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', record)
+        return len(statements)
+
+    def test_query_count_is_constant(self, db_session, game_night, game):
+        """Test saving 20 teams costs the same round trips as saving 2."""
+        from tests.factories import TeamFactory
+
+        team_ids = [t.id for t in TeamFactory.create_batch(db_session, count=20, game_night_id=game_night.id)]
+        game_id = game.id
+
+        def save_small():
+            ScoreService.save_scores(game_id, {team_id: {'points': 1} for team_id in team_ids[:2]})
+
+        # Warm up so both measured saves start from the same (expired) session state
+        save_small()
+        small = self._count_queries(save_small)
+        large = self._count_queries(lambda: ScoreService.save_scores(
+            game_id, {team_id: {'points': i} for i, team_id in enumerate(team_ids)}
+        ))
+
+        assert large == small
+        assert Score.query.filter_by(game_id=game_id).count() == 20
+
+    def test_upsert_updates_existing_and_keeps_unset_columns(self, db_session, game, teams):
+        """Test only the columns in the payload are overwritten."""
+        ScoreService.save_scores(game.id, {teams[0].id: {'score': 12.5, 'points': 3, 'notes': 'keep'}})
+
+        ScoreService.save_scores(game.id, {teams[0].id: {'points': 5}})
+
+        score = Score.query.filter_by(game_id=game.id, team_id=teams[0].id).one()
+        assert score.points == 5
+        assert score.score_value == 12.5
+        assert score.notes == 'keep'
+
+    def test_new_score_without_points_defaults_to_zero(self, db_session, game, teams):
+        """Test column defaults apply to upserted rows."""
+        ScoreService.save_scores(game.id, {teams[0].id: {'notes': 'DNF'}})
+
+        score = Score.query.filter_by(game_id=game.id, team_id=teams[0].id).one()
+        assert score.points == 0
+        assert score.timer_count == 0
+
+    def test_upsert_maintains_standings(self, db_session, game_night, game, teams):
+        """Test materialized standings follow upserted points."""
+        from app.services.standings_service import StandingsService
+
+        ScoreService.save_scores(game.id, {teams[0].id: {'points': 3}, teams[1].id: {'points': 2}})
+        ScoreService.save_scores(game.id, {teams[0].id: {'points': 1}})
+
+        standing = StandingsService.get_standing(game_night.id, teams[0].id)
+        assert (standing.points, standing.games_played) == (1, 1)
+        assert StandingsService.get_standing(game_night.id, teams[1].id).points == 2
+
+    def test_upsert_bumps_revision_with_changes(self, db_session, game_night, game, teams):
+        """Test upserted scores appear in the leaderboard change log."""
+        from app.services.revision_service import RevisionService
+
+        since = RevisionService.get_revision(game_night.id)
+        ScoreService.save_scores(game.id, {teams[1].id: {'points': 4}})
+
+        revision = RevisionService.get_revision(game_night.id)
+        changes = RevisionService.get_changes(game_night.id, since, revision)
+        assert (teams[1].id, game.id) in changes.score_keys
+
+    def test_unknown_teams_are_skipped(self, db_session, game, teams):
+        """Test teams that don't exist are ignored."""
+        ScoreService.save_scores(game.id, {teams[0].id: {'points': 1}, 99999: {'points': 1}})
+
+        assert Score.query.filter_by(game_id=game.id).count() == 1
@@ -0,0 +1,102 @@
+"""Unit tests for StandingsService (materialized team_standing table)."""
+import pytest
+from app import db
+from app.services.standings_service import StandingsService
+from app.services.score_service import ScoreService
+from app.services.game_service import GameService
+from app.services.team_service import TeamService
+from app.models import Score, TeamStanding
+
+
+def _standing(game_night_id, team_id):
+    """Read a standing row fresh from the database."""
+    db.session.expire_all()
+    standing = StandingsService.get_standing(game_night_id, team_id)
+    return (standing.points, standing.games_played) if standing else None
+
+
+class TestStandingsService:
+    """Test incremental maintenance of team standings."""
+
+    def test_new_scores_create_standings(self, db_session, game_night, teams, completed_game):
+        """Test inserting scores seeds standings rows."""
+        assert _standing(game_night.id, teams[0].id) == (3, 1)
+        assert _standing(game_night.id, teams[2].id) == (1, 1)
+
+    def test_save_scores_applies_delta(self, db_session, game_night, teams, game, completed_game):
+        """Test saving and re-saving scores adjusts running totals."""
+        ScoreService.save_scores(game.id, {teams[0].id: {'points': 5}})
+        assert _standing(game_night.id, teams[0].id) == (8, 2)
+
+        ScoreService.save_scores(game.id, {teams[0].id: {'points': 2}})
+        assert _standing(game_night.id, teams[0].id) == (5, 2)
+
+    def test_direct_score_update_applies_delta(self, db_session, game_night, teams, completed_game):
+        """Test score edits outside ScoreService (e.g. websocket handlers) are tracked."""
+        score = Score.query.filter_by(game_id=completed_game.id, team_id=teams[1].id).first()
+        score.points = 10
+        db_session.commit()
+
+        assert _standing(game_night.id, teams[1].id) == (10, 1)
+
+    def test_delete_game_removes_points(self, db_session, game_night, teams, completed_game):
+        """Test deleting a game subtracts its scores from standings."""
+        GameService.delete_game(completed_game.id)
+
+        assert _standing(game_night.id, teams[0].id) == (0, 0)
+
+    def test_delete_team_removes_standing(self, db_session, game_night, teams, completed_game):
+        """Test deleting a team removes its standings row."""
+        TeamService.delete_team(teams[0].id)
+
+        assert _standing(game_night.id, teams[0].id) is None
+        assert _standing(game_night.id, teams[1].id) == (2, 1)
+
+    def test_rollback_discards_delta(self, db_session, game_night, teams, completed_game):
+        """Test standings change only when the score write commits."""
+        score = Score.query.filter_by(game_id=completed_game.id, team_id=teams[0].id).first()
+        score.points = 50
+        db_session.flush()
+        db_session.rollback()
+
+        assert _standing(game_night.id, teams[0].id) == (3, 1)
+
+    def test_rebuild_repairs_drift(self, db_session, game_night, teams, completed_game):
+        """Test rebuild recomputes standings from the score table."""
+        db_session.execute(TeamStanding.__table__.update().values(points=999))
+        db_session.execute(TeamStanding.__table__.delete().where(
+            TeamStanding.__table__.c.team_id == teams[2].id
+        ))
+        db_session.commit()
+
+        count = StandingsService.rebuild(game_night.id)
+
+        assert count == 3
+        assert _standing(game_night.id, teams[0].id) == (3, 1)
+        assert _standing(game_night.id, teams[2].id) == (1, 1)
+
+    def test_rebuild_command(self, app, db_session, game_night, teams, completed_game):
+        """Test the rebuild-standings CLI command."""
+        db_session.execute(TeamStanding.__table__.delete())
+        db_session.commit()
+
+        result = app.test_cli_runner().invoke(args=['rebuild-standings'])
+
+        assert 'Rebuilt 3 team standing row(s).' in result.output
+        assert _standing(game_night.id, teams[1].id) == (2, 1)
+
+    def test_backfill_builds_missing_standings(self, db_session, game_night, teams, completed_game):
+        """Test backfill fills an empty team_standing table from existing scores."""
+        db_session.execute(TeamStanding.__table__.delete())
+        db_session.commit()
+
+        assert StandingsService.backfill() == 3
+        assert _standing(game_night.id, teams[0].id) == (3, 1)
+
+    def test_backfill_keeps_existing_standings(self, db_session, game_night, teams, completed_game):
+        """Test backfill leaves a populated team_standing table alone."""
+        db_session.execute(TeamStanding.__table__.update().values(points=999))
+        db_session.commit()
+
+        assert StandingsService.backfill() == 0
+        assert _standing(game_night.id, teams[0].id) == (999, 1)
@@ -1,12 +1,16 @@
 """Unit tests for TournamentService.
 
-Test IDs: TOURN-S-001 through TOURN-S-025
-Coverage: Tournament creation, bracket generation, match updates, winner advancement
+Test IDs: TOURN-S-001 through TOURN-S-045
+Coverage: Tournament creation, bracket generation, match updates, winner advancement,
+cached bracket views, double elimination, round robin, Swiss, standings and seeding
 """
 import pytest
+from sqlalchemy import event
+from app import db
+from app.services.team_service import TeamService
 from app.services.tournament_service import TournamentService
 from app.models import Tournament, Match, Game, Team
-from tests.factories import GameFactory, GameNightFactory, TeamFactory
+from tests.factories import GameFactory, GameNightFactory, ScoreFactory, TeamFactory
 
 
 @pytest.mark.unit
@@ -612,3 +616,401 @@ class TestTournamentService:
         db_session.refresh(tournament)
         assert tournament.winner_team_id == expected_winner_id
         assert tournament.is_completed is True
+
+    def test_bracket_view_built_in_two_queries(self, db_session):
+        """TOURN-S-026: Test the bracket read model loads teams with a join, not per match."""
+        # Arrange
+        game_night = GameNightFactory.create(db_session)
+        game = GameFactory.create(db_session, game_night_id=game_night.id)
+        TeamFactory.create_batch(db_session, count=8, game_night_id=game_night.id)
+        tournament_id = TournamentService.create_tournament(game_id=game.id).id
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        # Act
+        event.listen(db.engine, 'before_cursor_execute', record)
+        try:
+            view = TournamentService.get_bracket_view(tournament_id)
+            cached = TournamentService.get_bracket_view(tournament_id)
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', record)
+
+        # Assert: matches with teams, then the standings aggregate
+        assert len(statements) == 2
+        assert cached is view
+        first = view.bracket[1][0]
+        assert first.team1.name and first.team1.color
+        assert first.is_ready
+
+    def test_bracket_view_invalidated_by_result_and_reset(self, db_session):
+        """TOURN-S-027: Test match results and resets drop the cached bracket."""
+        # Arrange
+        game_night = GameNightFactory.create(db_session)
+        game = GameFactory.create(db_session, game_night_id=game_night.id)
+        teams = TeamFactory.create_batch(db_session, count=2, game_night_id=game_night.id)
+        tournament = TournamentService.create_tournament(game_id=game.id)
+        match = tournament.matches.first()
+        assert TournamentService.get_bracket_view(tournament.id).bracket[1][0].status == 'pending'
+
+        # Act / Assert
+        TournamentService.update_match_result(match.id, 100.0, 90.0, match.team1_id)
+        assert TournamentService.get_bracket_view(tournament.id).bracket[1][0].status == 'completed'
+
+        TournamentService.reset_tournament(tournament.id)
+        assert TournamentService.get_bracket_view(tournament.id).bracket[1][0].status == 'pending'
+
+    def test_bracket_view_invalidated_by_team_rename(self, db_session):
+        """TOURN-S-028: Test renaming a team drops cached brackets showing it."""
+        # Arrange
+        game_night = GameNightFactory.create(db_session)
+        game = GameFactory.create(db_session, game_night_id=game_night.id)
+        teams = TeamFactory.create_batch(db_session, count=2, game_night_id=game_night.id)
+        tournament = TournamentService.create_tournament(game_id=game.id)
+        TournamentService.get_bracket_view(tournament.id)
+
+        # Act
+        TeamService.update_team(teams[0].id, 'Renamed', [])
+
+        # Assert
+        final = TournamentService.get_bracket_view(tournament.id).bracket[1][0]
+        assert 'Renamed' in (final.team1.name, final.team2.name)
+
+
+def play_out(tournament_id):
+    """Score every playable match (team1 wins) until none is left; return each team's losses."""
+    losses = {}
+    while True:
+        match = Match.query.filter(
+            Match.tournament_id == tournament_id,
+            Match.status == 'pending',
+            Match.is_bye.is_(False),
+            Match.team1_id.isnot(None),
+            Match.team2_id.isnot(None)
+        ).order_by(Match.id).first()
+        if match is None:
+            return losses
+        losses[match.team2_id] = losses.get(match.team2_id, 0) + 1
+        TournamentService.update_match_result(match.id, 2.0, 1.0, match.team1_id)
+
+
+@pytest.mark.unit
+@pytest.mark.services
+class TestTournamentFormats:
+    """Test double-elimination and round-robin tournaments."""
+
+    def test_unknown_format_rejected(self, db_session):
+        """TOURN-S-029: Test an unknown format raises before anything is written."""
+        game_night = GameNightFactory.create(db_session)
+        game = GameFactory.create(db_session, game_night_id=game_night.id)
+        TeamFactory.create_batch(db_session, count=4, game_night_id=game_night.id)
+
+        with pytest.raises(ValueError):
+            TournamentService.create_tournament(game_id=game.id, tournament_format='ladder')
+
+    def test_round_robin_schedule(self, db_session):
+        """TOURN-S-030: Test every pair of teams is scheduled once, without links."""
+        game_night = GameNightFactory.create(db_session)
+        game = GameFactory.create(db_session, game_night_id=game_night.id)
+        teams = TeamFactory.create_batch(db_session, count=5, game_night_id=game_night.id)
+
+        tournament = TournamentService.create_tournament(game_id=game.id, tournament_format='round_robin')
+
+        matches = tournament.matches.all()
+        assert tournament.format == 'round_robin'
+        assert len(matches) == 10
+        assert {frozenset((m.team1_id, m.team2_id)) for m in matches} == {
+            frozenset((a.id, b.id)) for i, a in enumerate(teams) for b in teams[i + 1:]
+        }
+        assert {m.round_number for m in matches} == {1, 2, 3, 4, 5}
+        assert all(m.next_match_id is None for m in matches)
+
+    def test_round_robin_completes_with_standings_leader(self, db_session):
+        """TOURN-S-031: Test the tournament completes after the last match, won by most wins."""
+        game_night = GameNightFactory.create(db_session)
+        game = GameFactory.create(db_session, game_night_id=game_night.id)
+        TeamFactory.create_batch(db_session, count=4, game_night_id=game_night.id)
+        tournament = TournamentService.create_tournament(game_id=game.id, tournament_format='round_robin')
+
+        play_out(tournament.id)
+
+        db_session.refresh(tournament)
+        view = TournamentService.get_bracket_view(tournament.id)
+        assert tournament.is_completed is True
+        assert tournament.winner_team_id == view.standings[0].team_id
+        assert [row.played for row in view.standings] == [3, 3, 3, 3]
+
+    @pytest.mark.parametrize('team_count', [2, 3, 4, 5, 6, 7, 8, 11])
+    def test_double_elimination_plays_to_a_champion(self, db_session, team_count):
+        """TOURN-S-032: Test every team but the champion is out after exactly two losses."""
+        game_night = GameNightFactory.create(db_session)
+        game = GameFactory.create(db_session, game_night_id=game_night.id)
+        TeamFactory.create_batch(db_session, count=team_count, game_night_id=game_night.id)
+        tournament = TournamentService.create_tournament(game_id=game.id, tournament_format='double_elimination')
+
+        losses = play_out(tournament.id)
+
+        db_session.refresh(tournament)
+        assert tournament.is_completed is True
+        assert tournament.winner_team_id not in losses
+        assert sorted(losses.values()) == [2] * (team_count - 1)
+
+    def test_double_elimination_structure(self, db_session):
+        """TOURN-S-033: Test an 8-team bracket's sections and loser links."""
+        game_night = GameNightFactory.create(db_session)
+        game = GameFactory.create(db_session, game_night_id=game_night.id)
+        TeamFactory.create_batch(db_session, count=8, game_night_id=game_night.id)
+
+        tournament = TournamentService.create_tournament(game_id=game.id, tournament_format='double_elimination')
+
+        matches = tournament.matches.all()
+        by_bracket = {}
+        for match in matches:
+            by_bracket[match.bracket] = by_bracket.get(match.bracket, 0) + 1
+        assert by_bracket == {'main': 7, 'losers': 6, 'grand_final': 1}
+        assert all(m.loser_next_match.bracket == 'losers' for m in matches
+                   if m.bracket == 'main' and m.round_number < 3)
+        final = next(m for m in matches if m.bracket == 'main' and m.round_number == 3)
+        assert final.next_match.bracket == 'grand_final'
+        assert [s.name for s in TournamentService.get_bracket_view(tournament.id).sections] == [
+            'main', 'losers', 'grand_final'
+        ]
+
+    def test_double_elimination_reset(self, db_session):
+        """TOURN-S-034: Test reset clears dropped teams but keeps byes advanced."""
+        game_night = GameNightFactory.create(db_session)
+        game = GameFactory.create(db_session, game_night_id=game_night.id)
+        TeamFactory.create_batch(db_session, count=5, game_night_id=game_night.id)
+        tournament = TournamentService.create_tournament(game_id=game.id, tournament_format='double_elimination')
+        initial = {m.id: (m.team1_id, m.team2_id, m.status) for m in tournament.matches}
+        play_out(tournament.id)
+
+        TournamentService.reset_tournament(tournament.id)
+
+        db_session.expire_all()
+        assert {m.id: (m.team1_id, m.team2_id, m.status) for m in tournament.matches} == initial
+        assert tournament.is_completed is False
+
+    def test_large_round_robin_written_in_bulk(self, db_session):
+        """TOURN-S-035: Test a 100-team schedule is written with one INSERT."""
+        game_night = GameNightFactory.create(db_session)
+        game = GameFactory.create(db_session, game_night_id=game_night.id)
+        team_ids = [t.id for t in TeamFactory.create_batch(db_session, count=100, game_night_id=game_night.id)]
+        game_id = game.id
+        inserts = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith('INSERT INTO "match"'):
+                inserts.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', record)
+        try:
+            tournament = TournamentService.create_tournament(
+                game_id=game_id, included_team_ids=team_ids, tournament_format='round_robin')
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', record)
+
+        assert len(inserts) == 1
+        assert tournament.matches.count() == 4950
+
+    def test_standings_ranked_by_wins_then_buchholz(self, db_session):
+        """TOURN-S-036: Test the aggregate standings match a recount from the matches."""
+        game_night = GameNightFactory.create(db_session)
+        game = GameFactory.create(db_session, game_night_id=game_night.id)
+        TeamFactory.create_batch(db_session, count=7, game_night_id=game_night.id)
+        tournament = TournamentService.create_tournament(game_id=game.id, tournament_format='swiss',
+                                                         round_count=3)
+        play_out(tournament.id)
+
+        wins, opponents, byes = {}, {}, {}
+        for match in tournament.matches.all():
+            wins[match.winner_team_id] = wins.get(match.winner_team_id, 0) + 1
+            if match.is_bye:
+                byes[match.team1_id] = byes.get(match.team1_id, 0) + 1
+            else:
+                opponents.setdefault(match.team1_id, []).append(match.team2_id)
+                opponents.setdefault(match.team2_id, []).append(match.team1_id)
+
+        standings = TournamentService.get_standings(tournament.id)
+
+        assert len(standings) == 7
+        for row in standings:
+            assert row.wins == wins.get(row.team_id, 0)
+            assert row.buchholz == sum(wins.get(team_id, 0) for team_id in opponents[row.team_id])
+            assert row.played == len(opponents[row.team_id])
+            assert row.wins + row.losses == row.played + byes.get(row.team_id, 0)
+        keys = [(-row.wins, -row.buchholz, -(row.score_for - row.score_against), row.team_id) for row in standings]
+        assert keys == sorted(keys)
+
+
+@pytest.mark.unit
+@pytest.mark.services
+class TestSwissTournament:
+    """Test Swiss-system tournaments."""
+
+    def test_first_round_pairs_everyone_with_one_bye(self, db_session):
+        """TOURN-S-037: Test round 1 pairs all teams and gives an odd team out a won bye."""
+        game_night = GameNightFactory.create(db_session)
+        game = GameFactory.create(db_session, game_night_id=game_night.id)
+        TeamFactory.create_batch(db_session, count=7, game_night_id=game_night.id)
+
+        tournament = TournamentService.create_tournament(game_id=game.id, tournament_format='swiss')
+
+        matches = tournament.matches.all()
+        byes = [m for m in matches if m.is_bye]
+        assert tournament.round_count == 3
+        assert len(matches) == 4
+        assert len(byes) == 1 and byes[0].winner_team_id == byes[0].team1_id
+        assert {m.round_number for m in matches} == {1}
+
+    def test_rounds_paired_until_round_count(self, db_session):
+        """TOURN-S-038: Test each completed round pairs the next, without rematches or repeat byes."""
+        game_night = GameNightFactory.create(db_session)
+        game = GameFactory.create(db_session, game_night_id=game_night.id)
+        TeamFactory.create_batch(db_session, count=9, game_night_id=game_night.id)
+        tournament = TournamentService.create_tournament(game_id=game.id, tournament_format='swiss',
+                                                         round_count=4)
+
+        play_out(tournament.id)
+
+        db_session.refresh(tournament)
+        matches = tournament.matches.all()
+        pairs = [frozenset((m.team1_id, m.team2_id)) for m in matches if not m.is_bye]
+        byes = [m.team1_id for m in matches if m.is_bye]
+        assert {m.round_number for m in matches} == {1, 2, 3, 4}
+        assert len(pairs) == len(set(pairs)) == 16
+        assert len(byes) == len(set(byes)) == 4
+        assert tournament.is_completed is True
+        assert tournament.winner_team_id == TournamentService.get_standings(tournament.id)[0].team_id
+
+    def test_next_round_pairs_equal_records(self, db_session):
+        """TOURN-S-039: Test round 2 puts winners against winners."""
+        game_night = GameNightFactory.create(db_session)
+        game = GameFactory.create(db_session, game_night_id=game_night.id)
+        TeamFactory.create_batch(db_session, count=8, game_night_id=game_night.id)
+        tournament = TournamentService.create_tournament(game_id=game.id, tournament_format='swiss')
+
+        round1_winners = set()
+        for match in tournament.matches.all():
+            round1_winners.add(match.team1_id)
+            TournamentService.update_match_result(match.id, 1.0, 0.0, match.team1_id)
+
+        round2 = Match.query.filter_by(tournament_id=tournament.id, round_number=2).all()
+        assert len(round2) == 4
+        for match in round2:
+            assert (match.team1_id in round1_winners) == (match.team2_id in round1_winners)
+
+    def test_reset_keeps_only_round_one(self, db_session):
+        """TOURN-S-040: Test reset drops paired rounds and clears round 1 results."""
+        game_night = GameNightFactory.create(db_session)
+        game = GameFactory.create(db_session, game_night_id=game_night.id)
+        TeamFactory.create_batch(db_session, count=5, game_night_id=game_night.id)
+        tournament = TournamentService.create_tournament(game_id=game.id, tournament_format='swiss')
+        initial = {m.id: (m.team1_id, m.team2_id, m.status) for m in tournament.matches}
+        play_out(tournament.id)
+
+        TournamentService.reset_tournament(tournament.id)
+
+        db_session.expire_all()
+        assert {m.id: (m.team1_id, m.team2_id, m.status) for m in tournament.matches} == initial
+
+    def test_invalid_round_count_rejected(self, db_session):
+        """TOURN-S-041: Test a Swiss tournament needs at least one round."""
+        game_night = GameNightFactory.create(db_session)
+        game = GameFactory.create(db_session, game_night_id=game_night.id)
+        TeamFactory.create_batch(db_session, count=4, game_night_id=game_night.id)
+
+        with pytest.raises(ValueError):
+            TournamentService.create_tournament(game_id=game.id, tournament_format='swiss', round_count=0)
+
+
+@pytest.mark.unit
+@pytest.mark.services
+class TestSeeding:
+    """Test seeding teams from historical performance."""
+
+    @pytest.fixture
+    def history(self, db_session):
+        """Past game night where 'Team 3' scored most, then 'Team 1', with a tournament win for 'Team 2'."""
+        past_night = GameNightFactory.create(db_session)
+        past_game = GameFactory.create(db_session, game_night_id=past_night.id)
+        past_teams = TeamFactory.create_batch(db_session, count=3, game_night_id=past_night.id)
+        past_teams[2].name = 'team 3'  # Names match case-insensitively
+        ScoreFactory.create(db_session, past_game.id, past_teams[0].id, points=3)
+        ScoreFactory.create(db_session, past_game.id, past_teams[1].id, points=1)
+        ScoreFactory.create(db_session, past_game.id, past_teams[2].id, points=5)
+        past_tournament = Tournament(game_id=past_game.id)
+        db_session.add(past_tournament)
+        db_session.flush()
+        db_session.add(Match(tournament_id=past_tournament.id, round_number=1, position_in_round=0,
+                             team1_id=past_teams[1].id, team2_id=past_teams[0].id,
+                             winner_team_id=past_teams[1].id, status='completed'))
+        db_session.commit()
+
+        game_night = GameNightFactory.create(db_session)
+        game = GameFactory.create(db_session, game_night_id=game_night.id)
+        teams = TeamFactory.create_batch(db_session, count=6, game_night_id=game_night.id)
+        return game, teams
+
+    def test_seeding_ranks_by_points_across_game_nights(self, db_session, history):
+        """TOURN-S-042: Test seeding follows team names across nights and counts match wins."""
+        _, teams = history
+
+        seeding = TournamentService.get_seeding([team.id for team in teams])
+
+        assert seeding == [(teams[2].id, 5), (teams[0].id, 3), (teams[1].id, 2),
+                           (teams[3].id, 0), (teams[4].id, 0), (teams[5].id, 0)]
+
+    def test_seeded_bracket_gives_byes_to_top_seeds(self, db_session, history):
+        """TOURN-S-043: Test 6 seeded teams: seeds 1 and 2 get byes in opposite halves."""
+        game, teams = history
+
+        tournament = TournamentService.create_tournament(game_id=game.id, pairing_type='seeded',
+                                                         included_team_ids=[team.id for team in teams])
+
+        first_round = Match.query.filter_by(tournament_id=tournament.id, round_number=1).order_by(
+            Match.position_in_round).all()
+        assert [(m.team1_id, m.team2_id, m.is_bye) for m in first_round] == [
+            (teams[2].id, None, True),
+            (teams[3].id, teams[4].id, False),
+            (teams[0].id, None, True),
+            (teams[1].id, teams[5].id, False)
+        ]
+        semis = Match.query.filter_by(tournament_id=tournament.id, round_number=2).order_by(
+            Match.position_in_round).all()
+        assert [m.team1_id for m in semis] == [teams[2].id, teams[0].id]
+
+    def test_seeded_double_elimination(self, db_session, history):
+        """TOURN-S-044: Test seeding places the double-elimination main bracket too."""
+        game, teams = history
+
+        tournament = TournamentService.create_tournament(game_id=game.id, pairing_type='seeded',
+                                                         tournament_format='double_elimination',
+                                                         included_team_ids=[team.id for team in teams])
+        first = Match.query.filter_by(tournament_id=tournament.id, bracket='main', round_number=1,
+                                      position_in_round=0).one()
+        assert (first.team1_id, first.is_bye) == (teams[2].id, True)
+
+        losses = play_out(tournament.id)
+
+        assert sorted(losses.values()) == [2] * 5
+
+    def test_seeding_hundreds_of_teams_in_one_query(self, db_session):
+        """TOURN-S-045: Test seeding 300 teams sends a single statement."""
+        game_night = GameNightFactory.create(db_session)
+        team_ids = [t.id for t in TeamFactory.create_batch(db_session, count=300, game_night_id=game_night.id,
+                                                           participant_count=0)]
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', record)
+        try:
+            seeding = TournamentService.get_seeding(team_ids)
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', record)
+
+        assert len(statements) == 1
+        assert len(seeding) == 300
@@ -0,0 +1,86 @@
+"""Unit tests for the LRU cache utility."""
+import pytest
+from app.utils.cache import LRUCache
+
+
+class TestLRUCache:
+    """Test bounded LRU caching."""
+
+    def test_get_miss_and_hit_counters(self):
+        """Test hits and misses are counted."""
+        cache = LRUCache(maxsize=2)
+
+        assert cache.get('a') is None
+        cache.set('a', 1)
+        assert cache.get('a') == 1
+
+        stats = cache.stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['size'] == 1
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used entry is evicted when full."""
+        cache = LRUCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')  # 'b' is now least recently used
+        cache.set('c', 3)
+
+        assert 'a' in cache
+        assert 'b' not in cache
+        assert 'c' in cache
+        assert cache.stats()['evictions'] == 1
+
+    def test_get_or_load_calls_loader_once(self):
+        """Test loader only runs on a miss."""
+        cache = LRUCache(maxsize=2)
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return 'value'
+
+        assert cache.get_or_load('k', loader) == 'value'
+        assert cache.get_or_load('k', loader) == 'value'
+        assert len(calls) == 1
+
+    def test_invalidate_removes_keys(self):
+        """Test invalidating specific keys."""
+        cache = LRUCache(maxsize=4)
+        cache.set(1, 'one')
+        cache.set(None, 'all')
+        cache.set(2, 'two')
+
+        assert cache.invalidate(1, None, 99) == 2
+        assert len(cache) == 1
+        assert 2 in cache
+
+    def test_load_racing_invalidation_is_not_stored(self):
+        """Test a value loaded before an invalidation is not cached."""
+        cache = LRUCache(maxsize=2)
+
+        def loader():
+            # A write lands while this (now stale) value is being built
+            cache.invalidate('k')
+            return 'stale'
+
+        assert cache.get_or_load('k', loader) == 'stale'
+        assert 'k' not in cache
+
+    def test_zero_size_disables_caching(self):
+        """Test maxsize=0 never stores values."""
+        cache = LRUCache(maxsize=0)
+        cache.set('a', 1)
+        assert len(cache) == 0
+
+    def test_configure_shrinks_cache(self):
+        """Test lowering maxsize evicts oldest entries."""
+        cache = LRUCache(maxsize=3)
+        for key in 'abc':
+            cache.set(key, key)
+
+        cache.configure(1)
+
+        assert len(cache) == 1
+        assert 'c' in cache
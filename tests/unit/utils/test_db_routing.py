@@ -0,0 +1,104 @@
+"""Unit tests for read/write engine routing."""
+import pytest
+from flask import Flask
+from app import db
+from app.models import Admin
+from app.utils.db_routing import (
+    READ_BIND_KEY, READ_ONLY_KEY, reads_from_replica, reads_from_primary, init_read_routing
+)
+
+
+@pytest.fixture
+def routed_app(tmp_path):
+    """App whose read bind is a separate, empty database so routing is observable."""
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{tmp_path / 'primary.db'}"
+    app.config['SQLALCHEMY_BINDS'] = {READ_BIND_KEY: f"sqlite:///{tmp_path / 'replica.db'}"}
+    db.init_app(app)
+    init_read_routing(app)
+
+    @app.route('/admins', methods=['GET', 'POST'])
+    def count_admins():
+        return str(Admin.query.count())
+
+    with app.app_context():
+        db.create_all()
+        db.metadata.create_all(db.engines[READ_BIND_KEY])
+        admin = Admin(username='primary-only')
+        admin.setPassword('password123')
+        db.session.add(admin)
+        db.session.commit()
+        db.session.remove()
+
+    yield app
+
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose()
+    # init_app registered metadata for the bind on the shared db; other apps don't have it
+    db.metadatas.pop(READ_BIND_KEY, None)
+
+
+class TestRoutingSession:
+    """Test which engine a query runs on."""
+
+    def test_reads_use_primary_by_default(self, routed_app):
+        """Test queries outside read-only mode go to the primary."""
+        with routed_app.app_context():
+            assert Admin.query.count() == 1
+
+    def test_read_only_selects_use_read_engine(self, routed_app):
+        """Test SELECTs in read-only mode go to the read engine."""
+        with routed_app.app_context():
+            db.session.info[READ_ONLY_KEY] = True
+            assert Admin.query.count() == 0
+
+    def test_reads_after_a_write_stay_on_primary(self, routed_app):
+        """Test a session that has flushed reads its own writes."""
+        with routed_app.app_context():
+            db.session.info[READ_ONLY_KEY] = True
+            admin = Admin(username='second')
+            admin.setPassword('password123')
+            db.session.add(admin)
+            db.session.flush()
+
+            assert Admin.query.count() == 2
+
+    def test_raw_connection_uses_primary(self, routed_app):
+        """Test session.connection() (used for core writes) is never the read engine."""
+        with routed_app.app_context():
+            db.session.info[READ_ONLY_KEY] = True
+            assert db.session.connection().engine is db.engines[None]
+
+
+class TestRoutingDecorators:
+    """Test per-method routing."""
+
+    def test_reads_from_replica(self, routed_app):
+        """Test a decorated method reads from the read engine, then the flag is restored."""
+        count = reads_from_replica(lambda: Admin.query.count())
+
+        with routed_app.app_context():
+            assert count() == 0
+            assert db.session.info[READ_ONLY_KEY] is False
+
+    def test_reads_from_primary_overrides_request_mode(self, routed_app):
+        """Test a method can insist on the primary during a GET request."""
+        count = reads_from_primary(lambda: Admin.query.count())
+
+        with routed_app.app_context():
+            db.session.info[READ_ONLY_KEY] = True
+            assert count() == 1
+            assert db.session.info[READ_ONLY_KEY] is True
+
+
+class TestRequestRouting:
+    """Test routing by HTTP method."""
+
+    def test_get_reads_from_read_engine(self, routed_app):
+        """Test GET requests query the read engine."""
+        assert routed_app.test_client().get('/admins').get_data(as_text=True) == '0'
+
+    def test_post_reads_from_primary(self, routed_app):
+        """Test mutating requests stay on the primary."""
+        assert routed_app.test_client().post('/admins').get_data(as_text=True) == '1'
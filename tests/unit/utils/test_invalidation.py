@@ -0,0 +1,197 @@
+"""Unit tests for the cross-worker invalidation bus."""
+import pytest
+from app.exceptions import ConfigurationError
+from app.utils.invalidation import InvalidationBus, DatabaseBackend, LocalBackend
+
+
+class TestInvalidationBus:
+    """Test local dispatch and backend selection."""
+
+    def test_publish_notifies_local_subscribers(self):
+        """Test subscribers run immediately in the publishing process."""
+        bus = InvalidationBus()
+        received = []
+        bus.subscribe('leaderboard', received.append)
+
+        bus.publish('leaderboard', 7)
+
+        assert received == [7]
+
+    def test_publish_can_skip_local_subscribers(self):
+        """Test a publisher whose caches are current only notifies other workers."""
+        bus = InvalidationBus()
+        received = []
+        bus.subscribe('leaderboard', received.append)
+
+        bus.publish('leaderboard', 7, local=False)
+
+        assert received == []
+
+    def test_subscribe_is_idempotent(self):
+        """Test the same callback is only registered once."""
+        bus = InvalidationBus()
+        received = []
+        bus.subscribe('leaderboard', received.append)
+        bus.subscribe('leaderboard', received.append)
+
+        bus.publish('leaderboard', 1)
+
+        assert received == [1]
+
+    def test_failing_subscriber_does_not_block_others(self):
+        """Test one failing subscriber does not stop the rest."""
+        bus = InvalidationBus()
+        received = []
+
+        def broken(key):
+            raise RuntimeError('boom')
+
+        bus.subscribe('leaderboard', broken)
+        bus.subscribe('leaderboard', received.append)
+
+        bus.publish('leaderboard', 3)
+
+        assert received == [3]
+
+    def test_local_backend_never_returns_events(self):
+        """Test the local backend has nothing to poll."""
+        bus = InvalidationBus(LocalBackend())
+        bus.publish('leaderboard', 1)
+
+        assert bus.poll(force=True) == 0
+
+    def test_unknown_backend_raises(self, app):
+        """Test misconfigured backends fail at startup."""
+        app.config['INVALIDATION_BACKEND'] = 'carrier-pigeon'
+
+        with pytest.raises(ConfigurationError):
+            InvalidationBus().init_app(app)
+
+
+class TestDatabaseBackend:
+    """Test invalidations crossing workers through the change_event table."""
+
+    @staticmethod
+    def _worker(received):
+        """Create a bus standing in for one gunicorn worker."""
+        bus = InvalidationBus(DatabaseBackend())
+        bus.backend.start()
+        bus.subscribe('leaderboard', received.append)
+        return bus
+
+    def test_event_reaches_other_worker(self, db_session):
+        """Test an event published by one worker is applied by another."""
+        first_received, second_received = [], []
+        first = self._worker(first_received)
+        second = self._worker(second_received)
+
+        first.publish('leaderboard', 5)
+
+        assert first_received == [5]
+        assert second.poll(force=True) == 1
+        assert second_received == [5]
+
+    def test_own_events_are_skipped(self, db_session):
+        """Test a worker does not re-apply its own events when polling."""
+        received = []
+        worker = self._worker(received)
+
+        worker.publish('leaderboard', 5)
+
+        assert worker.poll(force=True) == 0
+        assert received == [5]
+
+    def test_remote_only_event_reaches_other_worker(self, db_session):
+        """Test an event published without local dispatch still reaches other workers."""
+        first_received, second_received = [], []
+        first = self._worker(first_received)
+        second = self._worker(second_received)
+
+        first.publish('leaderboard', 5, local=False)
+
+        assert first_received == []
+        assert second.poll(force=True) == 1
+        assert second_received == [5]
+
+    def test_events_are_applied_once_in_order(self, db_session):
+        """Test polling resumes after the last seen event."""
+        publisher = self._worker([])
+        received = []
+        subscriber = self._worker(received)
+
+        publisher.publish('leaderboard', 1)
+        publisher.publish('leaderboard', None)
+        assert subscriber.poll(force=True) == 2
+        assert subscriber.poll(force=True) == 0
+
+        publisher.publish('leaderboard', '*')
+        subscriber.poll(force=True)
+
+        assert received == [1, None, '*']
+
+    def test_events_before_start_are_ignored(self, db_session):
+        """Test a new worker skips events that predate it."""
+        publisher = self._worker([])
+        publisher.publish('leaderboard', 1)
+
+        received = []
+        late = self._worker(received)
+
+        assert late.poll(force=True) == 0
+        assert received == []
+
+    def test_event_committed_out_of_order_is_applied(self, db_session):
+        """Test an event whose lower sequence number commits late is still seen."""
+        from app.models.change_event import ChangeEvent
+        publisher = self._worker([])
+        received = []
+        subscriber = self._worker(received)
+
+        publisher.publish('leaderboard', 1)
+        publisher.publish('leaderboard', 3)
+        late = ChangeEvent.query.filter_by(key='1').one()
+        late_key = (late.id, late.origin, late.topic)
+        db_session.delete(late)
+        db_session.commit()
+        assert subscriber.poll(force=True) == 1
+
+        # The lower ID becomes visible only after the higher one was read
+        db_session.add(ChangeEvent(id=late_key[0], origin=late_key[1], topic=late_key[2], key='2'))
+        db_session.commit()
+
+        assert subscriber.poll(force=True) == 1
+        assert subscriber.poll(force=True) == 0
+        assert received == [3, 2]
+
+    def test_poll_is_throttled(self, db_session):
+        """Test the backend is polled at most once per interval."""
+        publisher = self._worker([])
+        received = []
+        subscriber = self._worker(received)
+        subscriber.poll_interval = 60
+
+        subscriber.poll()
+        publisher.publish('leaderboard', 1)
+
+        assert subscriber.poll() == 0
+        assert subscriber.poll(force=True) == 1
+
+    def test_remote_event_drops_leaderboard_cache(self, db_session, game_night, teams):
+        """Test a write in another worker invalidates this worker's snapshot."""
+        from app.services.leaderboard_service import (
+            LeaderboardService, leaderboard_cache, _drop_cached_leaderboard
+        )
+
+        other_worker = InvalidationBus(DatabaseBackend())
+        other_worker.backend.start()
+        this_worker = InvalidationBus(DatabaseBackend())
+        this_worker.backend.start()
+        this_worker.subscribe('leaderboard', _drop_cached_leaderboard)
+
+        LeaderboardService.get_snapshot(game_night.id)
+        assert game_night.id in leaderboard_cache
+
+        other_worker.publish('leaderboard', game_night.id)
+        this_worker.poll(force=True)
+
+        assert game_night.id not in leaderboard_cache
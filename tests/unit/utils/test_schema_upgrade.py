@@ -0,0 +1,131 @@
+"""Unit tests for startup schema upgrades of existing databases."""
+import pytest
+from sqlalchemy import inspect, text
+from app import db
+from app.models import Game, Match, Score, Tournament
+from app.services.score_service import ScoreService
+from app.services.standings_service import StandingsService
+from app.utils.schema_upgrade import upgrade_schema
+
+# The score table as created before the (game_id, team_id) unique constraint
+OLD_SCORE_TABLE = """
+CREATE TABLE score (
+    id INTEGER PRIMARY KEY,
+    points INTEGER,
+    score_value FLOAT,
+    notes TEXT,
+    team_id INTEGER NOT NULL REFERENCES team (id),
+    game_id INTEGER NOT NULL REFERENCES game (id),
+    multi_timer_avg FLOAT,
+    timer_count INTEGER
+)
+"""
+
+# The match table as created before double elimination (no bracket or loser links)
+OLD_MATCH_TABLE = """
+CREATE TABLE "match" (
+    id INTEGER PRIMARY KEY,
+    tournament_id INTEGER NOT NULL REFERENCES tournament (id),
+    round_number INTEGER NOT NULL,
+    position_in_round INTEGER NOT NULL,
+    team1_id INTEGER REFERENCES team (id),
+    team2_id INTEGER REFERENCES team (id),
+    team1_score FLOAT,
+    team2_score FLOAT,
+    winner_team_id INTEGER REFERENCES team (id),
+    status VARCHAR(20),
+    is_bye BOOLEAN,
+    next_match_id INTEGER REFERENCES "match" (id),
+    next_match_position VARCHAR(10),
+    is_play_in BOOLEAN
+)
+"""
+
+
+def _columns(table):
+    return [(column['name'], str(column['type']), column['default']) for column in inspect(db.engine).get_columns(table)]
+
+
+def _score_indexes():
+    return {index['name']: index for index in inspect(db.engine).get_indexes('score')}
+
+
+class TestScoreUniqueIndex:
+    """Test adding the score upsert conflict target to an old score table."""
+
+    @pytest.fixture
+    def old_score_table(self, db_session):
+        """Replace the score table with its pre-constraint definition."""
+        db_session.execute(text('DROP TABLE score'))
+        db_session.execute(text(OLD_SCORE_TABLE))
+        db_session.commit()
+
+    def test_duplicates_are_removed_and_index_added(self, db_session, game_night, teams, game, old_score_table):
+        """Test the newest duplicate is kept, standings follow, and upserts work afterwards."""
+        for points in (1, 2, 5):
+            db_session.execute(text('INSERT INTO score (points, team_id, game_id) VALUES (:points, :team, :game)'),
+                               {'points': points, 'team': teams[0].id, 'game': game.id})
+        db_session.commit()
+
+        upgrade_schema()
+
+        assert _score_indexes()['uq_score_game_team']['unique']
+        assert [score.points for score in Score.query.filter_by(game_id=game.id)] == [5]
+        assert StandingsService.get_standing(game_night.id, teams[0].id).points == 5
+
+        ScoreService.save_scores(game.id, {teams[0].id: {'points': 7}, teams[1].id: {'points': 3}})
+        assert Score.query.filter_by(game_id=game.id).count() == 2
+
+    def test_current_schema_is_left_alone(self, db_session):
+        """Test a database created from the current models gets no extra index."""
+        before = _score_indexes()
+
+        upgrade_schema()
+
+        assert _score_indexes() == before
+
+
+class TestAddedColumns:
+    """Test adding model columns missing from existing tables."""
+
+    def test_missing_column_is_added_with_default(self, db_session, game):
+        """Test existing rows read the column default after the upgrade."""
+        db_session.execute(text('ALTER TABLE game DROP COLUMN timer_estimator'))
+        db_session.commit()
+        db_session.expire_all()
+
+        upgrade_schema()
+
+        assert ('timer_estimator', 'VARCHAR(20)', "'trimmed_mean'") in _columns('game')
+        assert db_session.get(Game, game.id).timer_estimator == 'trimmed_mean'
+
+    def test_present_columns_are_left_alone(self, db_session, game):
+        """Test an up-to-date database is not altered."""
+        before = _columns('game')
+
+        upgrade_schema()
+
+        assert _columns('game') == before
+
+    def test_tournament_tables_get_format_and_bracket_columns(self, db_session, game, teams):
+        """Test a pre-double-elimination tournament loads as single elimination in the main bracket."""
+        db_session.execute(text('DROP TABLE "match"'))
+        db_session.execute(text(OLD_MATCH_TABLE))
+        db_session.execute(text('ALTER TABLE tournament DROP COLUMN format'))
+        db_session.execute(text('ALTER TABLE tournament DROP COLUMN round_count'))
+        db_session.execute(text('INSERT INTO tournament (game_id) VALUES (:game)'), {'game': game.id})
+        db_session.execute(text(
+            'INSERT INTO "match" (tournament_id, round_number, position_in_round, team1_id, team2_id, status) '
+            "VALUES (1, 1, 0, :team1, :team2, 'pending')"
+        ), {'team1': teams[0].id, 'team2': teams[1].id})
+        db_session.commit()
+
+        upgrade_schema()
+
+        tournament = Tournament.query.one()
+        match = Match.query.one()
+        assert (tournament.format, tournament.round_count) == ('single_elimination', None)
+        assert (match.bracket, match.loser_next_match_id, match.loser_next_match_position) == ('main', None, None)
+        assert ('loser_next_match_id', 'match') in {
+            (fk['constrained_columns'][0], fk['referred_table']) for fk in inspect(db.engine).get_foreign_keys('match')
+        }
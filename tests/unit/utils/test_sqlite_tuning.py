@@ -0,0 +1,84 @@
+"""Unit tests for the SQLite performance profile."""
+import pytest
+from flask import Flask
+from app import db
+from app.exceptions import ConfigurationError
+from app.utils.sqlite_tuning import validate_pragmas, get_effective_settings, init_sqlite_tuning
+
+
+PROFILE = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': 5000,
+    'mmap_size': 1048576,
+    'cache_size': -2000,
+    'temp_store': 'MEMORY',
+}
+
+
+@pytest.fixture
+def file_app(tmp_path):
+    """Minimal app backed by a SQLite file, as in production."""
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{tmp_path / 'tuning.db'}"
+    app.config['SQLITE_PRAGMAS'] = PROFILE
+    db.init_app(app)
+    yield app
+    with app.app_context():
+        db.engine.dispose()
+
+
+class TestValidatePragmas:
+    """Test checking of the SQLITE_PRAGMAS setting."""
+
+    def test_orders_busy_timeout_first(self):
+        """Test the busy timeout is set before the journal mode is switched."""
+        pragmas = validate_pragmas(PROFILE)
+
+        assert pragmas[0] == ('busy_timeout', 5000)
+        assert [name for name, _ in pragmas][1] == 'journal_mode'
+
+    def test_rejects_unknown_pragma(self):
+        """Test only the supported tuning pragmas are accepted."""
+        with pytest.raises(ConfigurationError):
+            validate_pragmas({'writable_schema': 'ON'})
+
+    def test_rejects_malformed_value(self):
+        """Test values that could inject SQL are refused."""
+        with pytest.raises(ConfigurationError):
+            validate_pragmas({'journal_mode': 'WAL; DROP TABLE team'})
+
+
+class TestInitSqliteTuning:
+    """Test the profile is applied to every connection."""
+
+    def test_applies_profile_to_new_connections(self, file_app):
+        """Test every pooled connection runs with the configured pragmas."""
+        init_sqlite_tuning(file_app)
+
+        with file_app.app_context():
+            with db.engine.connect() as first, db.engine.connect() as second:
+                for connection in (first, second):
+                    settings = get_effective_settings(connection)
+                    assert settings['journal_mode'] == 'wal'
+                    assert settings['synchronous'] == 1  # NORMAL
+                    assert settings['busy_timeout'] == 5000
+                    assert settings['mmap_size'] == 1048576
+                    assert settings['cache_size'] == -2000
+                    assert settings['temp_store'] == 2  # MEMORY
+
+    def test_returns_effective_settings(self, file_app):
+        """Test the startup check reads the settings back from the database."""
+        settings = init_sqlite_tuning(file_app)
+
+        assert settings['journal_mode'] == 'wal'
+        assert settings['busy_timeout'] == 5000
+
+    def test_empty_profile_leaves_defaults(self, file_app):
+        """Test nothing is changed when SQLITE_PRAGMAS is empty."""
+        file_app.config['SQLITE_PRAGMAS'] = {}
+        assert init_sqlite_tuning(file_app) is None
+
+        with file_app.app_context():
+            with db.engine.connect() as connection:
+                assert get_effective_settings(connection)['journal_mode'] == 'delete'
@@ -0,0 +1,180 @@
+"""Unit tests for the asyncio realtime server."""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from flask import has_app_context
+from werkzeug.test import EnvironBuilder
+from app.models import Score
+from app.websockets import events
+from app.websockets.async_server import AsyncDatabaseQueueManager, AsyncRealtimeServer, ThreadBridge
+from app.websockets.events import Emit, JoinRoom, LeaveRoom
+
+
+class FakeAsyncServer:
+    """Records awaited room changes and emits instead of sending them."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def enter_room(self, sid, room):
+        self.calls.append(('enter_room', sid, room))
+
+    async def leave_room(self, sid, room):
+        self.calls.append(('leave_room', sid, room))
+
+    async def emit(self, event, data=None, to=None, room=None, skip_sid=None):
+        self.calls.append(('emit', event, data, to, room, skip_sid))
+
+
+@pytest.fixture
+def server(app):
+    """Async server with its handlers registered but sends recorded."""
+    server = AsyncRealtimeServer(app, db_workers=2)
+    handlers = server.sio.handlers['/']
+    server.sio = FakeAsyncServer()
+    server.handlers = handlers
+    yield server
+    server.executor.shutdown(wait=True)
+    events._connection_data.clear()
+
+
+class TestPerform:
+    """Test translating shared handler actions to AsyncServer calls."""
+
+    def test_actions_map_to_rooms_and_emits(self, server):
+        """Test replies, room broadcasts and skip-sender broadcasts."""
+        asyncio.run(server.perform('sid1', [
+            JoinRoom('game_1'),
+            Emit('game_state', {'scores': {}}),
+            Emit('user_joined', {'user_id': 'u'}, 'game_1', skip_sender=True),
+            Emit('score_updated', {'points': 3}, 'game_1'),
+            LeaveRoom('game_1')
+        ]))
+
+        assert server.sio.calls == [
+            ('enter_room', 'sid1', 'game_1'),
+            ('emit', 'game_state', {'scores': {}}, 'sid1', None, None),
+            ('emit', 'user_joined', {'user_id': 'u'}, None, 'game_1', 'sid1'),
+            ('emit', 'score_updated', {'points': 3}, None, 'game_1', None),
+            ('leave_room', 'sid1', 'game_1')
+        ]
+
+
+class TestEventHandlers:
+    """Test the registered async handlers run the shared business logic."""
+
+    def test_database_work_runs_on_pool_thread_in_app_context(self, server):
+        """Test blocking calls leave the event loop thread."""
+        def probe():
+            return threading.current_thread().name, has_app_context()
+
+        name, in_context = asyncio.run(server.run_sync(probe))
+
+        assert name.startswith('realtime-db')
+        assert in_context
+
+    def test_join_game_sends_state(self, server, game, teams, db_session):
+        """Test joining a game replies with scores read through the pool."""
+        db_session.add(Score(game_id=game.id, team_id=teams[0].id, score_value=10, points=3))
+        db_session.commit()
+
+        async def scenario():
+            await server.handlers['connect']('sid1', EnvironBuilder().get_environ())
+            await server.handlers['join_game']('sid1', {'game_id': game.id})
+
+        asyncio.run(scenario())
+
+        state = next(call for call in server.sio.calls if call[1] == 'game_state')
+        assert state[2]['scores'][teams[0].id]['points'] == 3
+        assert ('enter_room', 'sid1', f'game_{game.id}') in server.sio.calls
+
+    def test_anonymous_connection_cannot_clear_timers(self, server):
+        """Test the admin check sees handshake identity."""
+        async def scenario():
+            await server.handlers['connect']('sid1', EnvironBuilder().get_environ())
+            await server.handlers['clear_timers']('sid1', {'game_id': 1, 'team_id': 1})
+
+        asyncio.run(scenario())
+
+        assert server.sio.calls[-1][1:4] == ('error', {'message': 'Only admins can clear timers'}, 'sid1')
+
+    @pytest.mark.parametrize('time_value', [None, 'fast', float('nan'), -1])
+    def test_invalid_timer_value_is_rejected(self, server, time_value):
+        """Test a stop without a usable time replies with an error and queues nothing."""
+        async def scenario():
+            await server.handlers['connect']('sid1', EnvironBuilder().get_environ())
+            await server.handlers['stop_timer']('sid1', {'game_id': 1, 'team_id': 1, 'time_value': time_value})
+
+        asyncio.run(scenario())
+
+        assert server.sio.calls[-1][1:4] == ('error', {'message': 'Invalid timer value'}, 'sid1')
+        assert len(events.timer_aggregator.queue) == 0
+
+    def test_admin_identified_from_session_cookie(self, server, authenticated_client, admin_user):
+        """Test a logged-in admin's handshake is recognized."""
+        cookie = authenticated_client.get_cookie('session')
+        environ = EnvironBuilder(path='/socket.io/', headers={'Cookie': f'session={cookie.value}'}).get_environ()
+
+        assert asyncio.run(server.run_sync(server._admin_id, environ)) == admin_user.id
+
+    def test_disconnect_releases_locks(self, server, db_session):
+        """Test a dropped connection unlocks its fields for the room."""
+        async def scenario():
+            await server.handlers['connect']('sid1', EnvironBuilder().get_environ())
+            await server.handlers['request_edit_lock']('sid1', {'game_id': 7, 'team_id': 2, 'field': 'score'})
+            await server.handlers['disconnect']('sid1')
+
+        asyncio.run(scenario())
+
+        assert server.sio.calls[-1] == ('emit', 'field_unlocked', {'team_id': 2, 'field': 'score'},
+                                        None, 'game_7', None)
+        assert not events.lock_manager.get_game_locks(7)
+
+
+class TestThreadBridge:
+    """Test emitting from worker threads."""
+
+    def test_emit_from_thread_runs_on_loop(self):
+        """Test a thread's emit is scheduled on the server's event loop."""
+        sio = FakeAsyncServer()
+
+        async def scenario():
+            bridge = ThreadBridge(sio, asyncio.get_running_loop())
+            future = await asyncio.to_thread(bridge.emit, 'leaderboard_delta', {'teams': []}, room='leaderboard_1')
+            await asyncio.wrap_future(future)
+
+        asyncio.run(scenario())
+
+        assert sio.calls == [('emit', 'leaderboard_delta', {'teams': []}, None, 'leaderboard_1', None)]
+
+    def test_background_tasks_share_a_bounded_pool(self):
+        """Test background tasks run on the bridge's thread pool, not a new thread each."""
+        executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='bridge-test')
+        bridge = ThreadBridge(FakeAsyncServer(), None, executor)
+
+        futures = [bridge.start_background_task(lambda: threading.current_thread().name) for _ in range(10)]
+
+        assert {future.result() for future in futures} <= {'bridge-test_0', 'bridge-test_1'}
+        executor.shutdown()
+
+
+class TestAsyncDatabaseQueueManager:
+    """Test the asyncio side of the socket_message relay."""
+
+    def test_listen_receives_messages_published_later(self, app, db_session):
+        """Test a message published after the listener starts is yielded."""
+        sender = AsyncDatabaseQueueManager(app)
+        receiver = AsyncDatabaseQueueManager(app, poll_interval=0.01)
+
+        async def scenario():
+            await sender._publish({'method': 'emit', 'event': 'old'})
+            listener = receiver._listen()
+            received = asyncio.ensure_future(anext(listener))
+            await asyncio.sleep(0.05)
+            await sender._publish({'method': 'emit', 'event': 'new'})
+            message = await asyncio.wait_for(received, timeout=2)
+            await listener.aclose()
+            return message
+
+        assert asyncio.run(scenario())['event'] == 'new'
@@ -0,0 +1,148 @@
+"""Unit tests for LeaderboardBroadcaster."""
+import pytest
+from app.websockets.leaderboard_broadcaster import LeaderboardBroadcaster
+from tests.factories import ScoreFactory
+
+
+class FakeSocketIO:
+    """Records emits and background tasks instead of running them."""
+
+    def __init__(self):
+        self.emitted = []
+        self.tasks = []
+
+    def emit(self, event, data, room=None, **kwargs):
+        self.emitted.append((event, data, room))
+        self.options = kwargs
+
+    def start_background_task(self, target, *args):
+        self.tasks.append((target, args))
+
+    def sleep(self, seconds):
+        pass
+
+
+@pytest.fixture
+def broadcaster(app):
+    """Create a broadcaster wired to a fake Socket.IO server."""
+    broadcaster = LeaderboardBroadcaster(delay=0)
+    broadcaster.app = app
+    broadcaster.socketio = FakeSocketIO()
+    return broadcaster
+
+
+class TestLeaderboardBroadcaster:
+    """Test debounced standings deltas."""
+
+    def test_get_state_returns_standings(self, broadcaster, db_session, game_night, teams, completed_game):
+        """Test joining clients receive full standings."""
+        state = broadcaster.get_state(game_night.id)
+
+        assert state['game_night_id'] == game_night.id
+        assert state['revision'] > 0
+        assert [row['team_id'] for row in state['standings']] == [t.id for t in teams]
+        assert game_night.id in broadcaster.baselines
+
+    def test_delta_contains_only_changed_teams(self, broadcaster, db_session, game_night, teams, game,
+                                               completed_game):
+        """Test deltas carry rank and point changes only."""
+        broadcaster.get_state(game_night.id)
+        ScoreFactory.create(db_session, game.id, teams[1].id, points=5)
+
+        delta = broadcaster.flush(game_night.id)
+
+        assert [change['team_id'] for change in delta['changes']] == [teams[1].id, teams[0].id]
+        assert delta['changes'][0] == {
+            'team_id': teams[1].id, 'rank': 1, 'points': 7, 'rank_change': 1, 'points_change': 5
+        }
+        assert delta['changes'][1]['rank_change'] == -1
+        assert delta['changes'][1]['points_change'] == 0
+        assert broadcaster.socketio.emitted == [
+            ('leaderboard_delta', delta, f'leaderboard_{game_night.id}')
+        ]
+
+    def test_deltas_bypass_message_queue(self, broadcaster, db_session, game_night, teams, game,
+                                         completed_game):
+        """Test each worker sends deltas only to its own clients when a queue is configured."""
+        broadcaster.local_only = True
+        broadcaster.get_state(game_night.id)
+        ScoreFactory.create(db_session, game.id, teams[1].id, points=5)
+
+        broadcaster.flush(game_night.id)
+
+        assert broadcaster.socketio.options == {'ignore_queue': True}
+
+    def test_no_change_emits_nothing(self, broadcaster, db_session, game_night, teams, completed_game):
+        """Test a flush without standings changes is silent."""
+        broadcaster.get_state(game_night.id)
+
+        assert broadcaster.flush(game_night.id) is None
+        assert broadcaster.socketio.emitted == []
+
+    def test_removed_team_is_reported(self, broadcaster, db_session, game_night, teams):
+        """Test deleted teams are listed in the delta."""
+        broadcaster.get_state(game_night.id)
+        db_session.delete(teams[2])
+        db_session.commit()
+
+        delta = broadcaster.flush(game_night.id)
+
+        assert delta['removed'] == [teams[2].id]
+
+    def test_burst_of_writes_schedules_one_broadcast(self, broadcaster, db_session, game_night, teams):
+        """Test invalidations are coalesced while a broadcast is pending."""
+        broadcaster.get_state(game_night.id)
+
+        for _ in range(5):
+            broadcaster.schedule(game_night.id)
+
+        assert len(broadcaster.socketio.tasks) == 1
+
+        broadcaster.flush(game_night.id)
+        broadcaster.schedule(game_night.id)
+        assert len(broadcaster.socketio.tasks) == 2
+
+    def test_unwatched_game_nights_are_ignored(self, broadcaster, db_session, game_night):
+        """Test nothing is scheduled for game nights without viewers."""
+        broadcaster.schedule(game_night.id)
+        broadcaster.schedule(None)
+
+        assert broadcaster.socketio.tasks == []
+
+    def test_all_game_nights_schedules_every_watched_room(self, broadcaster, db_session, game_night, teams):
+        """Test a global invalidation reaches every watched game night."""
+        broadcaster.get_state(game_night.id)
+
+        broadcaster.schedule('*')
+
+        assert broadcaster.socketio.tasks == [(broadcaster._flush_later, (game_night.id,))]
+
+    def test_background_task_flushes_in_app_context(self, broadcaster, db_session, game_night, teams, game):
+        """Test the scheduled task broadcasts after the debounce window."""
+        broadcaster.get_state(game_night.id)
+        ScoreFactory.create(db_session, game.id, teams[2].id, points=4)
+        broadcaster.schedule(game_night.id)
+
+        target, args = broadcaster.socketio.tasks[0]
+        target(*args)
+
+        assert broadcaster.socketio.emitted[0][1]['changes'][0]['team_id'] == teams[2].id
+        assert broadcaster.pending == set()
+
+    def test_empty_room_stops_tracking(self, broadcaster, db_session, game_night, teams, game):
+        """Test a game night is dropped once its last subscriber leaves or disconnects."""
+        broadcaster.get_state(game_night.id, 'sid-1')
+        broadcaster.get_state(game_night.id, 'sid-2')
+
+        broadcaster.unwatch('sid-1', game_night.id)
+        assert game_night.id in broadcaster.baselines
+
+        broadcaster.schedule(game_night.id)
+        broadcaster.unwatch('sid-2')
+        assert broadcaster.baselines == {} and broadcaster.watchers == {}
+
+        # A broadcast already scheduled for the emptied room sends nothing
+        ScoreFactory.create(db_session, game.id, teams[0].id, points=4)
+        assert broadcaster.flush(game_night.id) is None
+        assert broadcaster.socketio.emitted == []
+        assert broadcaster.baselines == {}
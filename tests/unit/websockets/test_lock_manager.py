@@ -1,7 +1,8 @@
 """Unit tests for EditLockManager."""
 import pytest
 from datetime import datetime, timedelta
-from app.websockets.lock_manager import EditLockManager
+from app.exceptions import ConfigurationError
+from app.websockets.lock_manager import EditLockManager, DatabaseLockManager, create_lock_manager
 
 
 class TestEditLockManager:
@@ -98,15 +99,181 @@ class TestEditLockManager:
 
     def test_cleanup_expired_locks(self):
         """Test cleanup of expired locks."""
+        clock = FakeClock()
+        manager = EditLockManager(lock_timeout_minutes=1, clock=clock)
+        manager.acquire_lock(1, 1, 'score', 'user1', 'User One')
+        clock.advance(seconds=50)
+        manager.acquire_lock(1, 2, 'score', 'user2', 'User Two')
+
+        # Expire first lock only
+        clock.advance(seconds=20)
+        count = manager.cleanup_expired_locks()
+
+        assert count == 1
+        assert not manager.has_lock(1, 1, 'score', 'user1')
+        assert manager.has_lock(1, 2, 'score', 'user2')
+        assert manager.get_game_locks(1) == [
+            {'team_id': 2, 'field_name': 'score', 'user_id': 'user2', 'display_name': 'User Two'}
+        ]
+
+    def test_cleanup_skips_refreshed_locks(self):
+        """Test a lock refreshed before its old deadline is not swept."""
+        clock = FakeClock()
+        manager = EditLockManager(lock_timeout_minutes=1, clock=clock)
+        manager.acquire_lock(1, 1, 'score', 'user1', 'User One')
+        clock.advance(seconds=50)
+        manager.acquire_lock(1, 1, 'score', 'user1', 'User One')
+
+        clock.advance(seconds=20)
+
+        assert manager.cleanup_expired_locks() == 0
+        assert manager.has_lock(1, 1, 'score', 'user1')
+
+    def test_indexes_follow_releases(self):
+        """Test per-game and per-user indexes drop released locks."""
         self.manager.acquire_lock(1, 1, 'score', 'user1', 'User One')
-        self.manager.acquire_lock(1, 2, 'score', 'user2', 'User Two')
+        self.manager.acquire_lock(2, 1, 'score', 'user1', 'User One')
+        self.manager.release_lock(1, 1, 'score', 'user1')
 
-        # Expire first lock
-        key = (1, 1, 'score')
-        self.manager.locks[key]['locked_at'] = datetime.utcnow() - timedelta(minutes=10)
+        assert self.manager.get_game_locks(1) == []
+        assert 1 not in self.manager.game_index
+        assert self.manager.release_all_user_locks('user1') == [
+            {'game_id': 2, 'team_id': 1, 'field_name': 'score'}
+        ]
+        assert 'user1' not in self.manager.user_index
 
-        count = self.manager.cleanup_expired_locks()
+    def test_expiry_heap_stays_bounded(self):
+        """Test repeated refreshes don't grow the expiry heap without limit."""
+        for _ in range(1000):
+            self.manager.acquire_lock(1, 1, 'score', 'user1', 'User One')
 
-        assert count == 1
-        assert not self.manager.has_lock(1, 1, 'score', 'user1')
-        assert self.manager.has_lock(1, 2, 'score', 'user2')
+        assert len(self.manager.expiry_heap) <= 2 * len(self.manager.locks) + 65
+
+
+class FakeClock:
+    """Controllable replacement for datetime.utcnow."""
+
+    def __init__(self):
+        self.now = datetime(2024, 1, 1, 12, 0, 0)
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += timedelta(seconds=seconds)
+
+
+class TestDatabaseLockManager:
+    """Test edit locks shared through the active_edit table."""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def manager(self, db_session, clock):
+        return DatabaseLockManager(lock_timeout_minutes=1, clock=clock)
+
+    @pytest.fixture
+    def other_worker(self, db_session, clock):
+        """A second manager, as in another gunicorn worker."""
+        return DatabaseLockManager(lock_timeout_minutes=1, clock=clock)
+
+    def test_lock_is_exclusive_across_workers(self, manager, other_worker, game, teams):
+        """Test a lock taken in one worker is denied in another."""
+        assert manager.acquire_lock(game.id, teams[0].id, 'score', 'user1', 'User One')['success'] is True
+
+        result = other_worker.acquire_lock(game.id, teams[0].id, 'score', 'user2', 'User Two')
+
+        assert result == {'success': False, 'locked_by': 'User One'}
+        assert other_worker.has_lock(game.id, teams[0].id, 'score', 'user1')
+
+    def test_same_user_refreshes(self, manager, clock, game, teams):
+        """Test re-acquiring extends the lock instead of failing."""
+        manager.acquire_lock(game.id, teams[0].id, 'score', 'user1', 'User One')
+        clock.advance(seconds=50)
+        assert manager.acquire_lock(game.id, teams[0].id, 'score', 'user1', 'User One')['success'] is True
+
+        clock.advance(seconds=20)
+
+        assert manager.expire_locks() == []
+        assert manager.has_lock(game.id, teams[0].id, 'score', 'user1')
+
+    def test_expired_lock_can_be_taken_over(self, manager, other_worker, clock, game, teams):
+        """Test an expired lock is given to the next requester."""
+        manager.acquire_lock(game.id, teams[0].id, 'score', 'user1', 'User One')
+        clock.advance(seconds=61)
+
+        result = other_worker.acquire_lock(game.id, teams[0].id, 'score', 'user2', 'User Two')
+
+        assert result['success'] is True
+        assert manager.has_lock(game.id, teams[0].id, 'score', 'user2')
+        assert not manager.release_lock(game.id, teams[0].id, 'score', 'user1')
+
+    def test_release_and_game_locks(self, manager, game, teams):
+        """Test releasing removes the lock and get_game_locks lists the rest."""
+        manager.acquire_lock(game.id, teams[0].id, 'score', 'user1', 'User One')
+        manager.acquire_lock(game.id, teams[1].id, 'score', 'user2', 'User Two')
+
+        assert manager.release_lock(game.id, teams[0].id, 'score', 'user1') is True
+        assert manager.get_game_locks(game.id) == [
+            {'team_id': teams[1].id, 'field_name': 'score', 'user_id': 'user2', 'display_name': 'User Two'}
+        ]
+
+    def test_release_all_user_locks(self, manager, game, teams):
+        """Test a disconnect releases only that user's locks."""
+        manager.acquire_lock(game.id, teams[0].id, 'score', 'user1', 'User One')
+        manager.acquire_lock(game.id, teams[1].id, 'score', 'user1', 'User One')
+        manager.acquire_lock(game.id, teams[2].id, 'score', 'user2', 'User Two')
+
+        released = manager.release_all_user_locks('user1')
+
+        assert sorted(lock['team_id'] for lock in released) == sorted([teams[0].id, teams[1].id])
+        assert manager.has_lock(game.id, teams[2].id, 'score', 'user2')
+
+    def test_expire_locks_and_next_deadline(self, manager, clock, game, teams):
+        """Test the sweeper interface reports deadlines and removes due locks."""
+        assert manager.seconds_until_next_expiry() is None
+
+        manager.acquire_lock(game.id, teams[0].id, 'score', 'user1', 'User One')
+        clock.advance(seconds=45)
+        assert manager.seconds_until_next_expiry() == 15
+
+        clock.advance(seconds=20)
+        assert manager.expire_locks() == [{'game_id': game.id, 'team_id': teams[0].id, 'field_name': 'score'}]
+        assert manager.get_game_locks(game.id) == []
+
+    def test_deleting_game_removes_its_locks(self, manager, db_session, game, teams):
+        """Test a held lock does not block deleting the game."""
+        from app.models import ActiveEdit
+        manager.acquire_lock(game.id, teams[0].id, 'score', 'user1', 'User One')
+
+        db_session.delete(game)
+        db_session.commit()
+
+        assert ActiveEdit.query.count() == 0
+
+
+class TestCreateLockManager:
+    """Test backend selection from config."""
+
+    def test_selects_backend(self, app):
+        """Test EDIT_LOCK_BACKEND picks the implementation."""
+        original = app.config['EDIT_LOCK_BACKEND']
+        try:
+            app.config['EDIT_LOCK_BACKEND'] = 'database'
+            assert isinstance(create_lock_manager(app), DatabaseLockManager)
+            app.config['EDIT_LOCK_BACKEND'] = 'memory'
+            assert isinstance(create_lock_manager(app), EditLockManager)
+        finally:
+            app.config['EDIT_LOCK_BACKEND'] = original
+
+    def test_unknown_backend_raises(self, app):
+        """Test a typo in EDIT_LOCK_BACKEND fails at startup."""
+        original = app.config['EDIT_LOCK_BACKEND']
+        try:
+            app.config['EDIT_LOCK_BACKEND'] = 'redis'
+            with pytest.raises(ConfigurationError):
+                create_lock_manager(app)
+        finally:
+            app.config['EDIT_LOCK_BACKEND'] = original
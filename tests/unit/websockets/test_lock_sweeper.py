@@ -0,0 +1,91 @@
+"""Unit tests for the background edit lock sweeper."""
+from datetime import datetime, timedelta
+from app.websockets.lock_manager import EditLockManager
+from app.websockets.lock_sweeper import LockSweeper
+
+
+class FakeClock:
+    """Controllable replacement for datetime.utcnow."""
+
+    def __init__(self):
+        self.now = datetime(2024, 1, 1, 12, 0, 0)
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += timedelta(seconds=seconds)
+
+
+class FakeSocketIO:
+    """Records emits and background tasks instead of running them."""
+
+    def __init__(self):
+        self.emitted = []
+        self.tasks = []
+
+    def emit(self, event, data, room=None):
+        self.emitted.append((event, data, room))
+
+    def start_background_task(self, target, *args):
+        self.tasks.append((target, args))
+        return target
+
+    def sleep(self, seconds):
+        pass
+
+
+class TestLockSweeper:
+    """Test scheduled expiry of edit locks."""
+
+    def setup_method(self):
+        """Set up a manager with a controllable clock and a sweeper."""
+        self.clock = FakeClock()
+        self.manager = EditLockManager(lock_timeout_minutes=1, clock=self.clock)
+        self.socketio = FakeSocketIO()
+        self.sweeper = LockSweeper(self.manager)
+        self.sweeper.start(self.socketio)
+
+    def test_start_runs_one_task(self):
+        """Test starting twice (e.g. two create_app calls) keeps a single loop."""
+        self.sweeper.start(self.socketio)
+
+        assert len(self.socketio.tasks) == 1
+
+    def test_sleeps_until_next_deadline(self):
+        """Test the sweep interval follows the earliest lock deadline."""
+        assert self.sweeper.next_interval() == 60
+
+        self.manager.acquire_lock(1, 1, 'score', 'user1', 'User One')
+        self.clock.advance(seconds=45)
+
+        assert self.sweeper.next_interval() == 15
+
+    def test_interval_has_a_floor(self):
+        """Test an overdue lock doesn't make the loop spin."""
+        self.manager.acquire_lock(1, 1, 'score', 'user1', 'User One')
+        self.clock.advance(seconds=120)
+
+        assert self.sweeper.next_interval() == self.sweeper.min_interval
+
+    def test_sweep_unlocks_expired_fields_in_their_rooms(self):
+        """Test expired locks are removed and field_unlocked reaches the game room."""
+        self.manager.acquire_lock(1, 1, 'score', 'user1', 'User One')
+        self.manager.acquire_lock(2, 3, 'score', 'user2', 'User Two')
+        self.clock.advance(seconds=61)
+
+        expired = self.sweeper.sweep()
+
+        assert len(expired) == 2
+        assert self.manager.locks == {}
+        assert ('field_unlocked', {'team_id': 1, 'field': 'score', 'expired': True}, 'game_1') in self.socketio.emitted
+        assert ('field_unlocked', {'team_id': 3, 'field': 'score', 'expired': True}, 'game_2') in self.socketio.emitted
+
+    def test_sweep_leaves_live_locks(self):
+        """Test nothing is emitted before a lock's deadline."""
+        self.manager.acquire_lock(1, 1, 'score', 'user1', 'User One')
+        self.clock.advance(seconds=30)
+
+        assert self.sweeper.sweep() == []
+        assert self.socketio.emitted == []
+        assert self.manager.has_lock(1, 1, 'score', 'user1')
@@ -0,0 +1,83 @@
+"""Unit tests for the Socket.IO message queue backends."""
+import threading
+import pytest
+from app.models import SocketMessage
+from app.websockets.message_queue import DatabaseQueueManager, message_queue_options
+
+
+@pytest.fixture
+def queue_config(app):
+    """Restore SOCKETIO_MESSAGE_QUEUE after a test changes it."""
+    original = app.config.get('SOCKETIO_MESSAGE_QUEUE')
+    yield app.config
+    app.config['SOCKETIO_MESSAGE_QUEUE'] = original
+
+
+class TestMessageQueueOptions:
+    """Test backend selection from config."""
+
+    def test_no_queue_by_default(self, app, queue_config):
+        """Test a single process needs no queue."""
+        queue_config['SOCKETIO_MESSAGE_QUEUE'] = ''
+
+        assert message_queue_options(app) == {}
+
+    def test_database_relay(self, app, queue_config):
+        """Test 'database' installs the built-in client manager."""
+        queue_config['SOCKETIO_MESSAGE_QUEUE'] = 'database'
+
+        options = message_queue_options(app)
+
+        assert isinstance(options['client_manager'], DatabaseQueueManager)
+
+    def test_url_is_passed_to_flask_socketio(self, app, queue_config):
+        """Test external queues are handed to Flask-SocketIO by URL."""
+        queue_config['SOCKETIO_MESSAGE_QUEUE'] = 'redis://localhost:6379/0'
+
+        assert message_queue_options(app)['message_queue'] == 'redis://localhost:6379/0'
+
+
+class TestDatabaseQueueManager:
+    """Test relaying pub/sub messages between workers through the database."""
+
+    def test_published_message_is_fetched_by_other_worker(self, app, db_session):
+        """Test a message published by one worker is read back by another."""
+        sender = DatabaseQueueManager(app)
+        receiver = DatabaseQueueManager(app)
+        start = receiver._latest_id()
+
+        message = {'method': 'emit', 'event': 'score_updated', 'data': {'team_id': 1, 'points': 3},
+                   'namespace': '/', 'room': 'game_1', 'skip_sid': None, 'callback': None,
+                   'host_id': sender.host_id}
+        sender._publish(message)
+
+        assert [payload for _, payload in receiver._fetch(start)] == [message]
+
+    def test_channels_are_isolated(self, app, db_session):
+        """Test managers only see their own channel."""
+        DatabaseQueueManager(app, channel='other')._publish({'method': 'emit'})
+
+        assert DatabaseQueueManager(app)._fetch(0) == []
+
+    def test_listen_skips_history_and_yields_new_messages(self, app, db_session):
+        """Test a starting worker ignores old messages and receives later ones."""
+        sender = DatabaseQueueManager(app)
+        receiver = DatabaseQueueManager(app, poll_interval=0.01)
+        sender._publish({'method': 'emit', 'event': 'old'})
+
+        listener = receiver._listen()
+        timer = threading.Timer(0.05, sender._publish, args=({'method': 'emit', 'event': 'new'},))
+        timer.start()
+        try:
+            assert next(listener)['event'] == 'new'
+        finally:
+            timer.join()
+
+    def test_old_messages_are_pruned(self, app, db_session):
+        """Test the relay table does not grow without bound."""
+        manager = DatabaseQueueManager(app, retention_seconds=-1, prune_every=2)
+
+        manager._publish({'method': 'emit'})
+        manager._publish({'method': 'emit'})
+
+        assert SocketMessage.query.count() == 0
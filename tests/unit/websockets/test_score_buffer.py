@@ -0,0 +1,153 @@
+"""Unit tests for ScoreWriteBuffer."""
+import pytest
+from sqlalchemy.exc import OperationalError
+from app.models import Score
+from app.services.leaderboard_service import LeaderboardService, leaderboard_cache
+from app.websockets.score_buffer import ScoreWriteBuffer
+from tests.factories import ScoreFactory
+
+
+class FakeSocketIO:
+    """Records background tasks and emits instead of running them."""
+
+    def __init__(self):
+        self.tasks = []
+        self.emitted = []
+
+    def emit(self, event, data=None, room=None):
+        self.emitted.append((event, data, room))
+
+    def start_background_task(self, target, *args):
+        self.tasks.append((target, args))
+
+    def sleep(self, seconds):
+        pass
+
+
+@pytest.fixture
+def buffer(app):
+    """Create a buffer wired to a fake Socket.IO server."""
+    buffer = ScoreWriteBuffer(delay=0)
+    buffer.app = app
+    buffer.socketio = FakeSocketIO()
+    return buffer
+
+
+class TestScoreWriteBuffer:
+    """Test coalescing and flushing of live score edits."""
+
+    def test_updates_are_coalesced_per_field(self, buffer, db_session, teams, game):
+        """Test only the latest value per (game, team) is written."""
+        for points in range(1, 6):
+            buffer.add(game.id, teams[0].id, points * 10, points)
+        buffer.add(game.id, teams[1].id, 7, 2)
+
+        assert len(buffer) == 2
+        assert len(buffer.socketio.tasks) == 1
+        assert Score.query.count() == 0
+
+        assert buffer.flush() == 2
+        scores = {s.team_id: s for s in Score.query.filter_by(game_id=game.id)}
+        assert scores[teams[0].id].points == 5
+        assert scores[teams[0].id].score_value == 50
+        assert scores[teams[1].id].points == 2
+        assert len(buffer) == 0
+
+    def test_flush_updates_existing_scores(self, buffer, db_session, teams, game):
+        """Test buffered values overwrite scores already in the database."""
+        ScoreFactory.create(db_session, game.id, teams[0].id, points=1)
+
+        buffer.add(game.id, teams[0].id, 99, 9)
+        buffer.flush()
+
+        assert Score.query.filter_by(game_id=game.id).count() == 1
+        assert Score.query.filter_by(game_id=game.id).first().points == 9
+
+    def test_flush_selected_keys(self, buffer, db_session, teams, game):
+        """Test a lock release writes only its own field."""
+        buffer.add(game.id, teams[0].id, 1, 1)
+        buffer.add(game.id, teams[1].id, 2, 2)
+
+        assert buffer.flush(keys=[(game.id, teams[0].id)]) == 1
+        assert buffer.get_pending(game.id) == {teams[1].id: (2, 2)}
+
+    def test_flush_invalidates_leaderboard(self, buffer, db_session, game_night, teams, game):
+        """Test buffered writes drop the cached leaderboard."""
+        LeaderboardService.get_snapshot(game_night.id)
+
+        buffer.add(game.id, teams[2].id, 5, 5)
+        buffer.flush()
+
+        assert game_night.id not in leaderboard_cache
+        assert LeaderboardService.get_snapshot(game_night.id).teams[0].id == teams[2].id
+
+    def test_background_task_flushes(self, buffer, db_session, teams, game):
+        """Test the scheduled task writes the window's updates."""
+        buffer.add(game.id, teams[0].id, 3, 3)
+
+        target, args = buffer.socketio.tasks[0]
+        target(*args)
+
+        assert Score.query.filter_by(game_id=game.id, team_id=teams[0].id).first().points == 3
+        assert buffer.scheduled is False
+
+    def test_failed_write_is_kept_for_retry(self, buffer, db_session, teams, game, monkeypatch):
+        """Test a flush hit by a transient database error keeps the values for retry."""
+        def fail(batch, senders):
+            raise OperationalError('INSERT INTO score', {}, Exception('database is locked'))
+
+        monkeypatch.setattr(buffer, '_write', fail)
+        buffer.add(game.id, teams[0].id, 1, 1)
+
+        buffer.scheduled = False  # The delayed flush that ran this batch has finished
+
+        assert buffer.flush() == 0
+        assert buffer.get_pending(game.id) == {teams[0].id: (1, 1)}
+        assert buffer.scheduled is True
+        assert len(buffer.socketio.tasks) == 2
+
+    def test_missing_team_does_not_block_others(self, buffer, db_session, teams, game):
+        """Test a score for a deleted team is dropped instead of failing every flush."""
+        buffer.add(game.id, teams[0].id, 2, 2)
+        buffer.add(game.id, 9999, 5, 5)
+
+        assert buffer.flush() == 1
+        assert len(buffer) == 0
+        assert Score.query.filter_by(game_id=game.id).count() == 1
+
+    def test_dropped_score_is_reported_to_sender(self, buffer, db_session, teams, game):
+        """Test the client whose edit cannot be saved gets an error event."""
+        buffer.add(game.id, teams[0].id, 2, 2, sid='scorer')
+        buffer.add(game.id, 9999, 5, 5, sid='other')
+
+        buffer.flush()
+
+        assert [(event, room) for event, _, room in buffer.socketio.emitted] == [('error', 'other')]
+        assert buffer.socketio.emitted[0][1]['team_id'] == 9999
+
+    def test_failed_batch_is_retried_row_by_row(self, buffer, db_session, teams, game, monkeypatch):
+        """Test rows of a failed batch that succeed alone are written and the bad row is dropped."""
+        write = buffer._write
+
+        def fail_on_bad_row(batch, senders):
+            if (game.id, teams[1].id) in batch:
+                raise ValueError('bad row')
+            return write(batch, senders)
+
+        monkeypatch.setattr(buffer, '_write', fail_on_bad_row)
+        buffer.add(game.id, teams[0].id, 2, 2)
+        buffer.add(game.id, teams[1].id, 3, 3, sid='bad')
+        buffer.add(game.id, teams[2].id, 4, 4)
+
+        assert buffer.flush() == 2
+        assert len(buffer) == 0
+        assert [room for _, _, room in buffer.socketio.emitted] == ['bad']
+        assert {score.team_id for score in Score.query.filter_by(game_id=game.id)} == {teams[0].id, teams[2].id}
+
+    def test_flush_on_exit(self, buffer, db_session, teams, game):
+        """Test shutdown writes anything still pending."""
+        buffer.add(game.id, teams[0].id, 4, 4)
+
+        buffer.flush_on_exit()
+
+        assert Score.query.filter_by(game_id=game.id).first().points == 4
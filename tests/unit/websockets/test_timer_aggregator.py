@@ -2,7 +2,7 @@
 import pytest
 from datetime import date
 from app import create_app, db
-from app.websockets.timer_aggregator import TimerAggregator
+from app.websockets.timer_aggregator import TimerAggregator, TimerStats
 from app.models.timer_record import TimerRecord
 from app.models.score import Score
 from app.models.game import Game
@@ -202,3 +202,212 @@ class TestTimerAggregator:
         assert len(active_game2) == 1
         assert active_game1[0]['user_id'] == 'user1'
         assert active_game2[0]['user_id'] == 'user2'
+
+
+class TestTimerStats:
+    """Test running timer statistics."""
+
+    def test_running_aggregates(self):
+        """Test count, sum, min, max and mean track added values."""
+        stats = TimerStats()
+        for value in (12.0, 10.0, 11.0):
+            stats.add(value)
+
+        assert stats.to_dict() == {
+            'times': [12.0, 10.0, 11.0], 'count': 3, 'sum': 33.0,
+            'min': 10.0, 'max': 12.0, 'mean': 11.0, 'trimmed_mean': 11.0
+        }
+
+    def test_trimmed_mean_rejects_outliers(self):
+        """Test a forgotten timer doesn't skew the trimmed mean."""
+        stats = TimerStats(trim_fraction=0.1)
+        for value in (10.0, 10.5, 9.5, 10.0, 10.0, 10.5, 9.5, 10.0, 10.0, 95.0):
+            stats.add(value)
+
+        assert stats.mean > 18
+        assert stats.trimmed_mean == pytest.approx(10.0625)
+
+
+class TestTimerAggregatorStats:
+    """Test in-memory stats and batched score writes."""
+
+    def test_stats_seeded_once_and_updated_in_memory(self, app, aggregator, sample_data):
+        """Test existing records seed the stats and later stops are added without double counting."""
+        with app.app_context():
+            game_id, team_id = sample_data['game_id'], sample_data['team_id']
+            aggregator.record_time(game_id, team_id, 'user1', 'User One', 10.0)
+
+            assert aggregator.get_team_stats(game_id, team_id)['count'] == 1
+
+            aggregator.record_time(game_id, team_id, 'user2', 'User Two', 14.0)
+            stats = aggregator.get_team_stats(game_id, team_id)
+
+            assert stats['count'] == 2
+            assert stats['mean'] == 12.0
+            assert stats['times'] == [10.0, 14.0]
+
+    def test_flush_writes_timer_average_to_score(self, app, aggregator, sample_data):
+        """Test changed stats are persisted to the team's existing Score in one batch."""
+        with app.app_context():
+            game_id, team_id = sample_data['game_id'], sample_data['team_id']
+            db.session.add(Score(game_id=game_id, team_id=team_id, points=3))
+            db.session.commit()
+            aggregator.record_time(game_id, team_id, 'user1', 'User One', 10.0)
+            aggregator.record_time(game_id, team_id, 'user2', 'User Two', 12.0)
+
+            assert aggregator.flush() == 1
+            assert aggregator.flush() == 0
+
+            score = Score.query.filter_by(game_id=game_id, team_id=team_id).first()
+            db.session.refresh(score)
+            assert score.multi_timer_avg == 11.0
+            assert score.timer_count == 2
+            assert score.points == 3
+
+    def test_flush_does_not_create_scores(self, app, aggregator, sample_data):
+        """Test timer stats of a team without a saved score never add a Score row."""
+        with app.app_context():
+            game_id, team_id = sample_data['game_id'], sample_data['team_id']
+            aggregator.record_time(game_id, team_id, 'user1', 'User One', 10.0)
+
+            assert aggregator.flush() == 0
+            assert Score.query.filter_by(game_id=game_id, team_id=team_id).count() == 0
+            assert aggregator.get_team_stats(game_id, team_id)['count'] == 1
+
+    def test_flush_keeps_own_stats_cached(self, app, aggregator, sample_data):
+        """Test a worker's own flush doesn't drop its freshly recomputed stats."""
+        with app.app_context():
+            game_id, team_id = sample_data['game_id'], sample_data['team_id']
+            aggregator.init_app(app, None)
+            aggregator.record_time(game_id, team_id, 'user1', 'User One', 10.0)
+            aggregator.flush()
+
+            assert (game_id, team_id) in aggregator.stats
+            aggregator.record_time(game_id, team_id, 'user2', 'User Two', 14.0)
+            assert aggregator.get_team_stats(game_id, team_id)['times'] == [10.0, 14.0]
+            aggregator.flush()
+
+    def test_clear_resets_stats(self, app, aggregator, sample_data):
+        """Test clearing timers empties the stats and the persisted count."""
+        with app.app_context():
+            game_id, team_id = sample_data['game_id'], sample_data['team_id']
+            db.session.add(Score(game_id=game_id, team_id=team_id, points=0))
+            db.session.commit()
+            aggregator.record_time(game_id, team_id, 'user1', 'User One', 10.0)
+            aggregator.flush()
+
+            aggregator.clear_team_timers(game_id, team_id)
+            aggregator.flush()
+
+            assert aggregator.get_team_stats(game_id, team_id)['count'] == 0
+            score = Score.query.filter_by(game_id=game_id, team_id=team_id).first()
+            assert score.timer_count == 0
+            assert score.multi_timer_avg is None
+
+
+    def test_flush_counts_stops_from_other_workers(self, app, sample_data):
+        """Test each worker's flush writes the totals of every worker's records."""
+        first, second = TimerAggregator(), TimerAggregator()
+        with app.app_context():
+            game_id, team_id = sample_data['game_id'], sample_data['team_id']
+            db.session.add(Score(game_id=game_id, team_id=team_id, points=0))
+            db.session.commit()
+            first.record_time(game_id, team_id, 'u1', 'U1', 10.0)
+            second.record_time(game_id, team_id, 'u2', 'U2', 20.0)
+            second.flush()
+
+            first.record_time(game_id, team_id, 'u3', 'U3', 30.0)
+            first.flush()
+
+            score = Score.query.filter_by(game_id=game_id, team_id=team_id).first()
+            assert score.timer_count == 3
+            assert score.multi_timer_avg == 20.0
+
+    def test_other_workers_flush_reloads_cached_stats(self, app, sample_data, monkeypatch):
+        """Test cached stats are dropped when another worker writes the game's stats."""
+        from app.utils.invalidation import invalidation_bus
+
+        # Deliver published events to this process, as polling would in another worker
+        monkeypatch.setattr(
+            invalidation_bus.backend, 'publish',
+            lambda origin, topic, key: invalidation_bus._dispatch(topic, key)
+        )
+        first, second = TimerAggregator(), TimerAggregator()
+        with app.app_context():
+            game_id, team_id = sample_data['game_id'], sample_data['team_id']
+            first.init_app(app, None)
+            first.record_time(game_id, team_id, 'u1', 'U1', 10.0)
+            assert first.get_team_stats(game_id, team_id)['count'] == 1
+
+            second.record_time(game_id, team_id, 'u2', 'U2', 20.0)
+            second.flush()
+
+            assert sorted(first.get_team_stats(game_id, team_id)['times']) == [10.0, 20.0]
+            first.flush()
+
+
+class TestTimerConsensus:
+    """Test per-game estimators and skew correction."""
+
+    def test_game_estimator_selects_consensus(self, app, aggregator, sample_data):
+        """Test the game's timer_estimator decides the official time."""
+        with app.app_context():
+            game_id, team_id = sample_data['game_id'], sample_data['team_id']
+            Game.query.get(game_id).timer_estimator = 'median'
+            db.session.commit()
+            for user, value in (('u1', 10.0), ('u2', 10.2), ('u3', 30.0)):
+                aggregator.record_time(game_id, team_id, user, user, value)
+
+            consensus = aggregator.get_team_stats(game_id, team_id)['consensus']
+
+            assert consensus['estimator'] == 'median'
+            assert consensus['value'] == 10.2
+            assert aggregator.calculate_average(game_id, team_id) == 10.2
+
+    def test_estimator_reloaded_after_game_edit(self, app, aggregator, sample_data):
+        """Test editing a game drops the cached estimator."""
+        from app.services.game_service import GAME_TOPIC
+        from app.utils.invalidation import invalidation_bus
+
+        with app.app_context():
+            game_id, team_id = sample_data['game_id'], sample_data['team_id']
+            aggregator.init_app(app, None)
+            aggregator.record_time(game_id, team_id, 'u1', 'U1', 10.0)
+            assert aggregator.get_team_stats(game_id, team_id)['consensus']['estimator'] == 'trimmed_mean'
+
+            Game.query.get(game_id).timer_estimator = 'mad_mean'
+            db.session.commit()
+            invalidation_bus.publish(GAME_TOPIC, game_id)
+
+            assert aggregator.get_team_stats(game_id, team_id)['consensus']['estimator'] == 'mad_mean'
+            aggregator.queue.flush()
+            aggregator.flush()
+
+    def test_skewed_time_replaced_by_server_measurement(self, app, sample_data):
+        """Test a stalled stopwatch is corrected from start/stop arrival times."""
+        aggregator = TimerAggregator(skew_correction=True, max_skew=1.0)
+        with app.app_context():
+            game_id, team_id = sample_data['game_id'], sample_data['team_id']
+            aggregator.start_timer(game_id, team_id, 'u1', 'U1', latency=0.05)
+            aggregator.start_timer(game_id, team_id, 'u2', 'U2', latency=0.05)
+
+            stalled = aggregator.record_time(game_id, team_id, 'u1', 'U1', 25.0, latency=0.05)
+            honest = aggregator.record_time(game_id, team_id, 'u2', 'U2', 0.5, latency=0.05)
+
+            assert stalled.time_value < 1.0
+            assert honest.time_value == 0.5
+
+    @pytest.mark.parametrize('latency', ['fast', float('nan'), -3, 1e9, [1]])
+    def test_bad_latency_is_ignored_or_clamped(self, app, sample_data, latency):
+        """Test a malformed or absurd client latency never breaks the handler."""
+        aggregator = TimerAggregator(skew_correction=True, max_skew=1.0)
+        with app.app_context():
+            game_id, team_id = sample_data['game_id'], sample_data['team_id']
+            aggregator.start_timer(game_id, team_id, 'u1', 'U1', latency=latency)
+            timer = aggregator.active_timers[(game_id, team_id, 'u1')]
+            assert 0 <= (timer['start_time'] - timer['started_at']).total_seconds() <= 5.0
+
+            record = aggregator.record_time(game_id, team_id, 'u1', 'U1', 0.2, latency=latency)
+
+            assert record.time_value == 0.2
+            aggregator.queue.flush()
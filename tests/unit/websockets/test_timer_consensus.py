@@ -0,0 +1,79 @@
+"""Unit tests for multi-timer consensus estimators."""
+import pytest
+from app.websockets import timer_consensus
+
+
+def estimate(values, estimator, **kwargs):
+    values = sorted(values)
+    return timer_consensus.estimate(values, sum(values), estimator, **kwargs)
+
+
+class TestEstimators:
+    """Test each estimator on a run with one forgotten timer."""
+
+    TIMES = [10.0, 10.2, 9.8, 10.1, 9.9, 10.0, 10.3, 9.7, 10.0, 10.0, 42.0]
+
+    def test_mean_is_skewed_by_outlier(self):
+        """Test the plain mean follows the outlier."""
+        assert estimate(self.TIMES, 'mean')['value'] == pytest.approx(142.0 / 11)
+
+    def test_median(self):
+        """Test the median ignores the outlier."""
+        assert estimate(self.TIMES, 'median')['value'] == 10.0
+        assert estimate([9.0, 10.0, 11.0, 12.0], 'median')['value'] == 10.5
+
+    def test_trimmed_mean(self):
+        """Test the fastest and slowest values are dropped."""
+        result = estimate(self.TIMES, 'trimmed_mean', trim_fraction=0.1)
+
+        assert result['value'] == pytest.approx((142.0 - 9.7 - 42.0) / 9)
+        assert result['used'] == 9
+
+    def test_mad_mean_drops_only_outliers(self):
+        """Test the MAD filter keeps every timer but the forgotten one."""
+        result = estimate(self.TIMES, 'mad_mean')
+
+        assert result['value'] == pytest.approx(100.0 / 10)
+        assert result['used'] == 10
+
+    def test_mad_mean_with_identical_times(self):
+        """Test a zero MAD keeps all values."""
+        assert estimate([5.0, 5.0, 5.0], 'mad_mean')['value'] == 5.0
+
+    def test_unknown_estimator(self):
+        """Test an unknown estimator is rejected."""
+        with pytest.raises(ValueError):
+            estimate([1.0], 'mode')
+
+    def test_no_values(self):
+        """Test no timers give no consensus."""
+        assert estimate([], 'median') is None
+
+
+class TestConfidence:
+    """Test the agreement-based confidence."""
+
+    def test_agreeing_timers_raise_confidence(self):
+        """Test confidence grows with the number of agreeing timers."""
+        one = estimate([10.0], 'median')['confidence']
+        three = estimate([10.0, 10.1, 9.9], 'median')['confidence']
+
+        assert one == 0.5
+        assert three == 0.75
+
+    def test_disagreeing_timers_lower_confidence(self):
+        """Test timers far from the consensus don't count as agreeing."""
+        result = estimate([10.0, 10.1, 14.0, 18.0], 'median', tolerance=0.5)
+
+        assert result['confidence'] == 0.0
+
+
+class TestAbsoluteDeviations:
+    """Test the merge-based deviation ordering."""
+
+    def test_matches_sorted_deviations(self):
+        """Test the merge gives the same order as sorting."""
+        values = sorted([3.0, 7.5, 1.0, 9.0, 4.0, 4.5, 12.0])
+        center = 4.5
+
+        assert timer_consensus.absolute_deviations(values, center) == sorted(abs(v - center) for v in values)
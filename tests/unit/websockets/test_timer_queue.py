@@ -0,0 +1,127 @@
+"""Unit tests for the timer record ingestion queue."""
+from datetime import datetime
+from sqlalchemy.exc import OperationalError
+from app import db
+from app.models.timer_record import TimerRecord
+from app.websockets.timer_queue import TimerRecordQueue
+
+
+class FakeSocketIO:
+    """Records background tasks instead of running them."""
+
+    def __init__(self):
+        self.tasks = []
+
+    def start_background_task(self, target, *args):
+        self.tasks.append((target, args))
+
+    def sleep(self, seconds):
+        pass
+
+
+def make_row(game_id, team_id, user_id, time_value):
+    return {
+        'game_id': game_id, 'team_id': team_id, 'user_id': user_id, 'user_display_name': user_id,
+        'time_value': time_value, 'recorded_at': datetime.utcnow(), 'is_active': True
+    }
+
+
+class TestTimerRecordQueue:
+    """Test queuing and bulk writing timer records."""
+
+    def test_flush_writes_batch(self, app, db_session, game, teams):
+        """Test queued rows are inserted together."""
+        queue = TimerRecordQueue()
+        queue.put(make_row(game.id, teams[0].id, 'u1', 10.0))
+        queue.put(make_row(game.id, teams[0].id, 'u2', 11.0))
+
+        assert TimerRecord.query.count() == 0
+        assert queue.flush() == 2
+        assert sorted(r.time_value for r in TimerRecord.query.all()) == [10.0, 11.0]
+        assert queue.metrics()['batches'] == 1
+        assert queue.metrics()['depth'] == 0
+
+    def test_first_put_schedules_one_delayed_flush(self, app, db_session, game, teams):
+        """Test a burst of stops shares one background flush."""
+        queue = TimerRecordQueue()
+        socketio = FakeSocketIO()
+        queue.init_app(app, socketio)
+
+        for user in ('u1', 'u2', 'u3'):
+            queue.put(make_row(game.id, teams[0].id, user, 10.0))
+
+        assert len(socketio.tasks) == 1
+        target, _ = socketio.tasks[0]
+        target()
+        assert TimerRecord.query.count() == 3
+        assert len(queue) == 0
+
+    def test_full_queue_writes_backlog_inline(self, app, db_session, game, teams):
+        """Test the bound: the producer that fills the queue writes it."""
+        queue = TimerRecordQueue(max_size=3)
+
+        for user in ('u1', 'u2', 'u3'):
+            queue.put(make_row(game.id, teams[0].id, user, 10.0))
+
+        assert len(queue) == 0
+        assert TimerRecord.query.count() == 3
+        assert queue.metrics()['forced_flushes'] == 1
+        assert queue.metrics()['max_depth'] == 3
+
+    def test_bad_row_is_dropped_and_the_rest_written(self, app, db_session, game, teams):
+        """Test a row that can never be written does not block the others."""
+        queue = TimerRecordQueue()
+        queue.put(make_row(game.id, teams[0].id, 'u1', 10.0))
+        queue.put(make_row(game.id, teams[0].id, None, 11.0))  # user_id is NOT NULL
+        queue.put(make_row(game.id, 9999, 'u3', 12.0))  # Unknown team
+        queue.put(make_row(game.id, teams[1].id, 'u4', 13.0))
+
+        assert queue.flush() == 2
+        assert len(queue) == 0
+        assert sorted(r.time_value for r in TimerRecord.query.all()) == [10.0, 13.0]
+        assert queue.metrics()['failed_batches'] == 1
+        assert queue.metrics()['dropped'] == 2
+
+    def test_transient_failure_keeps_batch_and_reschedules(self, app, db_session, game, teams, monkeypatch):
+        """Test rows survive a locked database and a delayed flush retries them."""
+        queue = TimerRecordQueue()
+        queue.socketio = FakeSocketIO()
+        queue.app = app
+        queue.put(make_row(game.id, teams[0].id, 'u1', 10.0))
+        queue.socketio.tasks.clear()
+        queue.scheduled = False
+
+        def locked(*args, **kwargs):
+            raise OperationalError('INSERT INTO timer_record', {}, Exception('database is locked'))
+
+        with monkeypatch.context() as patch:
+            patch.setattr(db.session, 'execute', locked)
+            assert queue.flush() == 0
+
+        assert len(queue) == 1
+        assert queue.metrics()['failed_batches'] == 1
+        target, _ = queue.socketio.tasks[0]
+        target()
+        assert TimerRecord.query.count() == 1
+
+    def test_pending_and_deactivate(self, app, db_session):
+        """Test reading and clearing one team's queued rows."""
+        queue = TimerRecordQueue()
+        queue.put(make_row(1, 1, 'u1', 10.0))
+        queue.put(make_row(1, 2, 'u2', 11.0))
+
+        assert [row['user_id'] for row in queue.pending(1, 2)] == ['u2']
+        assert queue.deactivate(1, 2) == 1
+        assert queue.pending(1, 2)[0]['is_active'] is False
+
+    def test_sigterm_flushes_then_chains(self, app, db_session, game, teams):
+        """Test SIGTERM writes queued rows before the previous handler runs."""
+        queue = TimerRecordQueue()
+        queue.app = app
+        calls = []
+        queue._previous_sigterm = lambda signum, frame: calls.append(TimerRecord.query.count())
+        queue.put(make_row(game.id, teams[0].id, 'u1', 10.0))
+
+        queue._handle_sigterm(15, None)
+
+        assert calls == [1]
@@ -18,6 +18,7 @@ module.exports = (env, argv) => {
       tournament: './app/static/js/tournament.js',
       playground: './app/static/js/playground.js',
       'team-form': './app/static/js/team-form.js',
+      'leaderboard-live': './app/static/js/leaderboard-live.js',
 
       // Shared utilities
       'modal-utils': './app/static/js/modal-utils.js',